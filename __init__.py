@@ -1,4 +1,16 @@
-from .match import Match
+import importlib
+
 from . import abbr
-from . import cli
-from . import stats
+
+__all__ = ['Match', 'abbr', 'cli', 'stats']
+
+def __getattr__(name):
+    if name == 'Match':
+        from .match import Match
+        return Match
+    try:
+        return importlib.import_module(f'.{name}', __name__)
+    except ModuleNotFoundError as e:
+        if e.name != f'{__name__}.{name}':
+            raise
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
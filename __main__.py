@@ -5,9 +5,8 @@ import pathlib
 import json
 import traceback
 import multiprocessing
-
-from . import *
-from . import untar
+import concurrent.futures
+import contextlib
 
 arg_parser = argparse.ArgumentParser()
 arg_parser.add_argument('--seed')
@@ -15,12 +14,30 @@ arg_parser.add_argument('--replay')
 arg_parser.add_argument('--quit-after-replay', action='store_true')
 arg_parser.add_argument('--quiet', action='store_true')
 arg_parser.add_argument('--replay-out')
+arg_parser.add_argument('--replay-hashes', action='store_true')
 arg_parser.add_argument('--log')
+arg_parser.add_argument('--replay-stream')
+arg_parser.add_argument('--log-stream')
 arg_parser.add_argument('--state')
 arg_parser.add_argument('--players', nargs='*')
 arg_parser.add_argument('--stats')
 arg_parser.add_argument('--replays')
+arg_parser.add_argument('--profile-events')
+arg_parser.add_argument('--verify', action='store_true')
+arg_parser.add_argument('--check-card-views', action='store_true')
+arg_parser.add_argument('--threads', type=int)
 args = arg_parser.parse_args()
+if args.threads is not None and args.threads < 1:
+    arg_parser.error('--threads must be at least 1')
+
+# The card modules are only loaded once the arguments are known to be valid.
+
+from .match import Match
+from . import cli
+from . import stats
+from . import untar
+from . import utils
+from . import profiler
 
 seed = args.seed
 
@@ -38,15 +55,28 @@ if replay is None and args.replays is None:
 
 quit_after_replay = args.quit_after_replay
 verbose = not args.quiet
+checkpoints = args.replays is None
 
 stats_collectors = []
+event_profilers = []
 
-def run_match(replay):
+def open_stream(path):
+    if path is None:
+        return contextlib.nullcontext()
+    stream_path = pathlib.Path(path)
+    os.makedirs(stream_path.parent, exist_ok=True)
+    return utils.LineSink(open(stream_path, 'w'))
+
+def run_match(replay, replay_sink=None, log_sink=None):
     stats_collector = None
     if args.stats is not None:
         stats_collector = stats.Stats()
 
-    interface = cli.NationsCLI(player_names=player_names, seed=seed, replay=replay, quit_after_replay=quit_after_replay, verbose=verbose, stats=stats_collector)
+    event_profiler = None
+    if args.profile_events is not None:
+        event_profiler = profiler.EventProfiler()
+
+    interface = cli.NationsCLI(player_names=player_names, seed=seed, replay=replay, quit_after_replay=quit_after_replay, verbose=verbose, stats=stats_collector, checkpoints=checkpoints, round_hashes=args.replay_hashes, replay_sink=replay_sink, log_sink=log_sink, event_profiler=event_profiler, check_card_views=args.check_card_views)
 
     try:
         interface.play()
@@ -55,14 +85,56 @@ def run_match(replay):
 
     return (interface, stats_collector)
 
+def map_replays(function, replays):
+    if args.threads is not None:
+        with concurrent.futures.ThreadPoolExecutor(args.threads) as executor:
+            return list(executor.map(function, replays))
+    with multiprocessing.Pool() as pool:
+        return pool.map(function, replays, 1)
+
+def verify_match(replay):
+    try:
+        return Match(replay=replay, mode='verify', check_card_views=args.check_card_views).verify()
+    except Exception as e:
+        return {'passed': False, 'error': traceback.format_exc()}
+
+def report_verification(name, verification):
+    if 'error' in verification:
+        print(f'{name}: FAIL')
+        print(verification['error'], end='')
+        return
+    scores = ', '.join(f'{player_name} {score}' for (player_name, score) in verification['scores'].items())
+    if verification['passed']:
+        print(f'{name}: PASS - {scores}')
+    elif verification['divergence'] is not None:
+        print(f'{name}: FAIL - {verification["divergence"]}')
+    elif verification['invalid_move'] is not None:
+        print(f'{name}: FAIL - move {verification["moves"] + 1}: {verification["invalid_move"]}')
+    else:
+        print(f'{name}: FAIL - replay ends after move {verification["moves"]} before the game is over')
+
+if args.verify:
+    if args.replays is not None:
+        replays = untar.extract_replays(args.replays)
+        verifications = map_replays(verify_match, replays)
+        for (i, verification) in enumerate(verifications):
+            report_verification(f'Replay {i + 1}', verification)
+    elif replay is not None:
+        verifications = [verify_match(replay)]
+        report_verification(args.replay, verifications[0])
+    else:
+        arg_parser.error('--verify requires --replay or --replays')
+    sys.exit(0 if all(verification['passed'] for verification in verifications) else 1)
+
 if replay is not None or args.replays is None:
-    (interface, stats_collector) = run_match(replay)
+    with open_stream(args.replay_stream) as replay_sink, open_stream(args.log_stream) as log_sink:
+        (interface, stats_collector) = run_match(replay, replay_sink, log_sink)
 
     if args.replay_out is not None:
         replay_out_path = pathlib.Path(args.replay_out)
         os.makedirs(replay_out_path.parent, exist_ok=True)
         with open(replay_out_path, 'w') as replay_out_file:
-            replay_out_file.write(interface.get_replay())
+            replay_out_file.write(interface.get_replay(hashes=args.replay_hashes))
 
     if args.log is not None:
         log_path = pathlib.Path(args.log)
@@ -79,10 +151,25 @@ if replay is not None or args.replays is None:
     if args.stats is not None:
         stats_collectors.append(stats_collector)
 
+    if args.profile_events is not None:
+        event_profilers.append(interface.match.event_profiler)
+
 if args.replays is not None:
     replays = untar.extract_replays(args.replays)
-    with multiprocessing.Pool() as pool:
-        retvals = pool.map(run_match, replays, 1)
+    retvals = map_replays(run_match, replays)
+    if args.profile_events is not None:
+        for (interface, stats_collector) in retvals:
+            event_profilers.append(interface.match.event_profiler)
+
+if args.profile_events is not None:
+    total_event_profiler = profiler.EventProfiler(event_profilers)
+    if args.profile_events == '-':
+        total_event_profiler.report(sys.stdout)
+    else:
+        profile_events_path = pathlib.Path(args.profile_events)
+        os.makedirs(profile_events_path.parent, exist_ok=True)
+        with open(profile_events_path, 'w') as profile_events_file:
+            total_event_profiler.report(profile_events_file)
 
 if args.stats is not None:
     for (interface, stats_collector) in retvals:
@@ -1,5 +1,3 @@
-from .event_cards import event_card_abbrs
-from .nations import nation_card_abbrs
-from .progress_cards import progress_card_abbrs, extension_card_abbrs
+from . import registry
 
-abbrs = {**event_card_abbrs, **nation_card_abbrs, **progress_card_abbrs, **extension_card_abbrs}
+abbrs = registry.names()
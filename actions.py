@@ -14,9 +14,11 @@ class ActionType(enum.Enum):
     RESIGN = enum.auto()
 
 class Action:
-    pass
+    __slots__ = ()
 
 class BuyAction(Action):
+    __slots__ = ('player', 'row', 'col', 'card')
+
     action_type = ActionType.BUY
 
     def __init__(self, row, col, card, player=None):
@@ -31,6 +33,8 @@ class BuyAction(Action):
         return f'Buy P{self.row + 1}{self.col + 1}'
 
 class DeployAction(Action):
+    __slots__ = ('slot', 'card')
+
     action_type = ActionType.DEPLOY
 
     def __init__(self, slot, card):
@@ -41,6 +45,8 @@ class DeployAction(Action):
         return f'Deploy to {self.slot}'
 
 class HireAction(Action):
+    __slots__ = ('card', 'private')
+
     action_type = ActionType.HIRE
 
     def __init__(self, card, private=None):
@@ -53,6 +59,8 @@ class HireAction(Action):
         return 'Hire'
 
 class SpecialAction(Action):
+    __slots__ = ('card',)
+
     action_type = ActionType.SPECIAL
 
     def __init__(self, card):
@@ -62,12 +70,16 @@ class SpecialAction(Action):
         return f'Special of "{self.card}"'
 
 class TurmoilAction(Action):
+    __slots__ = ()
+
     action_type = ActionType.TURMOIL
 
     def __str__(self):
         return 'Turmoil'
 
 class ExploreAction(Action):
+    __slots__ = ('card',)
+
     action_type = ActionType.EXPLORE
 
     def __init__(self, card):
@@ -77,6 +89,8 @@ class ExploreAction(Action):
         return 'Explore'
 
 class UndeployAction(Action):
+    __slots__ = ('slot', 'card')
+
     action_type = ActionType.UNDEPLOY
 
     def __init__(self, slot, card):
@@ -87,24 +101,32 @@ class UndeployAction(Action):
         return f'Undeploy from {self.slot}'
 
 class PassAction(Action):
+    __slots__ = ()
+
     action_type = ActionType.PASS
 
     def __str__(self):
         return 'Pass'
 
 class ConfirmAction(Action):
+    __slots__ = ()
+
     action_type = ActionType.CONFIRM
 
     def __str__(self):
         return 'Confirm'
 
 class ConfirmCompleteAction(Action):
+    __slots__ = ()
+
     action_type = ActionType.CONFIRM_AND_COMPLETE_TURN
 
     def __str__(self):
         return 'Confirm and complete the turn now'
 
 class ResignAction(Action):
+    __slots__ = ()
+
     action_type = ActionType.RESIGN
 
     def __str__(self):
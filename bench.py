@@ -0,0 +1,322 @@
+import argparse
+import collections
+import concurrent.futures
+import gc
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+from .match import Match
+from .exceptions import Paused, Diverged
+from . import untar
+
+def time_replays(replays, **kwargs):
+    start = time.perf_counter()
+    for replay in replays:
+        match = Match(replay=replay, **kwargs)
+        if match.mode == 'verify':
+            match.verify()
+        else:
+            match.play()
+    return time.perf_counter() - start
+
+def best_of(repeat, configurations, run):
+    results = {name: None for name in configurations}
+    for i in range(repeat):
+        for (name, kwargs) in configurations.items():
+            seconds = run(**kwargs)
+            if results[name] is None or seconds < results[name]:
+                results[name] = seconds
+    return results
+
+def bench_verify(args):
+    replays = untar.extract_replays(args.replays)
+    configurations = {
+        'play': {'checkpoints': False},
+        'verify': {'mode': 'verify'},
+    }
+    results = best_of(args.repeat, configurations, lambda **kwargs: time_replays(replays, **kwargs))
+    for (name, seconds) in results.items():
+        print(f'{name:10} {seconds:8.3f} s  {1000 * seconds / len(replays):8.2f} ms/replay')
+    print(f'speedup    {results["play"] / results["verify"]:8.2f}x')
+
+def bench_replay(args):
+    replays = untar.extract_replays(args.replays)
+    results = best_of(args.repeat, {'replay': {'checkpoints': False}}, lambda **kwargs: time_replays(replays, **kwargs))
+    for (name, seconds) in results.items():
+        print(f'{name:10} {seconds:8.3f} s  {1000 * seconds / len(replays):8.2f} ms/replay')
+
+def bench_production(args):
+    replays = untar.extract_replays(args.replays)
+    matches = []
+    for replay in replays:
+        match = Match(replay=replay, checkpoints=False)
+        match.play()
+        matches.append(match)
+    def run():
+        start = time.perf_counter()
+        for i in range(args.iterations):
+            for match in matches:
+                for player in match.players:
+                    player.production(projected=True)
+        return time.perf_counter() - start
+    results = best_of(args.repeat, {'production': {}}, run)
+    phases = args.iterations * len(matches)
+    for (name, seconds) in results.items():
+        print(f'{name:10} {seconds:8.3f} s  {1000000 * seconds / phases:8.2f} us/production phase')
+
+def bench_memory(args):
+    replays = untar.extract_replays(args.replays)
+    configurations = {
+        'state': {'checkpoints': False},
+        'checkpoints': {},
+    }
+    for (name, kwargs) in configurations.items():
+        gc.collect()
+        tracemalloc.start()
+        matches = []
+        for replay in replays:
+            match = Match(replay=replay, **kwargs)
+            match.play()
+            matches.append(match)
+        gc.collect()
+        (current, peak) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f'{name:12} {current / len(matches):10.0f} bytes/match')
+        del matches
+
+def player_count(replay):
+    header = replay.replace('\r', '').split('\n\n')[0]
+    return len([line for line in header.split('\n') if line.startswith('player ')])
+
+def time_states(replay, from_round):
+    match = Match(replay=replay, checkpoints=False)
+    moves = list(match.move_list)
+    match.move_list.clear()
+    seconds = 0
+    states = 0
+    def move_getter(choice, options, undo_allowed):
+        nonlocal seconds, states
+        if match.round_number >= from_round:
+            start = time.perf_counter()
+            match.get_state()
+            seconds += time.perf_counter() - start
+            states += 1
+        move = moves[match.move_number]
+        for option in options:
+            if str(option) == move:
+                return option
+        return move
+    match.move_getter = move_getter
+    match.play()
+    return (seconds, states)
+
+def bench_state(args):
+    replays = [replay for replay in untar.extract_replays(args.replays) if player_count(replay) == args.players]
+    if not replays:
+        print(f'No {args.players}-player replays.')
+        return
+    def run():
+        results = [time_states(replay, args.from_round) for replay in replays]
+        return (sum(seconds for (seconds, states) in results), sum(states for (seconds, states) in results))
+    states = run()[1]
+    results = best_of(args.repeat, {'state': {}}, lambda: run()[0])
+    for (name, seconds) in results.items():
+        print(f'{name:10} {seconds:8.3f} s  {1000000 * seconds / states:8.2f} us/state  ({states} states from round {args.from_round} of {len(replays)} {args.players}-player replays)')
+
+def decision_points(replay, every):
+    match = Match(replay=replay, checkpoints=False)
+    moves = list(match.move_list)
+    for move_number in range(0, len(moves) - 1, every):
+        match = Match(replay=replay)
+        match.move_list = collections.deque(moves[:move_number])
+        match.move_getter = match.pause
+        try:
+            match.play()
+        except Paused:
+            pass
+        yield (match, moves[move_number])
+
+def time_fork(match, move):
+    def move_getter(choice, options, undo_allowed):
+        fork.move_getter = fork.pause
+        for option in options:
+            if str(option) == move:
+                return option
+        return move
+    start = time.perf_counter()
+    fork = match.fork(move_getter=move_getter)
+    forked = time.perf_counter()
+    try:
+        fork.play()
+    except Paused:
+        pass
+    return (forked - start, time.perf_counter() - forked)
+
+def bench_fork(args):
+    replays = untar.extract_replays(args.replays)
+    results = {}
+    for replay in replays:
+        for (match, move) in decision_points(replay, args.every):
+            kind = 'main action' if match.resumable else 'other'
+            first = time_fork(match, move)
+            repeat = min((time_fork(match, move) for i in range(args.repeat)), key=sum)
+            results.setdefault(kind, []).append((*first, *repeat))
+    for (kind, timings) in sorted(results.items()):
+        (first_fork, first_resume, fork, resume) = (1000 * sum(timing[i] for timing in timings) / len(timings) for i in range(4))
+        print(f'{kind:12} {len(timings):5} forks  first fork {first_fork:6.2f} ms  fork {fork:6.2f} ms  resume {resume:6.2f} ms  fork + resume {fork + resume:6.2f} ms')
+
+def verify_replay(replay):
+    return Match(replay=replay, mode='verify').verify()
+
+def time_processes(replays, workers):
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers) as pool:
+        pool.map(verify_replay, replays, 1)
+    return time.perf_counter() - start
+
+def time_threads(replays, workers):
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+        list(executor.map(verify_replay, replays))
+    return time.perf_counter() - start
+
+def bench_parallel(args):
+    replays = untar.extract_replays(args.replays)
+    workers = args.workers or os.cpu_count()
+    configurations = {
+        'serial': {'run': lambda: time_replays(replays, mode='verify')},
+        'processes': {'run': lambda: time_processes(replays, workers)},
+        'threads': {'run': lambda: time_threads(replays, workers)},
+    }
+    results = best_of(args.repeat, configurations, lambda run: run())
+    for (name, seconds) in results.items():
+        print(f'{name:10} {seconds:8.3f} s  {1000 * seconds / len(replays):8.2f} ms/replay')
+    print(f'({workers} workers)')
+
+def final_state(match):
+    return json.dumps(match.get_state(), sort_keys=True)
+
+def solo_state(replay):
+    match = Match(replay=replay, checkpoints=False)
+    match.play()
+    return final_state(match)
+
+def interleaved_states(replays):
+    turn = threading.Condition()
+    running = list(range(len(replays)))
+    current = 0
+    states = [None] * len(replays)
+    def pass_turn(i, finished=False):
+        nonlocal current
+        k = running.index(i)
+        if finished:
+            running.pop(k)
+        else:
+            k += 1
+        if running:
+            current = running[k % len(running)]
+        turn.notify_all()
+    def run(i):
+        match = Match(replay=replays[i], checkpoints=False)
+        moves = list(match.move_list)
+        match.move_list.clear()
+        def move_getter(choice, options, undo_allowed):
+            with turn:
+                pass_turn(i)
+                turn.wait_for(lambda: current == i)
+            if match.move_number < len(moves):
+                move = moves[match.move_number]
+                for option in options:
+                    if str(option) == move:
+                        return option
+            raise Diverged(f'No recorded move matches the options at move {match.move_number + 1}.')
+        match.move_getter = move_getter
+        with turn:
+            turn.wait_for(lambda: current == i)
+        try:
+            match.play()
+        finally:
+            with turn:
+                pass_turn(i, finished=True)
+        states[i] = final_state(match)
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(replays))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return states
+
+def bench_interleave(args):
+    replays = untar.extract_replays(args.replays)
+    solo_states = [solo_state(replay) for replay in replays]
+    start = time.perf_counter()
+    states = interleaved_states(replays)
+    seconds = time.perf_counter() - start
+    mismatched = [i for i in range(len(replays)) if states[i] != solo_states[i]]
+    print(f'interleave {seconds:8.3f} s  {len(replays)} replays on {len(replays)} threads, one move at a time')
+    if mismatched:
+        print(f'{len(mismatched)} replays differ from a solo run: {mismatched}')
+        sys.exit(1)
+    print('Every final state matches a solo run.')
+
+def bench_seek(args):
+    replays = untar.extract_replays(args.replays)
+    seeks = []
+    mismatched = []
+    for (i, replay) in enumerate(replays):
+        match = Match(replay=replay)
+        match.play()
+        moves = match.replay_lines[match.replay_header_length:]
+        expected = match.get_replay()
+        def move_getter(choice, options, undo_allowed):
+            if match.move_number < len(moves):
+                move = moves[match.move_number]
+                for option in options:
+                    if str(option) == move:
+                        return option
+            raise Diverged(f'No recorded move matches the options at move {match.move_number + 1}.')
+        for move_number in range(0, len(moves), args.every):
+            start = time.perf_counter()
+            match.seek(move_number)
+            seeks.append(time.perf_counter() - start)
+            match.move_getter = move_getter
+            match.play()
+            if match.get_replay() != expected:
+                mismatched.append(i)
+                break
+    print(f'seek       {1000 * sum(seeks) / len(seeks):8.2f} ms/seek  ({len(seeks)} seeks in {len(replays)} replays, every {args.every} moves)')
+    if mismatched:
+        print(f'{len(mismatched)} replays differ after seeking back and playing the recorded moves again: {mismatched}')
+        sys.exit(1)
+    print('Every replay is unchanged after seeking back and playing the recorded moves again.')
+
+benchmarks = {
+    'replay': bench_replay,
+    'production': bench_production,
+    'verify': bench_verify,
+    'state': bench_state,
+    'memory': bench_memory,
+    'parallel': bench_parallel,
+    'fork': bench_fork,
+    'interleave': bench_interleave,
+    'seek': bench_seek,
+}
+
+arg_parser = argparse.ArgumentParser(prog='python -m nations.bench')
+arg_parser.add_argument('benchmark', choices=benchmarks)
+arg_parser.add_argument('--replays', required=True)
+arg_parser.add_argument('--repeat', type=int, default=3)
+arg_parser.add_argument('--iterations', type=int, default=100)
+arg_parser.add_argument('--players', type=int, default=6)
+arg_parser.add_argument('--from-round', type=int, default=6)
+arg_parser.add_argument('--workers', type=int)
+arg_parser.add_argument('--every', type=int, default=10)
+
+if __name__ == '__main__':
+    args = arg_parser.parse_args()
+    benchmarks[args.benchmark](args)
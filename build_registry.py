@@ -0,0 +1,72 @@
+import argparse
+import hashlib
+import pathlib
+import pprint
+import sys
+
+from . import card_registry
+from .registry import load_module
+
+source_modules = ('cards', 'dynasty_cards', 'progress_cards', 'event_cards', 'nations')
+registry_path = pathlib.Path(__file__).with_name('card_registry.py')
+
+def source_version():
+    digest = hashlib.sha256()
+    for module in source_modules:
+        digest.update(pathlib.Path(__file__).with_name(f'{module}.py').read_bytes())
+    return digest.hexdigest()[:16]
+
+def is_current():
+    return card_registry.version == source_version()
+
+def card_row(card, nation=None):
+    name = card.name
+    progress_card_type = card.progress_card_type.name if hasattr(card, 'progress_card_type') else None
+    return (card.abbr, card.__module__.rpartition('.')[2], card.__name__, name, getattr(card, 'age', None), card.card_type.name, progress_card_type, nation)
+
+def generate():
+    event_cards = load_module('event_cards')
+    progress_cards = load_module('progress_cards')
+    nations = load_module('nations')
+    cards = [card_row(card) for card in event_cards.all_event_cards]
+    for nation in nations.all_nations:
+        for card in (nation.dynasties + nation.advisors + nation.buildings_military + nation.specials + nation.colonies + nation.wonders):
+            if card is not None:
+                cards.append(card_row(card, nation.name))
+    cards.extend(card_row(card) for card in progress_cards.all_progress_cards + progress_cards.all_extension_cards)
+    abbrs = {card[0]: card for card in cards}
+    aliases = {}
+    for (alias, name) in {**nations.nation_card_abbrs, **progress_cards.progress_card_abbrs}.items():
+        if alias not in abbrs:
+            (abbr,) = [card[0] for card in cards if card[3] == name]
+            aliases[alias] = abbr
+    lines = [
+        '# Generated by python -m nations.build_registry from the card modules. Do not edit.',
+        '',
+        f'version = {source_version()!r}',
+        '',
+        'cards = (',
+    ]
+    lines.extend(f'    {card!r},' for card in cards)
+    lines.append(')')
+    lines.append('')
+    lines.append('nations = (')
+    lines.extend(f'    {(nation.name, nation.__module__.rpartition(".")[2], nation.__name__)!r},' for nation in nations.all_nations)
+    lines.append(')')
+    lines.append('')
+    lines.append(f'aliases = {pprint.pformat(aliases)}')
+    return '\n'.join(lines) + '\n'
+
+arg_parser = argparse.ArgumentParser(prog='python -m nations.build_registry')
+arg_parser.add_argument('--check', action='store_true')
+
+if __name__ == '__main__':
+    args = arg_parser.parse_args()
+    if args.check:
+        if not is_current():
+            print('card_registry.py is out of date; run python -m nations.build_registry')
+            sys.exit(1)
+        print(f'card_registry.py is current ({card_registry.version})')
+    else:
+        registry_path.write_text(generate())
+        print(f'Wrote {registry_path} ({source_version()})')
@@ -0,0 +1,538 @@
+# Generated by python -m nations.build_registry from the card modules. Do not edit.
+
+version = '5323118ab7881fba'
+
+cards = (
+    ('AM_CH', 'event_cards', 'AryanMigrationCodeOfHammurabi', 'Aryan Migration; Code of Hammurabi', 1, 'EVENT', None, None),
+    ('AD_JA', 'event_cards', 'AssyrianDeportationsJainAscetism', 'Assyrian deportations; Jain Ascetism', 1, 'EVENT', None, None),
+    ('At_ZR', 'event_cards', 'AttilaZoroastrianRevival', 'Attila; Zoroastrian revival', 1, 'EVENT', None, None),
+    ('BG_Ch', 'event_cards', 'BreadAndGamesChristianity', 'Bread and Games; Christianity', 1, 'EVENT', None, None),
+    ('He_AC', 'event_cards', 'HellenismAshokasConversion', 'Hellenism; Ashokas conversion', 1, 'EVENT', None, None),
+    ('PR_HD', 'event_cards', 'PaxRomanaHandynasty', 'Pax Romana; Han dynasty', 1, 'EVENT', None, None),
+    ('QU_OG', 'event_cards', 'QinUnificationOlympicGames', 'Qin Unification; Olympic games', 1, 'EVENT', None, None),
+    ('Ri_Ex', 'event_cards', 'RigvedaExodus', 'Rigveda; Exodus', 1, 'EVENT', None, None),
+    ('SP_BAC', 'event_cards', 'SeaPeoplesBronzeAgeCollapse', 'Sea Peoples; Bronze Age Collapse', 1, 'EVENT', None, None),
+    ('SOB_IC', 'event_cards', 'ShangOracleBonesIonianColonisation', 'Shang Oracle Bones; Ionian Colonisation', 1, 'EVENT', None, None),
+    ('Ta_Ph', 'event_cards', 'TaoismPhilosophy', 'Taoism; Philosophy', 1, 'EVENT', None, None),
+    ('YTR_SR', 'event_cards', 'YellowTurbanRebellionSpartacusRevolt', 'Yellow Turban Rebellion; Spartacus revolt', 1, 'EVENT', None, None),
+    ('BR_PM', 'event_cards', 'BenedictineRulePaperMoney', 'Benedictine Rule; Paper Money', 2, 'EVENT', None, None),
+    ('BD_HPJ', 'event_cards', 'BlackDeathHuntForPresterJohn', 'Black Death; Hunt for Prester John', 2, 'EVENT', None, None),
+    ('CR_ZR', 'event_cards', 'ChansonDeRolandZanjRevolt', 'Chanson de Roland; Zanj Revolt', 2, 'EVENT', None, None),
+    ('EC_CS', 'event_cards', 'EcologicalCollapseCasteSystem', 'Ecological Collapse; Caste system', 2, 'EVENT', None, None),
+    ('FD_HM', 'event_cards', 'FeudalDuesHajjFromMali', 'Feudal dues; Hajj from Mali', 2, 'EVENT', None, None),
+    ('FC_SR', 'event_cards', 'FourthCrusadeSongResistance', 'Fourth Crusade; Song Resistance', 2, 'EVENT', None, None),
+    ('IE_JC', 'event_cards', 'ImperialExaminationJustinianCode', 'Imperial Examination; Justinian Code', 2, 'EVENT', None, None),
+    ('MA_Sc', 'event_cards', 'MartyrdomOfAliScholasticism', 'Martyrdom of Ali; Scholasticism', 2, 'EVENT', None, None),
+    ('PG_CC', 'event_cards', 'PeaceOfGodCouncilOfClermont', 'Peace of God; Council of Clermont', 2, 'EVENT', None, None),
+    ('RL_Ic', 'event_cards', 'RaidOnLindisfarneIconoclasm', 'Raid on Lindisfarne; Iconoclasm', 2, 'EVENT', None, None),
+    ('SB_HST', 'event_cards', 'SackOfBaghdadHanseaticSaltTrade', 'Sack of Baghdad; Hanseatic Salt Trade', 2, 'EVENT', None, None),
+    ('SM_GS', 'event_cards', 'StuporMundiGreatSchism', 'Stupor Mundi; Great Schism', 2, 'EVENT', None, None),
+    ('AM_SWT', 'event_cards', 'AbsoluteMonarchySalemWitchTrials', 'Absolute Monarchy; Salem Witch Trials', 3, 'EVENT', None, None),
+    ('AST_GR', 'event_cards', 'AfricanSlaveTradeGloriousRevolution', 'African Slave Trade; Glorious revolution', 3, 'EVENT', None, None),
+    ('Bl_HCA', 'event_cards', 'BlackbeardHabeasCorpusAct', 'Blackbeard; Habeas Corpus Act', 3, 'EVENT', None, None),
+    ('CE_EJ', 'event_cards', 'ColumbianExchangeExpulsionOfJews', 'Columbian Exchange; Expulsion of Jews', 3, 'EVENT', None, None),
+    ('CR_Me', 'event_cards', 'CropRotationMercantilism', 'Crop Rotation; Mercantilism', 3, 'EVENT', None, None),
+    ('Ja_CT', 'event_cards', 'JanissariesCouncilOfTrent', 'Janissaries; Council of Trent', 3, 'EVENT', None, None),
+    ('LIA_CUH', 'event_cards', 'LittleIceAgeCityUponAHill', 'Little Ice Age; City Upon a Hill', 3, 'EVENT', None, None),
+    ('ME_PI', 'event_cards', 'MagellansExpeditionPapalIndulgence', "Magellan's expedition; Papal Indulgence", 3, 'EVENT', None, None),
+    ('Pi_DR', 'event_cards', 'PilgrimsDutchRevolt', 'Pilgrims; Dutch Revolt', 3, 'EVENT', None, None),
+    ('SV_PW', 'event_cards', 'SinkingOfTheVasaPeaceOfWestphalia', 'Sinking of the Vasa; Peace of Westphalia', 3, 'EVENT', None, None),
+    ('ST_MR', 'event_cards', 'SpiceTradeMuntzerRevolt', 'Spice Trade; Muntzer Revolt', 3, 'EVENT', None, None),
+    ('TM_KE', 'event_cards', 'TulipManiaKangxiEra', 'Tulip Mania; Kangxi Era', 3, 'EVENT', None, None),
+    ('AR_FR', 'event_cards', 'AmericanRevolutionFrenchRevolution', 'American revolution; French Revolution', 4, 'EVENT', None, None),
+    ('An_GE', 'event_cards', 'AnarchismGreatExhibition', 'Anarchism; Great Exhibition', 4, 'EVENT', None, None),
+    ('CGR_IPB', 'event_cards', 'CalifornianGoldRushIrishPotatoBlight', 'Californian Gold Rush; Irish Potato Blight', 4, 'EVENT', None, None),
+    ('EC_GS', 'event_cards', 'EntenteCordialeGeneralStrike', 'Entente Cordiale; General strike', 4, 'EVENT', None, None),
+    ('EK_FVC', 'event_cards', 'EruptionOfKrakatoaFirstVaticanCouncil', 'Eruption of Krakatoa; First Vatican Council', 4, 'EVENT', None, None),
+    ('MM_TR', 'event_cards', 'MarchToMoscowTaipingRebellion', 'March to Moscow; Taiping Rebellion', 4, 'EVENT', None, None),
+    ('Ro_IR', 'event_cards', 'RomanticismIndustrialRevolution', 'Romanticism; Industrial Revolution', 4, 'EVENT', None, None),
+    ('SA_DA', 'event_cards', 'ScrambleForAfricaDreyfusAffair', 'Scramble for Africa; Dreyfus Affair', 4, 'EVENT', None, None),
+    ('SME_WS', 'event_cards', 'SickManOfEuropeWomensSuffrage', "Sick Man of Europe; Women's Suffrage", 4, 'EVENT', None, None),
+    ('SC_TCO', 'event_cards', 'SokotoCaliphateTennisCourtOath', 'Sokoto Caliphate; Tennis Court Oath', 4, 'EVENT', None, None),
+    ('TM_SM', 'event_cards', 'TonghakMovementSepoyMutiny', 'Tonghak movement; Sepoy Mutiny', 4, 'EVENT', None, None),
+    ('We_Em', 'event_cards', 'WeltpolitikEmigration', 'Weltpolitik; Emigration', 4, 'EVENT', None, None),
+    ('Am_DR', 'dynasty_cards', 'DemocraticRepublicans', 'Democratic Republicans', None, 'DYNASTY', None, 'America'),
+    ('Am_FP', 'dynasty_cards', 'FederalistParty', 'Federalist Party', None, 'DYNASTY', None, 'America'),
+    ('Am_BfHd', 'nations', 'AmericaBuffaloHorde', 'Buffalo Horde', 0, 'PROGRESS', 'BUILDING', 'America'),
+    ('Am_Tpe', 'nations', 'AmericaTeePee', 'Teepee', 0, 'PROGRESS', 'BUILDING', 'America'),
+    ('Am_Brv', 'nations', 'AmericaBrave', 'Brave', 0, 'PROGRESS', 'MILITARY', 'America'),
+    ('Am_Adb', 'nations', 'AmericaAdobe', 'Adobe', 0, 'PROGRESS', 'BUILDING', 'America'),
+    ('Am_S', 'nations', 'AmericaSpecial', 'America Special', None, 'SPECIAL', None, 'America'),
+    ('Ar_AC', 'dynasty_cards', 'AbbasidCaliphate', 'Abbasid Caliphate', None, 'DYNASTY', None, 'Arabs'),
+    ('Ar_UC', 'dynasty_cards', 'UmayyadCaliphate', 'Umayyad Caliphate', None, 'DYNASTY', None, 'Arabs'),
+    ('Ar_Kba', 'nations', 'ArabsKaba', 'Kaba', 0, 'PROGRESS', 'BUILDING', 'Arabs'),
+    ('Ar_Qry', 'nations', 'ArabsQuarry', 'Quarry', 0, 'PROGRESS', 'BUILDING', 'Arabs'),
+    ('Ar_Axm', 'nations', 'ArabsAxeman', 'Axeman', 0, 'PROGRESS', 'MILITARY', 'Arabs'),
+    ('Ar_Bzr', 'nations', 'ArabsBazaar', 'Bazaar', 0, 'PROGRESS', 'BUILDING', 'Arabs'),
+    ('Ar_S', 'nations', 'ArabsSpecial', 'Arabs Special', None, 'SPECIAL', None, 'Arabs'),
+    ('C_MD', 'dynasty_cards', 'MingDynasty', 'Ming Dynasty', None, 'DYNASTY', None, 'China'),
+    ('C_QD', 'dynasty_cards', 'QinDynasty', 'Qin Dynasty', None, 'DYNASTY', None, 'China'),
+    ('C_Frm', 'nations', 'ChinaFarm', 'Farm', 0, 'PROGRESS', 'BUILDING', 'China'),
+    ('C_Qry', 'nations', 'ChinaQuarry', 'Quarry', 0, 'PROGRESS', 'BUILDING', 'China'),
+    ('C_Axm', 'nations', 'ChinaAxeman', 'Axeman', 0, 'PROGRESS', 'MILITARY', 'China'),
+    ('C_Pgd', 'nations', 'ChinaPagoda', 'Pagoda', 0, 'PROGRESS', 'BUILDING', 'China'),
+    ('C_S', 'nations', 'ChinaSpecial', 'China Special', None, 'SPECIAL', None, 'China'),
+    ('Eg_NK', 'dynasty_cards', 'NewKingdom', 'New Kingdom', None, 'DYNASTY', None, 'Egypt'),
+    ('Eg_OK', 'dynasty_cards', 'OldKingdom', 'Old Kingdom', None, 'DYNASTY', None, 'Egypt'),
+    ('Eg_Brw', 'nations', 'EgyptBrewery', 'Brewery', 0, 'PROGRESS', 'BUILDING', 'Egypt'),
+    ('Eg_Qry', 'nations', 'EgyptQuarry', 'Quarry', 0, 'PROGRESS', 'BUILDING', 'Egypt'),
+    ('Eg_Tpl', 'nations', 'EgyptTemple', 'Temple', 0, 'PROGRESS', 'BUILDING', 'Egypt'),
+    ('Eg_Crv', 'nations', 'EgyptCaravan', 'Caravan', 0, 'PROGRESS', 'BUILDING', 'Egypt'),
+    ('Eg_S', 'nations', 'EgyptSpecial', 'Egypt Special', None, 'SPECIAL', None, 'Egypt'),
+    ('Eg_Prm', 'nations', 'EgyptPyramids', 'Pyramids', 0, 'PROGRESS', 'WONDER', 'Egypt'),
+    ('Et_AK', 'dynasty_cards', 'AxumiteKingdom', 'Axumite Kingdom', None, 'DYNASTY', None, 'Ethiopia'),
+    ('Et_Sb', 'dynasty_cards', 'Sheba', 'Sheba', None, 'DYNASTY', None, 'Ethiopia'),
+    ('Et_Stl', 'nations', 'EthiopiaStele', 'Stele', 0, 'PROGRESS', 'BUILDING', 'Ethiopia'),
+    ('Et_qry', 'nations', 'EthiopiaQuarry', 'Quarry', 0, 'PROGRESS', 'BUILDING', 'Ethiopia'),
+    ('Et_Axm', 'nations', 'EthiopiaAxeman', 'Axeman', 0, 'PROGRESS', 'MILITARY', 'Ethiopia'),
+    ('Et_Frm', 'nations', 'EthiopiaFarm', 'Farm', 0, 'PROGRESS', 'BUILDING', 'Ethiopia'),
+    ('Et_S', 'nations', 'EthiopiaSpecial', 'Ethiopia Special', None, 'SPECIAL', None, 'Ethiopia'),
+    ('G_At', 'dynasty_cards', 'Athens', 'Athens', None, 'DYNASTY', None, 'Greece'),
+    ('G_St', 'dynasty_cards', 'Sparta', 'Sparta', None, 'DYNASTY', None, 'Greece'),
+    ('G_Frm', 'nations', 'GreeceFarm', 'Farm', 0, 'PROGRESS', 'BUILDING', 'Greece'),
+    ('G_Qry', 'nations', 'GreeceQuarry', 'Quarry', 0, 'PROGRESS', 'BUILDING', 'Greece'),
+    ('G_Hpl', 'nations', 'GreeceHoplite', 'Hoplite', 0, 'PROGRESS', 'MILITARY', 'Greece'),
+    ('G_Lyc', 'nations', 'GreeceLyceum', 'Lyceum', 0, 'PROGRESS', 'BUILDING', 'Greece'),
+    ('G_S', 'nations', 'GreeceSpecial', 'Greece Special', None, 'SPECIAL', None, 'Greece'),
+    ('I_My', 'dynasty_cards', 'MauryanEmpire', 'Mauryan Empire', None, 'DYNASTY', None, 'India'),
+    ('I_Mg', 'dynasty_cards', 'MughalEmpire', 'Mughal Empire', None, 'DYNASTY', None, 'India'),
+    ('I_Tpl', 'nations', 'IndiaTemple', 'Temple', 0, 'PROGRESS', 'BUILDING', 'India'),
+    ('I_Qry', 'nations', 'IndiaQuarry', 'Quarry', 0, 'PROGRESS', 'BUILDING', 'India'),
+    ('I_Crt', 'nations', 'IndiaChariot', 'Chariot', 0, 'PROGRESS', 'MILITARY', 'India'),
+    ('I_Frm', 'nations', 'IndiaFarm', 'Farm', 0, 'PROGRESS', 'BUILDING', 'India'),
+    ('I_S', 'nations', 'IndiaSpecial', 'India Special', None, 'SPECIAL', None, 'India'),
+    ('I_Vrn', 'nations', 'IndiaVaranasi', 'Varanasi', 0, 'PROGRESS', 'WONDER', 'India'),
+    ('J_EP', 'dynasty_cards', 'EdoPeriod', 'Edo Period', None, 'DYNASTY', None, 'Japan'),
+    ('J_HP', 'dynasty_cards', 'HeianPeriod', 'Heian Period', None, 'DYNASTY', None, 'Japan'),
+    ('J_Epr', 'nations', 'JapanEmperor', 'Emperor', 0, 'PROGRESS', 'ADVISOR', 'Japan'),
+    ('J_Tpl', 'nations', 'JapanTemple', 'Temple', 0, 'PROGRESS', 'BUILDING', 'Japan'),
+    ('J_Qry', 'nations', 'JapanQuarry', 'Quarry', 0, 'PROGRESS', 'BUILDING', 'Japan'),
+    ('J_Axm ', 'nations', 'JapanAxeman', 'Axeman', 0, 'PROGRESS', 'MILITARY', 'Japan'),
+    ('J_RcFd', 'nations', 'JapanRiceFields', 'Rice Fields', 0, 'PROGRESS', 'BUILDING', 'Japan'),
+    ('J_Hkd', 'nations', 'JapanHokkaido', 'Hokkaido', 0, 'PROGRESS', 'BUILDING', 'Japan'),
+    ('K_JK', 'dynasty_cards', 'JoseonKingdom', 'Joseon Kingdom', None, 'DYNASTY', None, 'Korea'),
+    ('K_KK', 'dynasty_cards', 'KoryoKingdom', 'Koryo Kingdom', None, 'DYNASTY', None, 'Korea'),
+    ('K_Tpl', 'nations', 'KoreaTemple', 'Temple', 0, 'PROGRESS', 'BUILDING', 'Korea'),
+    ('K_Qry', 'nations', 'KoreaQuarry', 'Quarry', 0, 'PROGRESS', 'BUILDING', 'Korea'),
+    ('K_Arc', 'nations', 'KoreaArcher', 'Archer', 0, 'PROGRESS', 'MILITARY', 'Korea'),
+    ('K_CfAc', 'nations', 'KoreaConfucianAcadamy', 'Confucian Academy', 0, 'PROGRESS', 'BUILDING', 'Korea'),
+    ('K_S', 'nations', 'KoreaSpecial', 'Korea Special', None, 'SPECIAL', None, 'Korea'),
+    ('Ml_ME', 'dynasty_cards', 'MaliEmpire', 'Mali Empire', None, 'DYNASTY', None, 'Mali'),
+    ('Ml_SE', 'dynasty_cards', 'SonghaiEmpire', 'Songhai Empire', None, 'DYNASTY', None, 'Mali'),
+    ('Ml_StCv', 'nations', 'MaliSaltCaravan', 'Salt Caravan', 0, 'PROGRESS', 'BUILDING', 'Mali'),
+    ('Ml_Qry', 'nations', 'MaliQuarry', 'Quarry', 0, 'PROGRESS', 'BUILDING', 'Mali'),
+    ('Ml_GdMn', 'nations', 'MaliGoldMine', 'Gold Mine', 0, 'PROGRESS', 'BUILDING', 'Mali'),
+    ('Ml_Frm', 'nations', 'MaliFarm', 'Farm', 0, 'PROGRESS', 'BUILDING', 'Mali'),
+    ('Ml_S', 'nations', 'MaliSpecial', 'Mali Special', None, 'SPECIAL', None, 'Mali'),
+    ('Mg_GH', 'dynasty_cards', 'GoldenHorde', 'Golden Horde', None, 'DYNASTY', None, 'Mongolia'),
+    ('Mg_YD', 'dynasty_cards', 'YuanDynasty', 'Yuan Dynasty', None, 'DYNASTY', None, 'Mongolia'),
+    ('Mg_Yrt', 'nations', 'MongoliaYurt', 'Yurt', 0, 'PROGRESS', 'BUILDING', 'Mongolia'),
+    ('Mg_Crv', 'nations', 'MongoliaCaravan', 'Caravan', 0, 'PROGRESS', 'BUILDING', 'Mongolia'),
+    ('Mg_HsAr', 'nations', 'MongoliaHorseArcher', 'Horse Archer', 0, 'PROGRESS', 'MILITARY', 'Mongolia'),
+    ('Mg_Stp', 'nations', 'MongoliaSteppe', 'Steppe', 0, 'PROGRESS', 'BUILDING', 'Mongolia'),
+    ('Mg_S', 'nations', 'MongoliaSpecial', 'Mongolia Special', None, 'SPECIAL', None, 'Mongolia'),
+    ('Ps_AE', 'dynasty_cards', 'AchaemenidEmpire', 'Achaemenid Empire', None, 'DYNASTY', None, 'Persia'),
+    ('Ps_SE', 'dynasty_cards', 'SassanidEmpire', 'Sassanid Empire', None, 'DYNASTY', None, 'Persia'),
+    ('Ps_Qry', 'nations', 'PersiaQuarry', 'Quarry', 0, 'PROGRESS', 'BUILDING', 'Persia'),
+    ('Ps_Axm', 'nations', 'PersiaAxeman', 'Axeman', 0, 'PROGRESS', 'MILITARY', 'Persia'),
+    ('Ps_Zgr', 'nations', 'PersiaZiggurat', 'Ziggurat', 0, 'PROGRESS', 'BUILDING', 'Persia'),
+    ('Ps_Tpl', 'nations', 'PersiaTemple', 'Temple', 0, 'PROGRESS', 'BUILDING', 'Persia'),
+    ('Pl_JD', 'dynasty_cards', 'JagellonianDynasty', 'Jagellonian Dynasty', None, 'DYNASTY', None, 'Poland'),
+    ('Pl_PLC', 'dynasty_cards', 'PolishLithuanianCommonwealth', 'Polish-Lithuanian Commonwealth', None, 'DYNASTY', None, 'Poland'),
+    ('Pl_Tpl', 'nations', 'PolandTemple', 'Temple', 0, 'PROGRESS', 'BUILDING', 'Poland'),
+    ('Pl_Frg', 'nations', 'PolandForge', 'Forge', 0, 'PROGRESS', 'BUILDING', 'Poland'),
+    ('Pl_Axm', 'nations', 'PolandAxeman', 'Axeman', 0, 'PROGRESS', 'MILITARY', 'Poland'),
+    ('Pl_Qry', 'nations', 'PolandQuarry', 'Quarry', 0, 'PROGRESS', 'BUILDING', 'Poland'),
+    ('Pl_S', 'nations', 'PolandSpecial', 'Poland Special', None, 'SPECIAL', None, 'Poland'),
+    ('Pg_KL', 'dynasty_cards', 'KingdomOfLeon', 'Kingdom of Leon', None, 'DYNASTY', None, 'Portugal'),
+    ('Pg_PE', 'dynasty_cards', 'PortugeseEmpire', 'Portugese Empire', None, 'DYNASTY', None, 'Portugal'),
+    ('Pg_Tpl', 'nations', 'PortugalTemple', 'Temple', 0, 'PROGRESS', 'BUILDING', 'Portugal'),
+    ('Pg_Lth', 'nations', 'PortugalLighthouse', 'Lighthouse', 0, 'PROGRESS', 'BUILDING', 'Portugal'),
+    ('Pg_Crv', 'nations', 'PortugalCaravan', 'Caravan', 0, 'PROGRESS', 'BUILDING', 'Portugal'),
+    ('Pg_Frm', 'nations', 'PortugalFarm', 'Farm', 0, 'PROGRESS', 'BUILDING', 'Portugal'),
+    ('Pg_S', 'nations', 'PortugalSpecial', 'Portugal Special', None, 'SPECIAL', None, 'Portugal'),
+    ('R_RE', 'dynasty_cards', 'RomanEmpire', 'Roman Empire', None, 'DYNASTY', None, 'Rome'),
+    ('R_RR', 'dynasty_cards', 'RomanRepublic', 'Roman Republic', None, 'DYNASTY', None, 'Rome'),
+    ('R_Frm', 'nations', 'RomeFarm', 'Farm', 0, 'PROGRESS', 'BUILDING', 'Rome'),
+    ('R_Qry', 'nations', 'RomeQuarry', 'Quarry', 0, 'PROGRESS', 'BUILDING', 'Rome'),
+    ('R_Lgn', 'nations', 'RomeLegionary', 'Legionary', 0, 'PROGRESS', 'MILITARY', 'Rome'),
+    ('R_Aqd', 'nations', 'RomeAqueduct', 'Aqueduct', 0, 'PROGRESS', 'BUILDING', 'Rome'),
+    ('R_S', 'nations', 'RomeSpecial', 'Rome Special', None, 'SPECIAL', None, 'Rome'),
+    ('Vn_DS', 'dynasty_cards', 'DomainsOfTheSea', 'Domains of the Sea', None, 'DYNASTY', None, 'Venice'),
+    ('Vn_PW', 'dynasty_cards', 'PactumWarmundi', 'Pactum Warmundi', None, 'DYNASTY', None, 'Venice'),
+    ('Vn_GlBw', 'nations', 'VeniceGlassBlower', 'Glass Blower', 0, 'PROGRESS', 'BUILDING', 'Venice'),
+    ('Vn_Qry', 'nations', 'VeniceQuarry', 'Quarry', 0, 'PROGRESS', 'BUILDING', 'Venice'),
+    ('Vn_Trm', 'nations', 'VeniceTrireme', 'Trireme', 0, 'PROGRESS', 'MILITARY', 'Venice'),
+    ('Vn_Frm', 'nations', 'VeniceFarm', 'Farm', 0, 'PROGRESS', 'BUILDING', 'Venice'),
+    ('Vn_S', 'nations', 'VeniceSpecial', 'Venice Special', None, 'SPECIAL', None, 'Venice'),
+    ('Vn_Ctn', 'nations', 'VeniceConstantinople', 'Constantinople', 0, 'PROGRESS', 'COLONY', 'Venice'),
+    ('Vk_Nm', 'dynasty_cards', 'Normans', 'Normans', None, 'DYNASTY', None, 'Vikings'),
+    ('Vk_Vr', 'dynasty_cards', 'Varangians', 'Varangians', None, 'DYNASTY', None, 'Vikings'),
+    ('Vk_StCh', 'nations', 'VikingsStaveChurch', 'Stave Church', 0, 'PROGRESS', 'BUILDING', 'Vikings'),
+    ('Vk_Qry', 'nations', 'VikingsQuarry', 'Quarry', 0, 'PROGRESS', 'BUILDING', 'Vikings'),
+    ('Vk_Bsk', 'nations', 'VikingsBerserkers', 'Berserkers', 0, 'PROGRESS', 'MILITARY', 'Vikings'),
+    ('Vk_Frm', 'nations', 'VikingsFarm', 'Farm', 0, 'PROGRESS', 'BUILDING', 'Vikings'),
+    ('Vk_S', 'nations', 'VikingsSpecial', 'Vikings Special', None, 'SPECIAL', None, 'Vikings'),
+    ('Vk_OlUp', 'nations', 'VikingsOldUppsala', 'Old Uppsala', 0, 'PROGRESS', 'WONDER', 'Vikings'),
+    ('And', 'progress_cards', 'Aeneid', 'Aeneid', 1, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('Aqd', 'progress_cards', 'Aqueduct', 'Aqueduct', 1, 'PROGRESS', 'BUILDING', None),
+    ('Arc', 'progress_cards', 'Archer', 'Archer', 1, 'PROGRESS', 'MILITARY', None),
+    ('Acm', 'progress_cards', 'Archimedes', 'Archimedes', 1, 'PROGRESS', 'ADVISOR', None),
+    ('Arm', 'progress_cards', 'Armenia', 'Armenia', 1, 'PROGRESS', 'COLONY', None),
+    ('Agt', 'progress_cards', 'Augustus', 'Augustus', 1, 'PROGRESS', 'ADVISOR', None),
+    ('Bbl', 'progress_cards', 'Babylonia', 'Babylonia', 1, 'PROGRESS', 'COLONY', None),
+    ('BCnn', 'progress_cards', 'BattleOfCannae', 'Battle of Cannae', 1, 'PROGRESS', 'BATTLE', None),
+    ('BIss', 'progress_cards', 'BattleOfIssus', 'Battle of Issus', 1, 'PROGRESS', 'BATTLE', None),
+    ('BKds', 'progress_cards', 'BattleOfKadesh', 'Battle of Kadesh', 1, 'PROGRESS', 'BATTLE', None),
+    ('BTmp', 'progress_cards', 'BattleOfThermopylae', 'Battle of Thermopylae', 1, 'PROGRESS', 'BATTLE', None),
+    ('Bdc', 'progress_cards', 'Boudica', 'Boudica', 1, 'PROGRESS', 'ADVISOR', None),
+    ('Brw', 'progress_cards', 'Brewery', 'Brewery', 1, 'PROGRESS', 'BUILDING', None),
+    ('Bdh', 'progress_cards', 'Buddha', 'Buddha', 1, 'PROGRESS', 'ADVISOR', None),
+    ('Crt', 'progress_cards', 'Chariot', 'Chariot', 1, 'PROGRESS', 'MILITARY', None),
+    ('CtWl', 'progress_cards', 'CityWall', 'City Wall', 1, 'PROGRESS', 'BUILDING', None),
+    ('Cng', 'progress_cards', 'Coinage', 'Coinage', 1, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('Cls', 'progress_cards', 'Colosseum', 'Colosseum', 1, 'PROGRESS', 'WONDER', None),
+    ('CfAc', 'progress_cards', 'ConfucianAcademy', 'Confucian Academy', 1, 'PROGRESS', 'BUILDING', None),
+    ('CsAp', 'progress_cards', 'CrossingTheAlps', 'Crossing the Alps', 1, 'PROGRESS', 'BATTLE', None),
+    ('CrGr', 'progress_cards', 'CyrusTheGreat', 'Cyrus the Great', 1, 'PROGRESS', 'ADVISOR', None),
+    ('Elp', 'progress_cards', 'Elephant', 'Elephant', 1, 'PROGRESS', 'MILITARY', None),
+    ('Frg', 'progress_cards', 'Forge', 'Forge', 1, 'PROGRESS', 'BUILDING', None),
+    ('Frm', 'progress_cards', 'Forum', 'Forum', 1, 'PROGRESS', 'BUILDING', None),
+    ('Gal', 'progress_cards', 'Gaul', 'Gaul', 1, 'PROGRESS', 'COLONY', None),
+    ('Grn', 'progress_cards', 'Granary', 'Granary', 1, 'PROGRESS', 'BUILDING', None),
+    ('GrLr', 'progress_cards', 'GreatLibrary', 'Great Library', 1, 'PROGRESS', 'WONDER', None),
+    ('GrLh', 'progress_cards', 'GreatLighthouse', 'Great Lighthouse', 1, 'PROGRESS', 'WONDER', None),
+    ('HgGd', 'progress_cards', 'HangingGardens', 'Hanging Gardens', 1, 'PROGRESS', 'WONDER', None),
+    ('Hnb', 'progress_cards', 'Hannibal', 'Hannibal', 1, 'PROGRESS', 'ADVISOR', None),
+    ('Hss', 'progress_cards', 'Hatshepsut', 'Hatshepsut', 1, 'PROGRESS', 'ADVISOR', None),
+    ('HdKs', 'progress_cards', 'HinduKush', 'Hindu Kush', 1, 'PROGRESS', 'COLONY', None),
+    ('Hsn', 'progress_cards', 'Hispania', 'Hispania', 1, 'PROGRESS', 'COLONY', None),
+    ('Hpl', 'progress_cards', 'Hoplite', 'Hoplite', 1, 'PROGRESS', 'MILITARY', None),
+    ('HncI', 'progress_cards', 'HunnicInvasions', 'Hunnic Invasions', 1, 'PROGRESS', 'WAR', None),
+    ('HksI', 'progress_cards', 'HyksosInvasion', 'Hyksos Invasion', 1, 'PROGRESS', 'WAR', None),
+    ('Hpt', 'progress_cards', 'Hypatia', 'Hypatia', 1, 'PROGRESS', 'ADVISOR', None),
+    ('Imt', 'progress_cards', 'Immortal', 'Immortal', 1, 'PROGRESS', 'MILITARY', None),
+    ('IrWk', 'progress_cards', 'IronWorking', 'Iron Working', 1, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('Isr', 'progress_cards', 'Israel', 'Israel', 1, 'PROGRESS', 'COLONY', None),
+    ('Lgn', 'progress_cards', 'Legionary', 'Legionary', 1, 'PROGRESS', 'MILITARY', None),
+    ('Lib', 'progress_cards', 'Library', 'Library', 1, 'PROGRESS', 'BUILDING', None),
+    ('Lth', 'progress_cards', 'Lighthouse', 'Lighthouse', 1, 'PROGRESS', 'BUILDING', None),
+    ('Lyc', 'progress_cards', 'Lyceum', 'Lyceum', 1, 'PROGRESS', 'BUILDING', None),
+    ('Mcd', 'progress_cards', 'Macedonia', 'Macedonia', 1, 'PROGRESS', 'COLONY', None),
+    ('Mhb', 'progress_cards', 'Mahabharata', 'Mahabharata', 1, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('MpMk', 'progress_cards', 'MapMaking', 'Map Making', 1, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('MvBr', 'progress_cards', 'MilvianBridge', 'Milvian Bridge', 1, 'PROGRESS', 'BATTLE', None),
+    ('Min', 'progress_cards', 'Mine', 'Mine', 1, 'PROGRESS', 'BUILDING', None),
+    ('MtAr', 'progress_cards', 'MountArarat', 'Mount Ararat', 1, 'PROGRESS', 'NATURAL_WONDER', None),
+    ('MtKl', 'progress_cards', 'MountKailash', 'Mount Kailash', 1, 'PROGRESS', 'NATURAL_WONDER', None),
+    ('Nub', 'progress_cards', 'Nubia', 'Nubia', 1, 'PROGRESS', 'COLONY', None),
+    ('Pgd', 'progress_cards', 'Pagoda', 'Pagoda', 1, 'PROGRESS', 'BUILDING', None),
+    ('PrtW', 'progress_cards', 'ParthianWars', 'Parthian Wars', 1, 'PROGRESS', 'WAR', None),
+    ('PlpW', 'progress_cards', 'PelopponesianWar', 'Pelopponesian War', 1, 'PROGRESS', 'WAR', None),
+    ('Ptr', 'progress_cards', 'Petra', 'Petra', 1, 'PROGRESS', 'WONDER', None),
+    ('Plx', 'progress_cards', 'Phalanx', 'Phalanx', 1, 'PROGRESS', 'MILITARY', None),
+    ('PtGd', 'progress_cards', 'PraetorianGuard', 'Praetorian Guard', 1, 'PROGRESS', 'MILITARY', None),
+    ('PncW', 'progress_cards', 'PunicWars', 'Punic Wars', 1, 'PROGRESS', 'WAR', None),
+    ('Prm', 'progress_cards', 'Pyramids', 'Pyramids', 1, 'PROGRESS', 'WONDER', None),
+    ('QSH', 'progress_cards', 'QinShiHuang', 'Qin Shi Huang', 1, 'PROGRESS', 'ADVISOR', None),
+    ('StAg', 'progress_cards', 'SaintAugustine', 'Saint Augustine', 1, 'PROGRESS', 'ADVISOR', None),
+    ('SAls', 'progress_cards', 'SiegeOfAlesia', 'Siege of Alesia', 1, 'PROGRESS', 'BATTLE', None),
+    ('STry', 'progress_cards', 'SiegeOfTroy', 'Siege of Troy', 1, 'PROGRESS', 'BATTLE', None),
+    ('Slk', 'progress_cards', 'Silk', 'Silk', 1, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('SkRd', 'progress_cards', 'SilkRoad', 'Silk Road', 1, 'PROGRESS', 'BUILDING', None),
+    ('SwOs', 'progress_cards', 'SiwaOasis', 'Siwa Oasis', 1, 'PROGRESS', 'NATURAL_WONDER', None),
+    ('SmTp', 'progress_cards', 'SolomonsTemple', "Solomon's Temple", 1, 'PROGRESS', 'WONDER', None),
+    ('Spx', 'progress_cards', 'Sphinx', 'Sphinx', 1, 'PROGRESS', 'WONDER', None),
+    ('Sth', 'progress_cards', 'Stonehenge', 'Stonehenge', 1, 'PROGRESS', 'WONDER', None),
+    ('SnTz', 'progress_cards', 'SunTzu', 'Sun Tzu', 1, 'PROGRESS', 'ADVISOR', None),
+    ('Sng', 'progress_cards', 'Synagogue', 'Synagogue', 1, 'PROGRESS', 'BUILDING', None),
+    ('TcAm', 'progress_cards', 'TerracottaArmy', 'Terracotta Army', 1, 'PROGRESS', 'WONDER', None),
+    ('Bib', 'progress_cards', 'TheBible', 'The Bible', 1, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('Ods', 'progress_cards', 'TheOdyssey', 'The Odyssey', 1, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('Orc', 'progress_cards', 'TheOracle', 'The Oracle', 1, 'PROGRESS', 'WONDER', None),
+    ('PlHc', 'progress_cards', 'ThePillarOfHercules', 'The Pillar of Hercules', 1, 'PROGRESS', 'NATURAL_WONDER', None),
+    ('ThKd', 'progress_cards', 'ThreeKingdoms', 'Three Kingdoms', 1, 'PROGRESS', 'WAR', None),
+    ('Trm', 'progress_cards', 'Trireme', 'Trireme', 1, 'PROGRESS', 'MILITARY', None),
+    ('Vtc', 'progress_cards', 'Vatican', 'Vatican', 1, 'PROGRESS', 'BUILDING', None),
+    ('Vsv', 'progress_cards', 'Vesuvius', 'Vesuvius', 1, 'PROGRESS', 'NATURAL_WONDER', None),
+    ('WSts', 'progress_cards', 'WarringStates', 'Warring States', 1, 'PROGRESS', 'WAR', None),
+    ('WAlx', 'progress_cards', 'WarsOfAlexander', 'Wars of Alexander', 1, 'PROGRESS', 'WAR', None),
+    ('Zgr', 'progress_cards', 'Ziggurat', 'Ziggurat', 1, 'PROGRESS', 'BUILDING', None),
+    ('AbBk', 'progress_cards', 'AbuBakr', 'Abu Bakr', 2, 'PROGRESS', 'ADVISOR', None),
+    ('Ahb', 'progress_cards', 'Alhambra', 'Alhambra', 2, 'PROGRESS', 'WONDER', None),
+    ('Ahz', 'progress_cards', 'Alhazen', 'Alhazen', 2, 'PROGRESS', 'ADVISOR', None),
+    ('AkWt', 'progress_cards', 'AngkorWat', 'Angkor Wat', 2, 'PROGRESS', 'WONDER', None),
+    ('AnKn', 'progress_cards', 'AnnaKomnene', 'Anna Komnene', 2, 'PROGRESS', 'ADVISOR', None),
+    ('ArNt', 'progress_cards', 'ArabianNights', 'Arabian Nights', 2, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('Ass', 'progress_cards', 'Assassin', 'Assassin', 2, 'PROGRESS', 'MILITARY', None),
+    ('ArBr', 'progress_cards', 'AuroraBorealis', 'Aurora Borealis', 2, 'PROGRESS', 'NATURAL_WONDER', None),
+    ('BlCt', 'progress_cards', 'BallCourt', 'Ball Court', 2, 'PROGRESS', 'BUILDING', None),
+    ('BAgc', 'progress_cards', 'BattleOfAgincourt', 'Battle of Agincourt', 2, 'PROGRESS', 'BATTLE', None),
+    ('BAJ', 'progress_cards', 'BattleOfAinJalut', 'Battle of Ain Jalut', 2, 'PROGRESS', 'BATTLE', None),
+    ('BHst', 'progress_cards', 'BattleOfHastings', 'Battle of Hastings', 2, 'PROGRESS', 'BATTLE', None),
+    ('BMzk', 'progress_cards', 'BattleOfManzikert', 'Battle of Manzikert', 2, 'PROGRESS', 'BATTLE', None),
+    ('BPtr', 'progress_cards', 'BattleOfPoitiers', 'Battle of Poitiers', 2, 'PROGRESS', 'BATTLE', None),
+    ('BTnb', 'progress_cards', 'BattleOfTannenberg', 'Battle of Tannenberg', 2, 'PROGRESS', 'BATTLE', None),
+    ('BAW', 'progress_cards', 'ByzantineArabWar', 'Byzantine-Arab War', 2, 'PROGRESS', 'WAR', None),
+    ('CmAr', 'progress_cards', 'CamelArcher', 'Camel Archer', 2, 'PROGRESS', 'MILITARY', None),
+    ('Cas', 'progress_cards', 'Castle', 'Castle', 2, 'PROGRESS', 'BUILDING', None),
+    ('Ctp', 'progress_cards', 'Cataphract', 'Cataphract', 2, 'PROGRESS', 'MILITARY', None),
+    ('Cat', 'progress_cards', 'Cathedral', 'Cathedral', 2, 'PROGRESS', 'BUILDING', None),
+    ('CcIz', 'progress_cards', 'ChichenItza', 'Chichen Itza', 2, 'PROGRESS', 'WONDER', None),
+    ('CKN', 'progress_cards', 'ChoKoNu', 'Cho-Ko-Nu', 2, 'PROGRESS', 'MILITARY', None),
+    ('Cmp', 'progress_cards', 'Compass', 'Compass', 2, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('CsSt', 'progress_cards', 'CrusaderStates', 'Crusader States', 2, 'PROGRESS', 'COLONY', None),
+    ('DvCm', 'progress_cards', 'DivinaCommedia', 'Divina Commedia', 2, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('EnAq', 'progress_cards', 'EleanorOfAquitaine', 'Eleanor of Aquitaine', 2, 'PROGRESS', 'ADVISOR', None),
+    ('Eng', 'progress_cards', 'England', 'England', 2, 'PROGRESS', 'COLONY', None),
+    ('FstC', 'progress_cards', 'FirstCrusade', 'First Crusade', 2, 'PROGRESS', 'WAR', None),
+    ('GgKn', 'progress_cards', 'GenghisKhan', 'Genghis Khan', 2, 'PROGRESS', 'ADVISOR', None),
+    ('GrBk', 'progress_cards', 'GrandBanks', 'Grand Banks', 2, 'PROGRESS', 'NATURAL_WONDER', None),
+    ('GrWl', 'progress_cards', 'GreatWall', 'Great Wall', 2, 'PROGRESS', 'WONDER', None),
+    ('GFG', 'progress_cards', 'GreekFireGalley', 'Greek Fire Galley', 2, 'PROGRESS', 'MILITARY', None),
+    ('Grl', 'progress_cards', 'Greenland', 'Greenland', 2, 'PROGRESS', 'COLONY', None),
+    ('GdHl', 'progress_cards', 'GuildHall', 'Guild Hall', 2, 'PROGRESS', 'BUILDING', None),
+    ('Gpd', 'progress_cards', 'Gunpowder', 'Gunpowder', 2, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('Han', 'progress_cards', 'Hansa', 'Hansa', 2, 'PROGRESS', 'BUILDING', None),
+    ('HrHd', 'progress_cards', 'HaraldHardrada', 'Harald Hardrada', 2, 'PROGRESS', 'ADVISOR', None),
+    ('Hwi', 'progress_cards', 'Hawaii', 'Hawaii', 2, 'PROGRESS', 'NATURAL_WONDER', None),
+    ('HvPl', 'progress_cards', 'HeavyPlough', 'Heavy Plough', 2, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('Hip', 'progress_cards', 'Hippodrome', 'Hippodrome', 2, 'PROGRESS', 'BUILDING', None),
+    ('HsAr', 'progress_cards', 'HorseArcher', 'Horse Archer', 2, 'PROGRESS', 'MILITARY', None),
+    ('HYW', 'progress_cards', 'HundredYearsWar', 'Hundred Years War', 2, 'PROGRESS', 'WAR', None),
+    ('Knt', 'progress_cards', 'Knight', 'Knight', 2, 'PROGRESS', 'MILITARY', None),
+    ('KnTp', 'progress_cards', 'KnightsTemplar', 'Knights Templar', 2, 'PROGRESS', 'BUILDING', None),
+    ('KrCv', 'progress_cards', 'KrakDesChevaliers', 'Krak des Chevaliers', 2, 'PROGRESS', 'WONDER', None),
+    ('Lbd', 'progress_cards', 'Lombardy', 'Lombardy', 2, 'PROGRESS', 'COLONY', None),
+    ('Lbm', 'progress_cards', 'Longbowman', 'Longbowman', 2, 'PROGRESS', 'MILITARY', None),
+    ('Lsp', 'progress_cards', 'Longships', 'Longships', 2, 'PROGRESS', 'MILITARY', None),
+    ('Mdr', 'progress_cards', 'Madrasa', 'Madrasa', 2, 'PROGRESS', 'BUILDING', None),
+    ('MnCt', 'progress_cards', 'MagnaCarta', 'Magna Carta', 2, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('MsMs', 'progress_cards', 'MansaMusa', 'Mansa Musa', 2, 'PROGRESS', 'ADVISOR', None),
+    ('McPl', 'progress_cards', 'MarcoPolo', 'Marco Polo', 2, 'PROGRESS', 'ADVISOR', None),
+    ('Mkt', 'progress_cards', 'Market', 'Market', 2, 'PROGRESS', 'BUILDING', None),
+    ('Mnt', 'progress_cards', 'Mint', 'Mint', 2, 'PROGRESS', 'BUILDING', None),
+    ('MoSt', 'progress_cards', 'MoaiStatues', 'Moai Statues', 2, 'PROGRESS', 'WONDER', None),
+    ('Mon', 'progress_cards', 'Monastery', 'Monastery', 2, 'PROGRESS', 'BUILDING', None),
+    ('MngI', 'progress_cards', 'MongolInvasions', 'Mongol Invasions', 2, 'PROGRESS', 'WAR', None),
+    ('Msq', 'progress_cards', 'Mosque', 'Mosque', 2, 'PROGRESS', 'BUILDING', None),
+    ('NtDm', 'progress_cards', 'NotreDame', 'Notre Dame', 2, 'PROGRESS', 'WONDER', None),
+    ('OcFs', 'progress_cards', 'OceanFishing', 'Ocean Fishing', 2, 'PROGRESS', 'BUILDING', None),
+    ('PSM', 'progress_cards', 'PiazzaSanMarco', 'Piazza San Marco', 2, 'PROGRESS', 'WONDER', None),
+    ('PcTw', 'progress_cards', 'PorcelainTower', 'Porcelain Tower', 2, 'PROGRESS', 'WONDER', None),
+    ('Prs', 'progress_cards', 'Prussia', 'Prussia', 2, 'PROGRESS', 'COLONY', None),
+    ('Rcq', 'progress_cards', 'Reconquista', 'Reconquista', 2, 'PROGRESS', 'WAR', None),
+    ('Shr', 'progress_cards', 'Sahara', 'Sahara', 2, 'PROGRESS', 'NATURAL_WONDER', None),
+    ('ShTd', 'progress_cards', 'SaharanTrade', 'Saharan Trade', 2, 'PROGRESS', 'COLONY', None),
+    ('SkUn', 'progress_cards', 'SankoreUniversity', 'Sankore University', 2, 'PROGRESS', 'WONDER', None),
+    ('SjGr', 'progress_cards', 'SejongTheGreat', 'Sejong the Great', 2, 'PROGRESS', 'ADVISOR', None),
+    ('SwPg', 'progress_cards', 'ShwedagonPagoda', 'Shwedagon Pagoda', 2, 'PROGRESS', 'WONDER', None),
+    ('Sbr', 'progress_cards', 'Siberia', 'Siberia', 2, 'PROGRESS', 'NATURAL_WONDER', None),
+    ('Scl', 'progress_cards', 'Sicily', 'Sicily', 2, 'PROGRESS', 'COLONY', None),
+    ('SCtn', 'progress_cards', 'SiegeOfConstantinople', 'Siege of Constantinople', 2, 'PROGRESS', 'BATTLE', None),
+    ('Stc', 'progress_cards', 'Spectacles', 'Spectacles', 2, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('THH', 'progress_cards', 'TheHornsOfHattin', 'The Horns of Hattin', 2, 'PROGRESS', 'BATTLE', None),
+    ('Qrn', 'progress_cards', 'TheQuoran', 'The Quoran', 2, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('TmAq', 'progress_cards', 'ThomasAquino', 'Thomas Aquino', 2, 'PROGRESS', 'ADVISOR', None),
+    ('RTK', 'progress_cards', 'RomanceOfTheThreeKingdoms', 'Three Kingdoms', 2, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('Tbt', 'progress_cards', 'Tibet', 'Tibet', 2, 'PROGRESS', 'COLONY', None),
+    ('Uni', 'progress_cards', 'University', 'University', 2, 'PROGRESS', 'BUILDING', None),
+    ('VdlW', 'progress_cards', 'VandalicWar', 'Vandalic War', 2, 'PROGRESS', 'WAR', None),
+    ('VkgR', 'progress_cards', 'VikingRaids', 'Viking Raids', 2, 'PROGRESS', 'WAR', None),
+    ('WRss', 'progress_cards', 'WarOfTheRoses', 'War of the Roses', 2, 'PROGRESS', 'WAR', None),
+    ('Wtm', 'progress_cards', 'Watermill', 'Watermill', 2, 'PROGRESS', 'BUILDING', None),
+    ('Wdm', 'progress_cards', 'Windmill', 'Windmill', 2, 'PROGRESS', 'BUILDING', None),
+    ('ZhXi', 'progress_cards', 'ZhuXi', 'Zhu Xi', 2, 'PROGRESS', 'ADVISOR', None),
+    ('AzEp', 'progress_cards', 'AztecEmpire', 'Aztec Empire', 3, 'PROGRESS', 'COLONY', None),
+    ('Bnk', 'progress_cards', 'Bank', 'Bank', 3, 'PROGRESS', 'BUILDING', None),
+    ('BCjm', 'progress_cards', 'BattleOfCajamarca', 'Battle of Cajamarca', 3, 'PROGRESS', 'BATTLE', None),
+    ('BNry', 'progress_cards', 'BattleOfNoryang', 'Battle of Noryang', 3, 'PROGRESS', 'BATTLE', None),
+    ('BPtv', 'progress_cards', 'BattleOfPoltava', 'Battle of Poltava', 3, 'PROGRESS', 'BATTLE', None),
+    ('Brz', 'progress_cards', 'Brazil', 'Brazil', 3, 'PROGRESS', 'COLONY', None),
+    ('CGH', 'progress_cards', 'CapeOfGoodHope', 'Cape of Good Hope', 3, 'PROGRESS', 'NATURAL_WONDER', None),
+    ('CrLn', 'progress_cards', 'CarolusLinneaus', 'Carolus Linneaus', 3, 'PROGRESS', 'ADVISOR', None),
+    ('Cht', 'progress_cards', 'Chateau', 'Chateau', 3, 'PROGRESS', 'BUILDING', None),
+    ('Clk', 'progress_cards', 'Clocks', 'Clocks', 3, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('CfHs', 'progress_cards', 'CoffeeHouse', 'Coffee House', 3, 'PROGRESS', 'BUILDING', None),
+    ('ClTr', 'progress_cards', 'ColonialTrading', 'Colonial Trading', 3, 'PROGRESS', 'BUILDING', None),
+    ('Cqd', 'progress_cards', 'Conquistador', 'Conquistador', 3, 'PROGRESS', 'MILITARY', None),
+    ('CtEx', 'progress_cards', 'CortesExpedition', 'Cortes Expedition', 3, 'PROGRESS', 'WAR', None),
+    ('Cth', 'progress_cards', 'Courthouse', 'Courthouse', 3, 'PROGRESS', 'BUILDING', None),
+    ('Dik', 'progress_cards', 'Dike', 'Dike', 3, 'PROGRESS', 'BUILDING', None),
+    ('DnQx', 'progress_cards', 'DonQuixote', 'Don Quixote', 3, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('DLW', 'progress_cards', 'DutchLiberationWar', 'Dutch Liberation War', 3, 'PROGRESS', 'WAR', None),
+    ('Elz', 'progress_cards', 'Elizabeth', 'Elizabeth', 3, 'PROGRESS', 'ADVISOR', None),
+    ('FCtn', 'progress_cards', 'FallOfConstantinople', 'Fall of Constantinople', 3, 'PROGRESS', 'BATTLE', None),
+    ('FLsb', 'progress_cards', 'FallOfLouisburg', 'Fall of Louisburg', 3, 'PROGRESS', 'BATTLE', None),
+    ('FbPl', 'progress_cards', 'ForbiddenPalace', 'Forbidden Palace', 3, 'PROGRESS', 'WONDER', None),
+    ('Fgt', 'progress_cards', 'Frigate', 'Frigate', 3, 'PROGRESS', 'MILITARY', None),
+    ('GlGl', 'progress_cards', 'GalileoGalilei', 'Galileo Galilei', 3, 'PROGRESS', 'ADVISOR', None),
+    ('GrCy', 'progress_cards', 'GrandCanyon', 'Grand Canyon', 3, 'PROGRESS', 'NATURAL_WONDER', None),
+    ('GBR', 'progress_cards', 'GreatBarrierReef', 'Great Barrier Reef', 3, 'PROGRESS', 'NATURAL_WONDER', None),
+    ('GNW', 'progress_cards', 'GreatNorthernWar', 'Great Northern War', 3, 'PROGRESS', 'WAR', None),
+    ('GrPl', 'progress_cards', 'GreatPlains', 'Great Plains', 3, 'PROGRESS', 'NATURAL_WONDER', None),
+    ('GbBb', 'progress_cards', 'GutenbergBible', 'Gutenberg Bible', 3, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('Hkp', 'progress_cards', 'Hakkapeliitta', 'Hakkapeliitta', 3, 'PROGRESS', 'MILITARY', None),
+    ('Hmm', 'progress_cards', 'Hammam', 'Hammam', 3, 'PROGRESS', 'BUILDING', None),
+    ('HmCs', 'progress_cards', 'HimejiCastle', 'Himeji Castle', 3, 'PROGRESS', 'WONDER', None),
+    ('ImjW', 'progress_cards', 'ImjinWar', 'Imjin War', 3, 'PROGRESS', 'WAR', None),
+    ('IcEp', 'progress_cards', 'IncanEmpire', 'Incan Empire', 3, 'PROGRESS', 'COLONY', None),
+    ('Isb', 'progress_cards', 'Isabella', 'Isabella', 3, 'PROGRESS', 'ADVISOR', None),
+    ('JgWr', 'progress_cards', 'JaguarWarrior', 'Jaguar Warrior', 3, 'PROGRESS', 'MILITARY', None),
+    ('LNT', 'progress_cards', 'LaNocheTriste', 'La Noche Triste', 3, 'PROGRESS', 'BATTLE', None),
+    ('LeVt', 'progress_cards', 'LeVite', 'Le Vite', 3, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('McPc', 'progress_cards', 'MachuPicchu', 'Machu Picchu', 3, 'PROGRESS', 'WONDER', None),
+    ('MtLt', 'progress_cards', 'MartinLuther', 'Martin Luther', 3, 'PROGRESS', 'ADVISOR', None),
+    ('Mcn', 'progress_cards', 'Mercenary', 'Mercenary', 3, 'PROGRESS', 'MILITARY', None),
+    ('Mcs', 'progress_cards', 'Microscope', 'Microscope', 3, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('Mtz', 'progress_cards', 'Montezuma', 'Montezuma', 3, 'PROGRESS', 'ADVISOR', None),
+    ('MghI', 'progress_cards', 'MughalInvasion', 'Mughal Invasion', 3, 'PROGRESS', 'WAR', None),
+    ('NcMc', 'progress_cards', 'NiccoloMachiavelli', 'Niccolo Machiavelli', 3, 'PROGRESS', 'ADVISOR', None),
+    ('Obs', 'progress_cards', 'Observatory', 'Observatory', 3, 'PROGRESS', 'BUILDING', None),
+    ('OsDs', 'progress_cards', 'OresundDues', 'Oresund Dues', 3, 'PROGRESS', 'WONDER', None),
+    ('Plm', 'progress_cards', 'Parliament', 'Parliament', 3, 'PROGRESS', 'BUILDING', None),
+    ('PtGr', 'progress_cards', 'PeterTheGreat', 'Peter the Great', 3, 'PROGRESS', 'ADVISOR', None),
+    ('Plp', 'progress_cards', 'Philippines', 'Philippines', 3, 'PROGRESS', 'COLONY', None),
+    ('Pch', 'progress_cards', 'Pocahontas', 'Pocahontas', 3, 'PROGRESS', 'ADVISOR', None),
+    ('PtPl', 'progress_cards', 'PotalaPalace', 'Potala Palace', 3, 'PROGRESS', 'WONDER', None),
+    ('Pts', 'progress_cards', 'Potosi', 'Potosi', 3, 'PROGRESS', 'BUILDING', None),
+    ('Pcp', 'progress_cards', 'Principia', 'Principia', 3, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('PrPr', 'progress_cards', 'PrintingPress', 'Printing Press', 3, 'PROGRESS', 'BUILDING', None),
+    ('Pvt', 'progress_cards', 'Privateer', 'Privateer', 3, 'PROGRESS', 'MILITARY', None),
+    ('Qbc', 'progress_cards', 'Quebec', 'Quebec', 3, 'PROGRESS', 'COLONY', None),
+    ('Rng', 'progress_cards', 'Ranger', 'Ranger', 3, 'PROGRESS', 'MILITARY', None),
+    ('RdFt', 'progress_cards', 'RedFort', 'Red Fort', 3, 'PROGRESS', 'WONDER', None),
+    ('Rdc', 'progress_cards', 'Redcoat', 'Redcoat', 3, 'PROGRESS', 'MILITARY', None),
+    ('RmJl', 'progress_cards', 'RomeoAndJuliet', 'Romeo and Juliet', 3, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('RySc', 'progress_cards', 'RoyalSociety', 'Royal Society', 3, 'PROGRESS', 'WONDER', None),
+    ('ScAl', 'progress_cards', 'SacrificialAltar', 'Sacrificial Altar', 3, 'PROGRESS', 'BUILDING', None),
+    ('Smr', 'progress_cards', 'Samurai', 'Samurai', 3, 'PROGRESS', 'MILITARY', None),
+    ('Swm', 'progress_cards', 'Sawmill', 'Sawmill', 3, 'PROGRESS', 'BUILDING', None),
+    ('Shp', 'progress_cards', 'Shipyard', 'Shipyard', 3, 'PROGRESS', 'BUILDING', None),
+    ('SRhd', 'progress_cards', 'SiegeOfRhodes', 'Siege of Rhodes', 3, 'PROGRESS', 'BATTLE', None),
+    ('SVnn', 'progress_cards', 'SiegeOfVienna', 'Siege of Vienna', 3, 'PROGRESS', 'BATTLE', None),
+    ('StCp', 'progress_cards', 'SistineChapel', 'Sistine Chapel', 3, 'PROGRESS', 'WONDER', None),
+    ('StAf', 'progress_cards', 'SouthAfrica', 'South Africa', 3, 'PROGRESS', 'COLONY', None),
+    ('SpIl', 'progress_cards', 'SpiceIslands', 'Spice Islands', 3, 'PROGRESS', 'NATURAL_WONDER', None),
+    ('Slm', 'progress_cards', 'SuleimanI', 'Suleiman I', 3, 'PROGRESS', 'ADVISOR', None),
+    ('TjMh', 'progress_cards', 'TajMahal', 'Taj Mahal', 3, 'PROGRESS', 'WONDER', None),
+    ('Tls', 'progress_cards', 'Telescope', 'Telescope', 3, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('TrFm', 'progress_cards', 'TerraceFarming', 'Terrace Farming', 3, 'PROGRESS', 'BUILDING', None),
+    ('TCrb', 'progress_cards', 'TheCaribbean', 'The Caribbean', 3, 'PROGRESS', 'COLONY', None),
+    ('Thr', 'progress_cards', 'Theatre', 'Theatre', 3, 'PROGRESS', 'BUILDING', None),
+    ('Tmm', 'progress_cards', 'Thermometer', 'Thermometer', 3, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('TYW', 'progress_cards', 'ThirtyYearsWar', 'Thirty Years War', 3, 'PROGRESS', 'WAR', None),
+    ('Tkg', 'progress_cards', 'Tokugawa', 'Tokugawa', 3, 'PROGRESS', 'ADVISOR', None),
+    ('Unb', 'progress_cards', 'Uraniborg', 'Uraniborg', 3, 'PROGRESS', 'WONDER', None),
+    ('Vrs', 'progress_cards', 'Versailles', 'Versailles', 3, 'PROGRESS', 'WONDER', None),
+    ('Vgn', 'progress_cards', 'Virginia', 'Virginia', 3, 'PROGRESS', 'COLONY', None),
+    ('WCpr', 'progress_cards', 'WarOfCyprus', 'War of Cyprus', 3, 'PROGRESS', 'WAR', None),
+    ('WJE', 'progress_cards', 'WarOfJenkinsEar', "War of Jenkins' Ear", 3, 'PROGRESS', 'WAR', None),
+    ('AhLc', 'progress_cards', 'AbrahamLincoln', 'Abraham Lincoln', 4, 'PROGRESS', 'ADVISOR', None),
+    ('AfNb', 'progress_cards', 'AlfredNobel', 'Alfred Nobel', 4, 'PROGRESS', 'ADVISOR', None),
+    ('Agr', 'progress_cards', 'Algeria', 'Algeria', 4, 'PROGRESS', 'COLONY', None),
+    ('ACW', 'progress_cards', 'AmericanCivilWar', 'American Civil War', 4, 'PROGRESS', 'WAR', None),
+    ('AAW', 'progress_cards', 'AngloAfghanWar', 'Anglo-Afghan War', 4, 'PROGRESS', 'WAR', None),
+    ('Arl', 'progress_cards', 'Australia', 'Australia', 4, 'PROGRESS', 'COLONY', None),
+    ('BknW', 'progress_cards', 'BalkanWars', 'Balkan Wars', 4, 'PROGRESS', 'WAR', None),
+    ('BAtl', 'progress_cards', 'BattleOfAusterlitz', 'Battle of Austerlitz', 4, 'PROGRESS', 'BATTLE', None),
+    ('BBlc', 'progress_cards', 'BattleOfBalaclava', 'Battle of Balaclava', 4, 'PROGRESS', 'BATTLE', None),
+    ('BBrd', 'progress_cards', 'BattleOfBorodino', 'Battle of Borodino', 4, 'PROGRESS', 'BATTLE', None),
+    ('BTfg', 'progress_cards', 'BattleOfTrafalgar', 'Battle of Trafalgar', 4, 'PROGRESS', 'BATTLE', None),
+    ('BTsm', 'progress_cards', 'BattleOfTsushima', 'Battle of Tsushima', 4, 'PROGRESS', 'BATTLE', None),
+    ('BWtl', 'progress_cards', 'BattleOfWaterloo', 'Battle of Waterloo', 4, 'PROGRESS', 'BATTLE', None),
+    ('BjDr', 'progress_cards', 'BenjaminDisraeli', 'Benjamin Disraeli', 4, 'PROGRESS', 'ADVISOR', None),
+    ('BgBn', 'progress_cards', 'BigBen', 'Big Ben', 4, 'PROGRESS', 'WONDER', None),
+    ('Bxr', 'progress_cards', 'Boxers', 'Boxers', 4, 'PROGRESS', 'MILITARY', None),
+    ('BbGt', 'progress_cards', 'BrandenburgGate', 'Brandenburg Gate', 4, 'PROGRESS', 'WONDER', None),
+    ('BtMs', 'progress_cards', 'BritishMuseum', 'British Museum', 4, 'PROGRESS', 'WONDER', None),
+    ('Cdd', 'progress_cards', 'Candide', 'Candide', 4, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('Cvr', 'progress_cards', 'Cavalry', 'Cavalry', 4, 'PROGRESS', 'MILITARY', None),
+    ('ClMn', 'progress_cards', 'CoalMine', 'Coal Mine', 4, 'PROGRESS', 'BUILDING', None),
+    ('Con', 'progress_cards', 'Congo', 'Congo', 4, 'PROGRESS', 'COLONY', None),
+    ('Cns', 'progress_cards', 'Conscript', 'Conscript', 4, 'PROGRESS', 'MILITARY', None),
+    ('Csk', 'progress_cards', 'Cossack', 'Cossack', 4, 'PROGRESS', 'MILITARY', None),
+    ('CmnW', 'progress_cards', 'CrimeanWar', 'Crimean War', 4, 'PROGRESS', 'WAR', None),
+    ('Crs', 'progress_cards', 'Curassiers', 'Curassiers', 4, 'PROGRESS', 'MILITARY', None),
+    ('DwVy', 'progress_cards', 'DarwinsVoyage', "Darwin's Voyage", 4, 'PROGRESS', 'WONDER', None),
+    ('DsKp', 'progress_cards', 'DasKapital', 'Das Kapital', 4, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('DpSr', 'progress_cards', 'DepartmentStore', 'Department Store', 4, 'PROGRESS', 'BUILDING', None),
+    ('Drn', 'progress_cards', 'Dreadnought', 'Dreadnought', 4, 'PROGRESS', 'MILITARY', None),
+    ('Dnm', 'progress_cards', 'Dynamite', 'Dynamite', 4, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('Etc', 'progress_cards', 'Electricity', 'Electricity', 4, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('EgSl', 'progress_cards', 'EngineeringSchool', 'Engineering School', 4, 'PROGRESS', 'BUILDING', None),
+    ('Fct', 'progress_cards', 'Factory', 'Factory', 4, 'PROGRESS', 'BUILDING', None),
+    ('FsIn', 'progress_cards', 'FashodaIncident', 'Fashoda Incident', 4, 'PROGRESS', 'BATTLE', None),
+    ('FrNg', 'progress_cards', 'FlorenceNightingale', 'Florence Nightingale', 4, 'PROGRESS', 'ADVISOR', None),
+    ('FMC', 'progress_cards', 'FordMotorCompany', 'Ford Motor Company', 4, 'PROGRESS', 'WONDER', None),
+    ('FPW', 'progress_cards', 'FrancoPrussianWar', 'Franco-Prussian War', 4, 'PROGRESS', 'WAR', None),
+    ('FdCp', 'progress_cards', 'FredericChopin', 'Frederic Chopin', 4, 'PROGRESS', 'ADVISOR', None),
+    ('FdGr', 'progress_cards', 'FrederickTheGreat', 'Frederick the Great', 4, 'PROGRESS', 'ADVISOR', None),
+    ('HgKg', 'progress_cards', 'HongKong', 'Hong Kong', 4, 'PROGRESS', 'COLONY', None),
+    ('Hsp', 'progress_cards', 'Hospital', 'Hospital', 4, 'PROGRESS', 'BUILDING', None),
+    ('HdPl', 'progress_cards', 'HydroPlant', 'Hydro Plant', 4, 'PROGRESS', 'BUILDING', None),
+    ('Ind', 'progress_cards', 'India', 'India', 4, 'PROGRESS', 'COLONY', None),
+    ('Klv', 'progress_cards', 'Kalevala', 'Kalevala', 4, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('Lby', 'progress_cards', 'Libya', 'Libya', 4, 'PROGRESS', 'COLONY', None),
+    ('LnZx', 'progress_cards', 'LinZexu', 'Lin Zexu', 4, 'PROGRESS', 'ADVISOR', None),
+    ('MIT', 'progress_cards', 'MIT', 'MIT', 4, 'PROGRESS', 'WONDER', None),
+    ('McGn', 'progress_cards', 'MachineGunner', 'Machine Gunner', 4, 'PROGRESS', 'MILITARY', None),
+    ('MrAn', 'progress_cards', 'MarieAntoinette', 'Marie Antoinette', 4, 'PROGRESS', 'ADVISOR', None),
+    ('MrCr', 'progress_cards', 'MarieCurie', 'Marie Curie', 4, 'PROGRESS', 'ADVISOR', None),
+    ('NplW', 'progress_cards', 'NapoleonicWar', 'Napoleonic War', 4, 'PROGRESS', 'WAR', None),
+    ('NtPk', 'progress_cards', 'NationalPark', 'National Park', 4, 'PROGRESS', 'BUILDING', None),
+    ('Ngr', 'progress_cards', 'Nigeria', 'Nigeria', 4, 'PROGRESS', 'COLONY', None),
+    ('NwPs', 'progress_cards', 'NorthwestPassage', 'Northwest Passage', 4, 'PROGRESS', 'NATURAL_WONDER', None),
+    ('OpmW', 'progress_cards', 'OpiumWar', 'Opium War', 4, 'PROGRESS', 'WAR', None),
+    ('OgSc', 'progress_cards', 'OriginOfSpecies', 'Origin of Species', 4, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('Oak', 'progress_cards', 'Ostafrika', 'Ostafrika', 4, 'PROGRESS', 'COLONY', None),
+    ('PnCl', 'progress_cards', 'PenalColony', 'Penal Colony', 4, 'PROGRESS', 'BUILDING', None),
+    ('Rad', 'progress_cards', 'Radio', 'Radio', 4, 'PROGRESS', 'BUILDING', None),
+    ('Rlr', 'progress_cards', 'Railroad', 'Railroad', 4, 'PROGRESS', 'BUILDING', None),
+    ('Rfm', 'progress_cards', 'Rifleman', 'Rifleman', 4, 'PROGRESS', 'MILITARY', None),
+    ('SBW', 'progress_cards', 'SecondBoerWar', 'Second Boer War', 4, 'PROGRESS', 'WAR', None),
+    ('SwSt', 'progress_cards', 'SewerSystem', 'Sewer System', 4, 'PROGRESS', 'BUILDING', None),
+    ('SkZl', 'progress_cards', 'ShakaZulu', 'Shaka Zulu', 4, 'PROGRESS', 'ADVISOR', None),
+    ('Stt', 'progress_cards', 'Shantytown', 'Shantytown', 4, 'PROGRESS', 'BUILDING', None),
+    ('SmBl', 'progress_cards', 'SimonBolivar', 'Simon Bolivar', 4, 'PROGRESS', 'ADVISOR', None),
+    ('SPE', 'progress_cards', 'SouthPoleExpedition', 'South Pole Expedition', 4, 'PROGRESS', 'WONDER', None),
+    ('SnJn', 'progress_cards', 'SpinningJenny', 'Spinning Jenny', 4, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('StLb', 'progress_cards', 'StatueOfLiberty', 'Statue of Liberty', 4, 'PROGRESS', 'WONDER', None),
+    ('SkEx', 'progress_cards', 'StockExchange', 'Stock Exchange', 4, 'PROGRESS', 'BUILDING', None),
+    ('Sub', 'progress_cards', 'Submarine', 'Submarine', 4, 'PROGRESS', 'MILITARY', None),
+    ('SzCn', 'progress_cards', 'SuezCanal', 'Suez Canal', 4, 'PROGRESS', 'WONDER', None),
+    ('SYkt', 'progress_cards', 'SurrenderAtYorktown', 'Surrender at Yorktown', 4, 'PROGRESS', 'BATTLE', None),
+    ('Ttn', 'progress_cards', 'Titanic', 'Titanic', 4, 'PROGRESS', 'WONDER', None),
+    ('Ttv', 'progress_cards', 'Titusville', 'Titusville', 4, 'PROGRESS', 'NATURAL_WONDER', None),
+    ('Ulr', 'progress_cards', 'Uluru', 'Uluru', 4, 'PROGRESS', 'NATURAL_WONDER', None),
+    ('UTC', 'progress_cards', 'UncleTomsCabin', "Uncle Tom's Cabin", 4, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('UbCt', 'progress_cards', 'UrbanCenter', 'Urban Center', 4, 'PROGRESS', 'BUILDING', None),
+    ('Vcn', 'progress_cards', 'Vaccine', 'Vaccine', 4, 'PROGRESS', 'GOLDEN_AGE', None),
+    ('VtFl', 'progress_cards', 'VictoriaFalls', 'Victoria Falls', 4, 'PROGRESS', 'NATURAL_WONDER', None),
+    ('Vtk', 'progress_cards', 'Voortrekker', 'Voortrekker', 4, 'PROGRESS', 'BUILDING', None),
+    ('WcTw', 'progress_cards', 'WardenclyffeTower', 'Wardenclyffe Tower', 4, 'PROGRESS', 'WONDER', None),
+    ('Zpl', 'progress_cards', 'Zeppelin', 'Zeppelin', 4, 'PROGRESS', 'BUILDING', None),
+    ('Sbr2', 'progress_cards', 'Siberia2', 'Siberia 2', None, 'EXTENSION', 'NATURAL_WONDER', None),
+)
+
+nations = (
+    ('America', 'nations', 'America'),
+    ('Arabs', 'nations', 'Arabs'),
+    ('China', 'nations', 'China'),
+    ('Egypt', 'nations', 'Egypt'),
+    ('Ethiopia', 'nations', 'Ethiopia'),
+    ('Greece', 'nations', 'Greece'),
+    ('India', 'nations', 'India'),
+    ('Japan', 'nations', 'Japan'),
+    ('Korea', 'nations', 'Korea'),
+    ('Mali', 'nations', 'Mali'),
+    ('Mongolia', 'nations', 'Mongolia'),
+    ('Persia', 'nations', 'Persia'),
+    ('Poland', 'nations', 'Poland'),
+    ('Portugal', 'nations', 'Portugal'),
+    ('Rome', 'nations', 'Rome'),
+    ('Venice', 'nations', 'Venice'),
+    ('Vikings', 'nations', 'Vikings'),
+)
+
+aliases = {'AhLc_Nerf': 'AhLc', 'K_S_Nerf': 'K_S'}
@@ -24,16 +24,24 @@ class ProgressCardType(enum.Enum):
     def __str__(self):
         return self.name.replace('_', ' ').lower()
 
-class Card:
+class SlottedCard(type):
+    def __new__(cls, name, bases, namespace):
+        namespace.setdefault('__slots__', ())
+        return super().__new__(cls, name, bases, namespace)
+
+class Card(metaclass=SlottedCard):
+    __slots__ = ('match', 'registered_events', 'static_modifiers', 'owner', 'private_architects_available', 'markers', 'covered_by', 'global_effect')
+
     card_type = None
     starting_card = False
-    production_value = Resources()
+    production_value = FrozenResources()
     golden_age_bonus = 0
     private_architects = 0
 
     def __init__(self, match):
         self.match = match
-        self.registered_events = []
+        self.registered_events = None
+        self.static_modifiers = None
         self.reset()
 
     def __str__(self):
@@ -49,17 +57,35 @@ class Card:
         return False
 
     def register_for_event(self, name, condition, event):
-        self.registered_events.append(name)
-        self.match.events.register(name, self, condition, event)
+        registration = self.match.events.register(name, self, condition, event)
+        if self.registered_events is None:
+            self.registered_events = {}
+        self.registered_events.setdefault(name, []).append(registration)
 
     def unregister_for_event(self, name):
-        self.registered_events.remove(name)
-        self.match.events.unregister(name, self)
+        registrations = self.registered_events[name]
+        registration = registrations.pop(0)
+        if not registrations:
+            del self.registered_events[name]
+        self.match.events.unregister(name, registration)
+
+    def register_static_modifier(self, name, amount):
+        if self.static_modifiers is None:
+            self.static_modifiers = {}
+        self.static_modifiers[name] = self.static_modifiers.get(name, 0) + amount
+        self.match.events.add_static_modifier(name, self.owner, amount)
 
     def unregister_all_events(self):
         self.global_effect = False
-        for name in list(self.registered_events):
-            self.unregister_for_event(name)
+        if self.static_modifiers:
+            for (name, amount) in self.static_modifiers.items():
+                self.match.events.add_static_modifier(name, self.owner, -amount)
+            self.static_modifiers = None
+        if self.registered_events:
+            for (name, registrations) in list(self.registered_events.items()):
+                del self.registered_events[name]
+                for registration in registrations:
+                    self.match.events.unregister(name, registration)
 
     def is_dynasty(self):
         return self.card_type is CardType.DYNASTY
@@ -119,13 +145,17 @@ class Card:
         return self.is_natural_wonder() or self.is_natural_wonder_extension()
 
     def reset(self):
+        self.unregister_all_events()
         self.owner = None
         self.private_architects_available = 0
         self.markers = 0
         self.covered_by = None
-        self.unregister_all_events()
 
     def assign_owner(self, player):
+        if self.static_modifiers:
+            for (name, amount) in self.static_modifiers.items():
+                self.match.events.add_static_modifier(name, self.owner, -amount)
+                self.match.events.add_static_modifier(name, player, amount)
         self.owner = player
         self.private_architects_available = self.private_architects
         self.markers = 0
@@ -0,0 +1,85 @@
+import copyreg
+import io
+import pickle
+
+def live_match():
+    raise pickle.UnpicklingError('A checkpoint can only be restored into its own match.')
+
+class CheckpointUnpickler(pickle.Unpickler):
+    def __init__(self, data, match):
+        super().__init__(io.BytesIO(data))
+        self.match = match
+
+    def find_class(self, module, name):
+        if module == __name__ and name == 'live_match':
+            return self.live_match
+        return super().find_class(module, name)
+
+    def live_match(self):
+        return self.match
+
+def reduce_match(match):
+    return (live_match, ())
+
+def dump_state(match, state):
+    data = io.BytesIO()
+    pickler = pickle.Pickler(data, pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = {**copyreg.dispatch_table, type(match): reduce_match}
+    pickler.dump(state)
+    return data.getvalue()
+
+def load_state(match, data):
+    return CheckpointUnpickler(data, match).load()
+
+class Checkpoints:
+    def __init__(self, match, interval=None):
+        if interval is not None and interval < 1:
+            raise ValueError('Checkpoint interval must be at least 1 move.')
+        self.match = match
+        self.interval = interval
+        self.checkpoints = {}
+
+    def fork(self, match):
+        checkpoints = Checkpoints(match, self.interval)
+        checkpoints.checkpoints = self.checkpoints.copy()
+        return checkpoints
+
+    def latest(self, moves):
+        return max((checkpoint_moves for checkpoint_moves in self.checkpoints if checkpoint_moves <= moves), default=None)
+
+    def due(self, moves):
+        if self.interval is None:
+            return False
+        latest = self.latest(moves)
+        return latest is None or moves - latest >= self.interval
+
+    def save(self, moves, state):
+        if moves in self.checkpoints:
+            return
+        self.checkpoints[moves] = dump_state(self.match, state)
+
+    def load(self, moves):
+        return load_state(self.match, self.checkpoints[moves])
+
+    def discard_after(self, moves):
+        for checkpoint_moves in [checkpoint_moves for checkpoint_moves in self.checkpoints if checkpoint_moves > moves]:
+            del self.checkpoints[checkpoint_moves]
+
+class NoCheckpoints:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def fork(self, match):
+        return self
+
+    def latest(self, moves):
+        return None
+
+    def due(self, moves):
+        return False
+
+    def save(self, moves, state):
+        pass
+
+    def discard_after(self, moves):
+        pass
@@ -27,13 +27,17 @@ class NationsCLI:
                 return options[option_number]
 
     def logger(self, message):
-        print(message)
+        if self.verbose:
+            print(message)
+        if self.log_sink is not None:
+            self.log_sink(message)
 
-    def __init__(self, player_names=None, seed=None, replay=None, quit_after_replay=False, verbose=True, rules={}, stats=None):
+    def __init__(self, player_names=None, seed=None, replay=None, quit_after_replay=False, verbose=True, rules={}, stats=None, checkpoints=True, round_hashes=False, replay_sink=None, log_sink=None, event_profiler=None, check_card_views=False):
         self.verbose = verbose
         self.quit_after_replay = quit_after_replay
-        logger = self.logger if verbose else None
-        self.match = match.Match(player_names=player_names, seed=seed, replay=replay, move_getter=self.get_move_prompt, logger=logger, rules=rules, stats=stats)
+        self.log_sink = log_sink
+        logger = self.logger if verbose or log_sink is not None else None
+        self.match = match.Match(player_names=player_names, seed=seed, replay=replay, move_getter=self.get_move_prompt, logger=logger, rules=rules, stats=stats, checkpoints=checkpoints, round_hashes=round_hashes, replay_sink=replay_sink, event_profiler=event_profiler, check_card_views=check_card_views)
 
     def nation_board(self, nation):
         s = f'{nation.name}:\n'
@@ -266,11 +270,23 @@ class NationsCLI:
         if exception is not None:
             raise exception
 
-    def get_replay(self):
-        return self.match.get_replay()
+    def get_replay(self, hashes=False, since=0):
+        return self.match.get_replay(hashes=hashes, since=since)
+
+    def get_log(self, since=0):
+        return self.match.get_log(since=since)
+
+    def replay_position(self):
+        return self.match.replay_position()
 
-    def get_log(self):
-        return self.match.get_log()
+    def log_position(self):
+        return self.match.log_position()
 
     def get_state(self):
         return self.match.get_state()
+
+    def get_state_json(self):
+        return self.match.get_state_json()
+
+    def get_state_delta(self, since_version=None):
+        return self.match.get_state_delta(since_version)
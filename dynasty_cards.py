@@ -4,7 +4,7 @@ from .actions import *
 
 class DynastyCard(Card):
     card_type = CardType.DYNASTY
-    production_value = Resources()
+    production_value = FrozenResources()
 
     def play(self):
         pass
@@ -45,16 +45,16 @@ class DemocraticRepublicans(DynastyCard):
             player.resources[Resource.STABILITY] -= 2
             dynasty_cards = player.dynasty_cards()
             if len(dynasty_cards) == 1:
-                self.match.log(f'[{self}] {player} takes a turmoil card and must play the remaining dynasty.')
+                self.match.log('[{}] {} takes a turmoil card and must play the remaining dynasty.', self, player)
                 card = dynasty_cards[0]
             else:
-                self.match.log(f'[{self}] {player} takes a turmoil card and must play a dynasty.')
+                self.match.log('[{}] {} takes a turmoil card and must play a dynasty.', self, player)
                 card = self.match.get_move(player, 'Play which dynasty?', dynasty_cards)
             player.play_dynasty(card)
             if player.need_confirmation:
                 self.match.get_move(player, 'Confirm?', ('Confirm',))
         books = 3 * len(eligible_players)
-        self.match.log(f'[{self}] {self.owner} gains {books} [Books].')
+        self.match.log('[{}] {} gains {} [Books].', self, self.owner, books)
         self.owner.resources[Resource.BOOKS] += books
 
 class FederalistParty(DynastyCard):
@@ -69,7 +69,7 @@ class FederalistParty(DynastyCard):
         return player is self.owner and kwargs['card'].is_building()
 
     def gain_stone(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 2 [Stone].')
+        self.match.log('[{}] {} gains 2 [Stone].', self, player)
         player.resources[Resource.STONE] += 2
 
 class AbbasidCaliphate(DynastyCard):
@@ -88,7 +88,7 @@ class AbbasidCaliphate(DynastyCard):
 
     def may_buy_point(self, player, **kwargs):
         card = kwargs['card']
-        self.match.log(f'[{self}] {self.owner} may buy the [Point] from "{card}".')
+        self.match.log('[{}] {} may buy the [Point] from "{}".', self, self.owner, card)
         options = [ConfirmAction()]
         if player.remaining_main_actions <= 1:
             options.append(ConfirmCompleteAction())
@@ -109,7 +109,7 @@ class UmayyadCaliphate(DynastyCard):
 
     def colony_discount(self, player, **kwargs):
         if not kwargs.get('check', False):
-            self.match.log(f'[{self}] {player} requires 4 [Military] less to buy colonies.')
+            self.match.log('[{}] {} requires 4 [Military] less to buy colonies.', self, player)
         return 4
 
 class MingDynasty(DynastyCard):
@@ -121,7 +121,7 @@ class MingDynasty(DynastyCard):
         self.register_for_event('take worker', self.owned, self.gain_food)
 
     def gain_food(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 4 [Food].')
+        self.match.log('[{}] {} gains 4 [Food].', self, player)
         player.resources[Resource.FOOD] += 4
 
 class QinDynasty(DynastyCard):
@@ -136,7 +136,7 @@ class QinDynasty(DynastyCard):
         self.markers += 1
         player.return_worker(no_confirmation=True)
         card = player.wonders_under_construction[0]
-        self.match.log(f'[{self}] {player} hires a free architect for "{card}".')
+        self.match.log('[{}] {} hires a free architect for "{}".', self, player, card)
         player.hire_free_architect(card)
 
 class OldKingdom(DynastyCard):
@@ -152,32 +152,29 @@ class OldKingdom(DynastyCard):
 
     def remove_marker(self, player, **kwargs):
         if self.markers:
-            self.match.log(f'[{self}] {player} removes 1 [Marker].')
+            self.match.log('[{}] {} removes 1 [Marker].', self, player)
             self.markers -= 1
         else:
-            self.match.log(f'[{self}] no [Markers] to remove.')
+            self.match.log('[{}] no [Markers] to remove.', self)
 
     def action_available(self, player):
         return player is self.owner and player.removable_advisor_cards()
 
     def activate(self, player):
-        cards = player.removable_advisor_cards()
-        for card in cards[:]:
-            if card.covered_by is not None:
-                cards.remove(card)
+        cards = [card for card in player.removable_advisor_cards() if card.covered_by is None]
         if len(cards) == 1:
             card = cards[0]
         else:
             card = self.match.get_move(player, 'Remove which advisor?', cards)
-        self.match.log(f'[{self}] {player} removes "{card}".')
+        self.match.log('[{}] {} removes "{}".', self, player, card)
         player.remove(card)
         self.markers += 1
 
     def produce(self, projected=False):
-        production = self.production_value.production()
+        production = self.production_value.production().copy()
         books = 2 * self.markers
         if not projected:
-            self.match.log(f'[{self}] {self.owner} produces an extra {books} [Books].')
+            self.match.log('[{}] {} produces an extra {} [Books].', self, self.owner, books)
         production[Resource.BOOKS] += books
         return production
 
@@ -194,11 +191,13 @@ class NewKingdom(DynastyCard):
 
     def card_discount(self, player, **kwargs):
         if not kwargs.get('check', False):
-            self.match.log(f'[{self}] {player} pays up to 2 [Gold] less for battles.')
+            self.match.log('[{}] {} pays up to 2 [Gold] less for battles.', self, player)
         return 2
 
 class AxumiteKingdom(DynastyCard):
     """After revealing Events: Place 1 [Marker] on a card on Progress board; If Others buy this card: They must pay you 3 [Gold]"""
+    __slots__ = ('marked_cards',)
+
     name = 'Axumite Kingdom'
     abbr = 'Et_AK'
 
@@ -222,7 +221,7 @@ class AxumiteKingdom(DynastyCard):
         choice = self.match.get_move(player, 'Mark which progress card?', tuple(possible_marks.keys()))
         card = possible_marks[choice]
         self.marked_cards.append(card)
-        self.match.log(f'[{self}] {player} marks "{card}".')
+        self.match.log('[{}] {} marks "{}".', self, player, card)
         self.match.get_move(player, 'Confirm?', ('Confirm',))
 
     def other_buying_marked(self, player, **kwargs):
@@ -233,7 +232,7 @@ class AxumiteKingdom(DynastyCard):
 
     def pay_owner(self, player, **kwargs):
         card = kwargs['card']
-        self.match.log(f'[{self}] {player} pays {self.owner} 3 [Gold] for buying "{card}".')
+        self.match.log('[{}] {} pays {} 3 [Gold] for buying "{}".', self, player, self.owner, card)
         player.resources[Resource.GOLD] -= 3
         self.owner.resources[Resource.GOLD] += 3
 
@@ -255,6 +254,8 @@ class AxumiteKingdom(DynastyCard):
 
 class Sheba(DynastyCard):
     """Buy Colony: No upkeep for Military [Workers] this round"""
+    __slots__ = ('bought_colony',)
+
     name = 'Sheba'
     abbr = 'Et_Sb'
 
@@ -269,7 +270,7 @@ class Sheba(DynastyCard):
         return player is self.owner and not self.bought_colony and kwargs['card'].is_colony()
 
     def remove_upkeep(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} has no upkeep for military [Workers] this round.')
+        self.match.log('[{}] {} has no upkeep for military [Workers] this round.', self, player)
         self.bought_colony = True
         for card in self.owner.military_cards():
             self.owner.resources -= card.deployed_workers * card.production_per_worker.immediate().negative()
@@ -297,11 +298,13 @@ class Athens(DynastyCard):
         return player is self.owner and player in self.match.most_least_of_resource(Resource.BOOKS)[0]
 
     def gain_gold(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 3 [Gold].')
+        self.match.log('[{}] {} gains 3 [Gold].', self, player)
         player.resources[Resource.GOLD] += 3
 
 class Sparta(DynastyCard):
     """Exactly 1 Military [Worker]: +4 [Military]"""
+    __slots__ = ('active',)
+
     name = 'Sparta'
     abbr = 'G_St'
 
@@ -317,18 +320,18 @@ class Sparta(DynastyCard):
             military_workers += card.deployed_workers
         if not self.active and military_workers == 1:
             self.active = True
-            self.match.log(f'[{self}] {player} gains 4 [Military].')
+            self.match.log('[{}] {} gains 4 [Military].', self, player)
             player.resources[Resource.MILITARY] += 4
         elif self.active and military_workers != 1:
             self.active = False
-            self.match.log(f'[{self}] {player} loses 4 [Military].')
+            self.match.log('[{}] {} loses 4 [Military].', self, player)
             player.resources[Resource.MILITARY] -= 4
 
     def is_self_and_active(self, player, **kwargs):
         return player is self.owner and kwargs['card'] is self and self.active
 
     def remove_bonus(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} loses 4 [Military].')
+        self.match.log('[{}] {} loses 4 [Military].', self, player)
         player.resources[Resource.MILITARY] -= 4
 
 class MauryanEmpire(DynastyCard):
@@ -362,7 +365,7 @@ class MughalEmpire(DynastyCard):
         self.register_for_event('wonder ready', self.owned, self.gain_point)
 
     def gain_point(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 1 [Point].')
+        self.match.log('[{}] {} gains 1 [Point].', self, player)
         player.points += 1
 
 class EdoPeriod(DynastyCard):
@@ -375,7 +378,7 @@ class EdoPeriod(DynastyCard):
         self.register_for_event('may not buy card', self.buying_colony_or_natural_wonder, self.invalid_move)
 
     def log_effect(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} has no effect from being defeated.')
+        self.match.log('[{}] {} has no effect from being defeated.', self, player)
         return True
 
     def buying_colony_or_natural_wonder(self, player, **kwargs):
@@ -404,11 +407,13 @@ class HeianPeriod(DynastyCard):
         self.register_for_event('golden age choose books', self.owned, self.gain_books)
 
     def gain_books(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 4 [Books].')
+        self.match.log('[{}] {} gains 4 [Books].', self, player)
         player.resources[Resource.BOOKS] += 4
 
 class JoseonKingdom(DynastyCard):
     """Action, 1 per round: Place up to 3 [Food] / [Stone] / [Gold] here; After Resolution Phase: [Food] / [Stone] / [Gold] x2 and take them back"""
+    __slots__ = ('resources',)
+
     name = 'Joseon Kingdom'
     abbr = 'K_JK'
 
@@ -424,7 +429,7 @@ class JoseonKingdom(DynastyCard):
 
     def gain_twice_resources(self, player, **kwargs):
         resources = 2 * self.resources
-        self.match.log(f'[{self}] {player} gains {resources} back.')
+        self.match.log('[{}] {} gains {} back.', self, player, resources)
         player.resources += resources
         self.resources = Resources()
 
@@ -440,7 +445,7 @@ class JoseonKingdom(DynastyCard):
         for gold in range(1, min(3, player.resources[Resource.GOLD]) + 1):
             options.append(Resources({Resource.GOLD: gold}))
         choice = self.match.get_move(player, 'Place which resources?', options)
-        self.match.log(f'[{self}] {player} places {choice}.')
+        self.match.log('[{}] {} places {}.', self, player, choice)
         had_gold = player.resources[Resource.GOLD] > 0
         player.resources -= choice
         self.resources = choice
@@ -463,7 +468,7 @@ class KoryoKingdom(DynastyCard):
 
     def extra_war_military(self, player, **kwargs):
         extra = 3 * sum(card.deployed_workers for card in player.military_cards())
-        self.match.log(f'[{self}] {player} has an extra {extra} [Military] against war.')
+        self.match.log('[{}] {} has an extra {} [Military] against war.', self, player, extra)
         return extra
 
 class MaliEmpire(DynastyCard):
@@ -475,15 +480,12 @@ class MaliEmpire(DynastyCard):
         return player is self.owner and player.removable_advisor_cards() and player.resources[Resource.GOLD] >= 2
 
     def activate(self, player):
-        cards = player.removable_advisor_cards()
-        for card in cards[:]:
-            if card.covered_by is not None:
-                cards.remove(card)
+        cards = [card for card in player.removable_advisor_cards() if card.covered_by is None]
         if len(cards) == 1:
             card = cards[0]
         else:
             card = self.match.get_move(player, 'Remove which advisor?', cards)
-        self.match.log(f'[{self}] {player} pays 2 [Gold] to remove "{card}" and gain 3 [Books] and 1 [Point].')
+        self.match.log('[{}] {} pays 2 [Gold] to remove "{}" and gain 3 [Books] and 1 [Point].', self, player, card)
         player.resources += Resources({Resource.GOLD: -2, Resource.BOOKS: 3})
         player.points += 1
         if player.resources[Resource.GOLD] == 0:
@@ -503,7 +505,7 @@ class SonghaiEmpire(DynastyCard):
         return player is not self.owner and player.least_military
 
     def extra_famine(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} loses 3 [Food] extra.')
+        self.match.log('[{}] {} loses 3 [Food] extra.', self, player)
         return -3
 
 class GoldenHorde(DynastyCard):
@@ -519,7 +521,7 @@ class GoldenHorde(DynastyCard):
 
     def gain_gold(self, player, **kwargs):
         gold = kwargs['gold']
-        self.match.log(f'[{self}] {self.owner} gains {gold} [Gold].')
+        self.match.log('[{}] {} gains {} [Gold].', self, self.owner, gold)
         self.owner.resources[Resource.GOLD] += gold
 
 class YuanDynasty(DynastyCard):
@@ -537,6 +539,8 @@ class YuanDynasty(DynastyCard):
 
 class AchaemenidEmpire(DynastyCard):
     """Growth: Take [Worker]: 1st action: May deploy the new [Worker] for free"""
+    __slots__ = ('took_growth_worker',)
+
     name = 'Achaemenid Empire'
     abbr = 'Ps_AE'
 
@@ -562,9 +566,9 @@ class AchaemenidEmpire(DynastyCard):
             return kwargs['cost']
         answer = self.match.get_move(player, 'Deploy for free?', ('Yes', 'No'))
         if answer == 'Yes':
-            self.match.log(f'[{self}] {player} deploys for free.')
+            self.match.log('[{}] {} deploys for free.', self, player)
             return kwargs['cost']
-        self.match.log(f'[{self}] {player} declines to deploy for free.')
+        self.match.log('[{}] {} declines to deploy for free.', self, player)
         return 0
 
 class SassanidEmpire(DynastyCard):
@@ -577,11 +581,13 @@ class SassanidEmpire(DynastyCard):
         self.register_for_event('discard gold turmoil', self.owned, self.log_effect)
 
     def log_effect(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} discards the turmoil card.')
+        self.match.log('[{}] {} discards the turmoil card.', self, player)
         return True
 
 class JagellonianDynasty(DynastyCard):
     """Before Progress: May pay 1 [Gold] to 1st player (2nd player if first) to take an extra Action before all other players"""
+    __slots__ = ('paid',)
+
     name = 'Jagellonian Dynasty'
     abbr = 'Pl_JD'
 
@@ -598,17 +604,17 @@ class JagellonianDynasty(DynastyCard):
             payee = self.match.players[1]
         else:
             payee = self.match.players[0]
-        self.match.log(f'[{self}] {player} may pay 1 [Gold] to {payee} to take an extra action before all other players.')
+        self.match.log('[{}] {} may pay 1 [Gold] to {} to take an extra action before all other players.', self, player, payee)
         answer = self.match.get_move(player, f'Pay 1 [Gold] to {payee} to take an extra action before all other players?', ('Yes', 'No'))
         if answer == 'Yes':
-            self.match.log(f'[{self}] {player} pays.')
+            self.match.log('[{}] {} pays.', self, player)
             player.resources[Resource.GOLD] -= 1
             payee.resources[Resource.GOLD] += 1
             self.paid = True
             if player.resources[Resource.GOLD] == 0:
                 self.match.events.happen('spent last gold', player)
         else:
-            self.match.log(f'[{self}] {player} declines.')
+            self.match.log('[{}] {} declines.', self, player)
         self.match.get_move(player, 'Confirm?', ('Confirm',))
 
     def paid_for_extra_action(self, player, **kwargs):
@@ -664,7 +670,7 @@ class PolishLithuanianCommonwealth(DynastyCard):
 
     def buy_wonderful_advisor(self, player, **kwargs):
         card = kwargs['card']
-        self.match.log(f'{player} pays 3 [Gold] to {self.owner} to buy "{card}".')
+        self.match.log('{} pays 3 [Gold] to {} to buy "{}".', player, self.owner, card)
         player.resources[Resource.GOLD] -= 3
         self.owner.resources[Resource.GOLD] += 3
         self.owner.remove(card)
@@ -684,24 +690,24 @@ class KingdomOfLeon(DynastyCard):
         return player is self.owner and kwargs['card'].is_war()
 
     def effect_of_buying_battle(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains effects of buying a battle.')
+        self.match.log('[{}] {} gains effects of buying a battle.', self, player)
         player.do_battle(allow_no_raid=True)
         card = kwargs['card']
-        card.progress_card_type = ProgressCardType.BATTLE
+        card.counts_as_battle = True
         self.match.events.happen('buying card', player, card=card)
-        card.progress_card_type = ProgressCardType.WAR
+        card.counts_as_battle = False
 
     def effect_of_bought_battle(self, player, **kwargs):
         card = kwargs['card']
-        card.progress_card_type = ProgressCardType.BATTLE
+        card.counts_as_battle = True
         self.match.events.happen('bought card', player, card=card)
-        card.progress_card_type = ProgressCardType.WAR
+        card.counts_as_battle = False
 
     def effect_of_after_bought_battle(self, player, **kwargs):
         card = kwargs['card']
-        card.progress_card_type = ProgressCardType.BATTLE
+        card.counts_as_battle = True
         self.match.events.happen('after bought card', player, card=card)
-        card.progress_card_type = ProgressCardType.WAR
+        card.counts_as_battle = False
 
 class PortugeseEmpire(DynastyCard):
     """Buy Colony: May place on a Wonder space"""
@@ -727,14 +733,14 @@ class RomanEmpire(DynastyCard):
     abbr = 'R_RE'
 
     def produce(self, projected=False):
-        production = self.production_value.production()
+        production = self.production_value.production().copy()
         if self.owner.most_military and self.owner.most_stability:
             if not projected:
-                self.match.log(f'[{self}] {self.owner} gains 1 [Point].')
+                self.match.log('[{}] {} gains 1 [Point].', self, self.owner)
                 self.owner.points += 1
         elif self.owner.most_stability:
             if not projected:
-                self.match.log(f'[{self}] {self.owner} produces an extra 2 [Books].')
+                self.match.log('[{}] {} produces an extra 2 [Books].', self, self.owner)
             production[Resource.BOOKS] += 2
         return production
 
@@ -750,7 +756,7 @@ class RomanRepublic(DynastyCard):
         return player is self.owner and self.match.architects
 
     def activate(self, player):
-        self.match.log(f'[{self}] {player} discards 1 [Architect] and gains 1 [Stability].')
+        self.match.log('[{}] {} discards 1 [Architect] and gains 1 [Stability].', self, player)
         self.markers += 1
         self.match.architects -= 1
         player.resources[Resource.STABILITY] += 1
@@ -759,7 +765,7 @@ class RomanRepublic(DynastyCard):
         return player is self.owner and self.markers
 
     def reduce_stability(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} loses {self.markers} [Stability].')
+        self.match.log('[{}] {} loses {} [Stability].', self, player, self.markers)
         player.resources[Resource.STABILITY] -= self.markers
         self.markers = 0
 
@@ -776,7 +782,7 @@ class DomainsOfTheSea(DynastyCard):
 
     def gain_point_and_gold(self, player, **kwargs):
         card = kwargs['card']
-        self.match.log(f'[{self}] {player} discards "{card}" and gains 1 [Point] and 2 [Gold].')
+        self.match.log('[{}] {} discards "{}" and gains 1 [Point] and 2 [Gold].', self, player, card)
         player.points += 1
         player.resources[Resource.GOLD] += 2
         return True
@@ -794,7 +800,7 @@ class PactumWarmundi(DynastyCard):
         return player is not self.owner and (card.is_battle() or card.is_colony())
 
     def gain_gold(self, player, **kwargs):
-        self.match.log(f'[{self}] {self.owner} gains 1 [Gold].')
+        self.match.log('[{}] {} gains 1 [Gold].', self, self.owner)
         self.owner.resources[Resource.GOLD] += 1
 
 class Normans(DynastyCard):
@@ -803,10 +809,7 @@ class Normans(DynastyCard):
     abbr = 'Vk_Nm'
 
     def play(self):
-        self.register_for_event('extra raid value', self.owned, self.extra_raid_value)
-
-    def extra_raid_value(self, player, **kwargs):
-        return 3
+        self.register_static_modifier('extra raid value', 3)
 
 class Varangians(DynastyCard):
     """Buy Advisor: +4 [Books]"""
@@ -820,5 +823,5 @@ class Varangians(DynastyCard):
         return player is self.owner and kwargs['card'].is_advisor()
 
     def gain_books(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 4 [Books].')
+        self.match.log('[{}] {} gains 4 [Books].', self, player)
         player.resources[Resource.BOOKS] += 4
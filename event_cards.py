@@ -8,13 +8,10 @@ from .actions import *
 class EventCard(Card):
     card_type = CardType.EVENT
 
-    def __init__(self, match):
-        super().__init__(match)
-        self.name = self.name()
-
-    @classmethod
-    def name(cls):
-        return f'{cls.name_a}; {cls.name_b}'
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, 'name_a'):
+            cls.name = f'{cls.name_a}; {cls.name_b}'
 
     def __str__(self):
         return self.name
@@ -23,10 +20,10 @@ class EventCard(Card):
         pass
 
     def happen(self):
-        self.match.log(f'[{self.name_a}] {self.effect_a}')
+        self.match.log('[{}] {}', self.name_a, self.effect_a, kind='event_effect')
         self.happen_a()
         self.match.update_most_least_stability_military()
-        self.match.log(f'[{self.name_b}] {self.effect_b}')
+        self.match.log('[{}] {}', self.name_b, self.effect_b, kind='event_effect')
         self.happen_b()
         self.match.update_most_least_stability_military()
 
@@ -62,17 +59,17 @@ class EventCard(Card):
 
     def players_gain_point(self, players):
         for player in players:
-            self.match.log(f'{player} gains 1 [Point].')
+            self.match.log('{} gains 1 [Point].', player)
             player.points += 1
 
     def players_gain_resources(self, players, resources):
         for player in players:
-            self.match.log(f'{player} gains {resources}.')
+            self.match.log('{} gains {}.', player, resources)
             player.resources += resources
 
     def players_lose_resources(self, players, resources):
         for player in players:
-            self.match.log(f'{player} loses {-resources}.')
+            self.match.log('{} loses {}.', player, -resources)
             player.lose_resources(resources)
 
     def may_pay_to_gain(self, pay, gain):
@@ -80,20 +77,20 @@ class EventCard(Card):
             if player.resources >= pay:
                 answer = self.match.get_move(player, f'Pay {pay} to gain {gain}?', ('Yes', 'No'))
                 if answer == 'Yes':
-                    self.match.log(f'{player} pays {pay} and gains {gain}.')
+                    self.match.log('{} pays {} and gains {}.', player, pay, gain)
                     player.resources -= pay
                     player.resources += gain
                 else:
-                    self.match.log(f'{player} declines.')
+                    self.match.log('{} declines.', player)
                 self.match.get_move(player, 'Confirm?', ('Confirm',))
             else:
-                self.match.log(f'{player} does not have at least {pay}.')
+                self.match.log('{} does not have at least {}.', player, pay)
 
     def least_stability_goes_last_and_loses_resources(self, resources):
         least_stability = self.match.least_stability()
         if len(least_stability) == 1:
             player = least_stability[0]
-            self.match.log(f'{player} goes last.')
+            self.match.log('{} goes last.', player)
             self.match.players.remove(player)
             self.match.players.append(player)
         else:
@@ -102,7 +99,7 @@ class EventCard(Card):
                 players = f'{least_stability[0]} and {least_stability[1]}'
             else:
                 players = ', '.join(f'{player}' for player in least_stability[:-1]) + f', and {least_stability[-1]}'
-            self.match.log(f'{players} go last.')
+            self.match.log('{} go last.', players)
             self.match.players = [player for player in self.match.players if player not in least_stability] + least_stability
             least_stability = least_stability[::-1]
         self.players_lose_resources(least_stability, resources)
@@ -129,10 +126,12 @@ class AryanMigrationCodeOfHammurabi(Age1EventCard):
         else:
             for player in self.match.players[::-1]:
                 if player not in least_stability:
-                    self.match.log(f'{player} gains 3 [Food].')
+                    self.match.log('{} gains 3 [Food].', player)
                     player.resources[Resource.FOOD] += 3
 
 class AssyrianDeportationsJainAscetism(Age1EventCard):
+    __slots__ = ('points_lost_to_war',)
+
     name_a = 'Assyrian deportations'
     name_b = 'Jain Ascetism'
     effect_a = 'Least [Military]: Return 1 [Worker]'
@@ -155,19 +154,19 @@ class AssyrianDeportationsJainAscetism(Age1EventCard):
     def happen_a(self):
         for player in self.match.least_military():
             if player.grown_workers:
-                self.match.log(f'{player} must return 1 [Worker].')
+                self.match.log('{} must return 1 [Worker].', player)
                 player.return_worker()
             else:
-                self.match.log(f'{player} has no workers to return.')
+                self.match.log('{} has no workers to return.', player)
 
     def happen_b(self):
         for player in self.most_stability():
             if player.name in self.points_lost_to_war:
                 points = self.points_lost_to_war[player.name]
-                self.match.log(f'{player} regains the {points} [Point{s_if_not_1(points)}] lost to war.')
+                self.match.log('{} regains the {} [Point{}] lost to war.', player, points, s_if_not_1(points))
                 player.points += points
             else:
-                self.match.log(f'{player} did not lose any points to war.')
+                self.match.log('{} did not lose any points to war.', player)
 
 class AttilaZoroastrianRevival(Age1EventCard):
     name_a = 'Attila'
@@ -196,12 +195,12 @@ class AttilaZoroastrianRevival(Age1EventCard):
             if '[Stone]' in choice:
                 for player in self.match.players[::-1]:
                     if player in most_stability:
-                        self.match.log(f'{player} gains 4 [Stone].')
+                        self.match.log('{} gains 4 [Stone].', player)
                         player.resources[Resource.STONE] += 4
             else:
                 for player in self.match.players[::-1]:
                     if player not in most_stability:
-                        self.match.log(f'{player} loses 3 [Food].')
+                        self.match.log('{} loses 3 [Food].', player)
                         player.lose_resources(Resources({Resource.FOOD: -3}))
             self.match.get_move(choosing_player, 'Confirm?', ('Confirm',))
 
@@ -234,7 +233,7 @@ class HellenismAshokasConversion(Age1EventCard):
         self.players_gain_resources(most_military, Resources({Resource.STONE: 2}))
         for player in self.match.players[::-1]:
             if player not in most_military:
-                self.match.log(f'{player} loses 2 [Food].')
+                self.match.log('{} loses 2 [Food].', player)
                 player.lose_resources(Resources({Resource.FOOD: -2}))
 
     def happen_b(self):
@@ -244,7 +243,7 @@ class HellenismAshokasConversion(Age1EventCard):
         for player in self.match.players[::-1]:
             possible_undeploys = military_undeploys(player)
             if not possible_undeploys:
-                self.match.log(f'{player} has no military [Workers].')
+                self.match.log('{} has no military [Workers].', player)
             else:
                 undeployed = False
                 while possible_undeploys:
@@ -253,11 +252,11 @@ class HellenismAshokasConversion(Age1EventCard):
                         break
                     undeployed = True
                     player.undeploy_action(undeploy)
-                    self.match.log(f'{player} gains 2 [Books].')
+                    self.match.log('{} gains 2 [Books].', player)
                     player.resources[Resource.BOOKS] += 2
                     possible_undeploys = military_undeploys(player)
                 if not undeployed:
-                    self.match.log(f'{player} declines.')
+                    self.match.log('{} declines.', player)
                 self.match.get_move(player, 'Confirm?', ('Confirm',))
 
 class PaxRomanaHandynasty(Age1EventCard):
@@ -278,13 +277,13 @@ class PaxRomanaHandynasty(Age1EventCard):
                 answer = self.match.get_move(player, 'Take 1 [Worker] and gain 3 [Food]?', ('Yes', 'No'))
                 if answer == 'Yes':
                     player.take_worker()
-                    self.match.log(f'{player} gains 3 [Food].')
+                    self.match.log('{} gains 3 [Food].', player)
                     player.resources[Resource.FOOD] += 3
                 else:
-                    self.match.log(f'{player} declines.')
+                    self.match.log('{} declines.', player)
                 self.match.get_move(player, 'Confirm?', ('Confirm',))
             else:
-                self.match.log(f'{player} has no remaining [Workers] to take.')
+                self.match.log('{} has no remaining [Workers] to take.', player)
 
 class QinUnificationOlympicGames(Age1EventCard):
     name_a = 'Qin Unification'
@@ -302,7 +301,7 @@ class QinUnificationOlympicGames(Age1EventCard):
             any_benefit = False
             for player in self.match.players[::-1]:
                 if player.resources[Resource.MILITARY] > self.match.war_value:
-                    self.match.log(f'{player} gains 1 [Point].')
+                    self.match.log('{} gains 1 [Point].', player)
                     player.points += 1
                     any_benefit = True
             if not any_benefit:
@@ -312,16 +311,18 @@ class QinUnificationOlympicGames(Age1EventCard):
         most_stability = self.most_stability()
         if len(most_stability) == 1:
             player = most_stability[0]
-            self.match.log(f'{player} goes first.')
+            self.match.log('{} goes first.', player)
             self.match.players.remove(player)
             self.match.players.insert(0, player)
         elif len(most_stability) == 2:
             self.sort_players(most_stability, Resource.STABILITY)
             players = f'{most_stability[0]} and {most_stability[1]}'
-            self.match.log(f'{players} go first.')
+            self.match.log('{} go first.', players)
             self.match.players = most_stability + [player for player in self.match.players if player not in most_stability]
 
 class RigvedaExodus(Age1EventCard):
+    __slots__ = ('prev_card', 'wars_battles_bought')
+
     name_a = 'Rigveda'
     name_b = 'Exodus'
     effect_a = 'All: +1 [Book] per War and Battle one bought this round'
@@ -354,7 +355,7 @@ class RigvedaExodus(Age1EventCard):
             for player in self.match.players[::-1]:
                 if player.name in self.wars_battles_bought:
                     books = self.wars_battles_bought[player.name]
-                    self.match.log(f'{player} gains {books} [Book{s_if_not_1(books)}].')
+                    self.match.log('{} gains {} [Book{}].', player, books, s_if_not_1(books))
                     player.resources[Resource.BOOKS] += books
 
     def happen_b(self):
@@ -377,14 +378,14 @@ class SeaPeoplesBronzeAgeCollapse(Age1EventCard):
             if has_architect and has_points:
                 choice = self.match.get_move(player, 'Remove [Architect] or -1 [Point]?', ('Remove [Architect]', '-1 [Point]'))
                 if choice == 'Remove [Architect]':
-                    self.match.log(f'{player} removes [Architect].')
+                    self.match.log('{} removes [Architect].', player)
                     player.wonders_under_construction[0].completed_stages -= 1
                 else:
-                    self.match.log(f'{player} loses 1 [Point].')
+                    self.match.log('{} loses 1 [Point].', player)
                     player.points -= 1
                 self.match.get_move(player, 'Confirm?', ('Confirm',))
             elif has_architect:
-                self.match.log(f'{player} removes [Architect].')
+                self.match.log('{} removes [Architect].', player)
                 player.wonders_under_construction[0].completed_stages -= 1
             else:
                 player.lose_point()
@@ -427,7 +428,7 @@ class TaoismPhilosophy(Age1EventCard):
     def happen_a(self):
         for player in self.match.players[::-1]:
             if player.passed_first:
-                self.match.log(f'{player} gains 3 [Books].')
+                self.match.log('{} gains 3 [Books].', player)
                 player.resources[Resource.BOOKS] += 3
 
     def happen_b(self):
@@ -480,7 +481,7 @@ class BlackDeathHuntForPresterJohn(Age2EventCard):
             if player.grown_workers:
                 player.return_worker()
             else:
-                self.match.log(f'{player} has no workers to return.')
+                self.match.log('{} has no workers to return.', player)
 
     def happen_b(self):
         self.players_gain_resources(self.most_military(), Resources({Resource.BOOKS: 3}))
@@ -514,22 +515,22 @@ class EcologicalCollapseCasteSystem(Age2EventCard):
         going_last = []
         for player in self.match.players[::-1]:
             if player.resources[Resource.FOOD] < 2:
-                self.match.log(f'{player} must go last.')
+                self.match.log('{} must go last.', player)
                 going_last.append(player)
             else:
                 choice = self.match.get_move(player, '-2 [Food] or go last?', ('-2 [Food]', 'Go last'))
                 if choice == '-2 [Food]':
-                    self.match.log(f'{player} loses 2 [Food].')
+                    self.match.log('{} loses 2 [Food].', player)
                     player.lose_resources(Resources({Resource.FOOD: -2}))
                 else:
-                    self.match.log(f'{player} will go last.')
+                    self.match.log('{} will go last.', player)
                     going_last.append(player)
                 self.match.get_move(player, 'Confirm?', ('Confirm',))
         if going_last and len(going_last) != len(self.match.players):
             going_last = going_last[::-1]
             self.match.players = [player for player in self.match.players if player not in going_last] + going_last
             players = ', '.join(str(player) for player in self.match.players)
-            self.match.log(f'New player order: {players}')
+            self.match.log('New player order: {}', players)
         else:
             self.match.log('No change in player order.')
 
@@ -554,12 +555,14 @@ class FeudalDuesHajjFromMali(Age2EventCard):
     def happen_b(self):
         for player in self.match.least_stability():
             if player.resources[Resource.GOLD] <= 2:
-                self.match.log(f'{player} does not have more than 2 [Gold].')
+                self.match.log('{} does not have more than 2 [Gold].', player)
             else:
-                self.match.log(f'{player} loses all [Gold] except 2.')
+                self.match.log('{} loses all [Gold] except 2.', player)
                 player.resources[Resource.GOLD] = 2
 
 class FourthCrusadeSongResistance(Age2EventCard):
+    __slots__ = ('points_lost_to_war', 'resources_lost_to_war')
+
     name_a = 'Fourth Crusade'
     name_b = 'Song Resistance'
     effect_a = 'Most [Military]: May -3 [Gold]: +1 [Point] and least [Military]: -4 [Books]'
@@ -596,44 +599,44 @@ class FourthCrusadeSongResistance(Age2EventCard):
                 choosing_player = most_military[0]
                 other_most_military = most_military[1:]
             if choosing_player.resources[Resource.GOLD] < 3:
-                self.match.log(f'{choosing_player} does not have at least 3 [Gold].')
+                self.match.log('{} does not have at least 3 [Gold].', choosing_player)
                 self.match.log('Least military will not lose [Books].')
                 least_lose = False
             else:
                 answer = self.match.get_move(choosing_player, 'Pay 3 [Gold] for 1 [Point] and least military loses 4 [Books]?', ('Yes', 'No'))
                 least_lose = answer == 'Yes'
                 if least_lose:
-                    self.match.log(f'{choosing_player} pays 3 [Gold] and gains 1 [Point].')
+                    self.match.log('{} pays 3 [Gold] and gains 1 [Point].', choosing_player)
                     choosing_player.resources[Resource.GOLD] -= 3
                     choosing_player.points += 1
                     if choosing_player.resources[Resource.GOLD] == 0:
                         self.match.events.happen('spent last gold', choosing_player)
                     self.match.log('Least military will lose 4 [Books].')
                 else:
-                    self.match.log(f'{choosing_player} declines.')
+                    self.match.log('{} declines.', choosing_player)
                     self.match.log('Least military will not lose [Books].')
                 self.match.get_move(choosing_player, 'Confirm?', ('Confirm',))
             if least_lose:
                 for player in other_most_military:
                     if player.resources[Resource.GOLD] < 3:
-                        self.match.log(f'{player} does not have at least 3 [Gold].')
+                        self.match.log('{} does not have at least 3 [Gold].', player)
                     else:
                         answer = self.match.get_move(player, f'Pay 3 [Gold] for 1 [Point]? (Least military will still lose 4 [Books].)', ('Yes', 'No'))
                         if answer == 'Yes':
-                            self.match.log(f'{player} pays 3 [Gold] and gains 1 [Point].')
+                            self.match.log('{} pays 3 [Gold] and gains 1 [Point].', player)
                             player.resources[Resource.GOLD] -= 3
                             player.points += 1
                             if player.resources[Resource.GOLD] == 0:
                                 self.match.events.happen('spent last gold', player)
                         else:
-                            self.match.log(f'{player} declines.')
+                            self.match.log('{} declines.', player)
                         self.match.get_move(player, 'Confirm?', ('Confirm',))
                 for player in self.match.least_military():
-                    self.match.log(f'{player} loses 4 [Books].')
+                    self.match.log('{} loses 4 [Books].', player)
                     player.lose_resources(Resources({Resource.BOOKS: -4}))
             else:
                 for player in other_most_military:
-                    self.match.log(f'{choosing_player} declined, so {player} does not get a choice.')
+                    self.match.log('{} declined, so {} does not get a choice.', choosing_player, player)
 
     def happen_b(self):
         for player in self.most_stability():
@@ -649,11 +652,11 @@ class FourthCrusadeSongResistance(Age2EventCard):
                     if gain:
                         gain += ' and '
                     gain += f'{resources}'
-                self.match.log(f'{player} regains the {gain} lost to war.')
+                self.match.log('{} regains the {} lost to war.', player, gain)
                 player.points += points
                 player.resources += resources
             else:
-                self.match.log(f'{player} did not lose any points or resources to war.')
+                self.match.log('{} did not lose any points or resources to war.', player)
 
 class ImperialExaminationJustinianCode(Age2EventCard):
     name_a = 'Imperial Examination'
@@ -669,7 +672,7 @@ class ImperialExaminationJustinianCode(Age2EventCard):
         for player in self.match.players[::-1]:
             for card in player.advisor_cards():
                 if card.age == 2:
-                    self.match.log(f'{player} gains 1 [Point].')
+                    self.match.log('{} gains 1 [Point].', player)
                     player.points += 1
                     any_have_medieval_advisor = True
                     break
@@ -696,6 +699,8 @@ class MartyrdomOfAliScholasticism(Age2EventCard):
         self.players_gain_resources(self.most_stability(), Resources({Resource.BOOKS: 3}))
 
 class PeaceOfGodCouncilOfClermont(Age2EventCard):
+    __slots__ = ('warmonger',)
+
     name_a = 'Peace of God'
     name_b = 'Council of Clermont'
     effect_a = 'Most [Military]: If War was bought by another Nation: +4 [Books]'
@@ -726,9 +731,9 @@ class PeaceOfGodCouncilOfClermont(Age2EventCard):
         else:
             for player in most_military:
                 if player is self.warmonger:
-                    self.match.log(f'{player} has most [Military] but bought the war.')
+                    self.match.log('{} has most [Military] but bought the war.', player)
                 else:
-                    self.match.log(f'{player} gains 4 [Books].')
+                    self.match.log('{} gains 4 [Books].', player)
                     player.resources[Resource.BOOKS] += 4
 
     def happen_b(self):
@@ -739,7 +744,7 @@ class PeaceOfGodCouncilOfClermont(Age2EventCard):
                 if card.age == 2:
                     points += 1
             if points > 0:
-                self.match.log(f'{player} gains {points} [Point{s_if_not_1(points)}].')
+                self.match.log('{} gains {} [Point{}].', player, points, s_if_not_1(points))
                 player.points += points
                 any_have_medieval_colony = True
         if not any_have_medieval_colony:
@@ -776,6 +781,8 @@ class SackOfBaghdadHanseaticSaltTrade(Age2EventCard):
         self.players_gain_resources(self.most_food(), Resources({Resource.GOLD: 4}))
 
 class StuporMundiGreatSchism(Age2EventCard):
+    __slots__ = ('golden_ages_bought',)
+
     name_a = 'Stupor Mundi'
     name_b = 'Great Schism'
     effect_a = 'Most bought Golden Ages this round: +4 [Books]'
@@ -806,7 +813,7 @@ class StuporMundiGreatSchism(Age2EventCard):
                 self.match.log('No most golden ages bought.')
             else:
                 for player in most_golden_ages_bought:
-                    self.match.log(f'{player} gains 4 [Books].')
+                    self.match.log('{} gains 4 [Books].', player)
                     player.resources[Resource.BOOKS] += 4
 
     def happen_b(self):
@@ -829,7 +836,7 @@ class AbsoluteMonarchySalemWitchTrials(Age3EventCard):
         for player in self.match.players[::-1]:
             for card in player.advisor_cards():
                 if card.age in (1, 2):
-                    self.match.log(f'{player} loses 4 [Books].')
+                    self.match.log('{} loses 4 [Books].', player)
                     player.lose_resources(Resources({Resource.BOOKS: -4}))
                     any_have_antiquity_or_medieval_advisor = True
                     break
@@ -852,10 +859,10 @@ class AbsoluteMonarchySalemWitchTrials(Age3EventCard):
                 if choice == 'remove advisors':
                     remove_advisors = True
             if remove_advisors:
-                self.match.log(f'{player} removes advisors.')
+                self.match.log('{} removes advisors.', player)
                 player.remove_all_advisors()
             else:
-                self.match.log(f'{player} loses 3 [Gold].')
+                self.match.log('{} loses 3 [Gold].', player)
                 player.lose_resources(Resources({Resource.GOLD: -3}))
             if player.need_confirmation:
                 self.match.get_move(player, 'Confirm?', ('Confirm',))
@@ -879,12 +886,12 @@ class AfricanSlaveTradeGloriousRevolution(Age3EventCard):
             player = most_stability[0]
             answer = self.match.get_move(player, 'Go last and gain 6 [Gold]?', ('Yes', 'No'))
             if answer == 'Yes':
-                self.match.log(f'{player} goes last and gains 6 [Gold].')
+                self.match.log('{} goes last and gains 6 [Gold].', player)
                 self.match.players.remove(player)
                 self.match.players.append(player)
                 player.resources[Resource.GOLD] += 6
             else:
-                self.match.log(f'{player} declines.')
+                self.match.log('{} declines.', player)
             self.match.get_move(player, 'Confirm?', ('Confirm',))
         elif len(most_stability) == 2:
             self.sort_players(most_stability, Resource.STABILITY)
@@ -892,11 +899,11 @@ class AfricanSlaveTradeGloriousRevolution(Age3EventCard):
             for player in most_stability[::-1]:
                 answer = self.match.get_move(player, 'Go last and gain 6 [Gold]?', ('Yes', 'No'))
                 if answer == 'Yes':
-                    self.match.log(f'{player} goes last and gains 6 [Gold].')
+                    self.match.log('{} goes last and gains 6 [Gold].', player)
                     player.resources[Resource.GOLD] += 6
                     went_last.insert(0, player)
                 else:
-                    self.match.log(f'{player} declines.')
+                    self.match.log('{} declines.', player)
                 self.match.get_move(player, 'Confirm?', ('Confirm',))
             self.match.players = [player for player in self.match.players if player not in went_last] + went_last
 
@@ -950,7 +957,7 @@ class CropRotationMercantilism(Age3EventCard):
         for player in self.match.players[::-1]:
             possible_undeploys = building_undeploys(player)
             if not possible_undeploys:
-                self.match.log(f'{player} has no building [Workers].')
+                self.match.log('{} has no building [Workers].', player)
             else:
                 undeployed = False
                 while possible_undeploys:
@@ -959,11 +966,11 @@ class CropRotationMercantilism(Age3EventCard):
                         break
                     undeployed = True
                     player.undeploy_action(undeploy)
-                    self.match.log(f'{player} gains 2 [Stone].')
+                    self.match.log('{} gains 2 [Stone].', player)
                     player.resources[Resource.STONE] += 2
                     possible_undeploys = building_undeploys(player)
                 if not undeployed:
-                    self.match.log(f'{player} declines.')
+                    self.match.log('{} declines.', player)
                 self.match.get_move(player, 'Confirm?', ('Confirm',))
 
 class JanissariesCouncilOfTrent(Age3EventCard):
@@ -982,13 +989,13 @@ class JanissariesCouncilOfTrent(Age3EventCard):
                 if answer == 'Yes':
                     player.take_worker()
                     player.take_worker()
-                    self.match.log(f'{player} gains 4 [Stone].')
+                    self.match.log('{} gains 4 [Stone].', player)
                     player.resources[Resource.STONE] += 4
                 else:
-                    self.match.log(f'{player} declines.')
+                    self.match.log('{} declines.', player)
                 self.match.get_move(player, 'Confirm?', ('Confirm',))
             else:
-                self.match.log(f'{player} does not have at least 2 [Workers] to take.')
+                self.match.log('{} does not have at least 2 [Workers] to take.', player)
 
     def happen_b(self):
         self.players_gain_resources(self.most_stability(), Resources({Resource.STONE: 5}))
@@ -1016,10 +1023,10 @@ class LittleIceAgeCityUponAHill(Age3EventCard):
                 if choice == '-3 [Food]':
                     lose_food = True
             if lose_food:
-                self.match.log(f'{player} loses 3 [Food].')
+                self.match.log('{} loses 3 [Food].', player)
                 player.lose_resources(Resources({Resource.FOOD: -3}))
             else:
-                self.match.log(f'{player} loses 5 [Books].')
+                self.match.log('{} loses 5 [Books].', player)
                 player.lose_resources(Resources({Resource.BOOKS: -5}))
             if player.need_confirmation:
                 self.match.get_move(player, 'Confirm?', ('Confirm',))
@@ -1028,6 +1035,8 @@ class LittleIceAgeCityUponAHill(Age3EventCard):
         self.players_gain_resources(self.most_stability(), Resources({Resource.BOOKS: 6}))
 
 class MagellansExpeditionPapalIndulgence(Age3EventCard):
+    __slots__ = ('colonies_bought',)
+
     name_a = 'Magellan\'s expedition'
     name_b = 'Papal Indulgence'
     effect_a = 'All: +5 [Gold] per Colony bought this round'
@@ -1056,7 +1065,7 @@ class MagellansExpeditionPapalIndulgence(Age3EventCard):
             for player in self.match.players[::-1]:
                 if player.name in self.colonies_bought:
                     gold = 5 * self.colonies_bought[player.name]
-                    self.match.log(f'{player} gains {gold} [Gold].')
+                    self.match.log('{} gains {} [Gold].', player, gold)
                     player.resources[Resource.GOLD] += gold
 
     def happen_b(self):
@@ -1066,16 +1075,16 @@ class MagellansExpeditionPapalIndulgence(Age3EventCard):
                 answer = self.match.get_move(player, 'Hire 1 [Architect] for free?', ('Yes', 'No'))
                 if answer == 'Yes':
                     card = player.wonders_under_construction[0]
-                    self.match.log(f'{player} hires a free architect for "{card}".')
+                    self.match.log('{} hires a free architect for "{}".', player, card)
                     player.hire_free_architect(card)
                 else:
-                    self.match.log(f'{player} declines.')
+                    self.match.log('{} declines.', player)
                 self.match.get_move(player, 'Confirm?', ('Confirm',))
             else:
-                self.match.log(f'{player} has no wonders under construction.')
+                self.match.log('{} has no wonders under construction.', player)
         for player in self.match.players[::-1]:
             if player not in most_stability:
-                self.match.log(f'{player} loses 2 [Gold].')
+                self.match.log('{} loses 2 [Gold].', player)
                 player.lose_resources(Resources({Resource.GOLD: -2}))
 
 class PilgrimsDutchRevolt(Age3EventCard):
@@ -1094,12 +1103,14 @@ class PilgrimsDutchRevolt(Age3EventCard):
                 if player.need_confirmation:
                     self.match.get_move(player, 'Confirm?', ('Confirm',))
             else:
-                self.match.log(f'{player} has no remaining [Workers] to take.')
+                self.match.log('{} has no remaining [Workers] to take.', player)
 
     def happen_b(self):
         self.least_stability_goes_last_and_loses_resources(Resources({Resource.GOLD: -3}))
 
 class SinkingOfTheVasaPeaceOfWestphalia(Age3EventCard):
+    __slots__ = ('strength_reduced_players',)
+
     name_a = 'Sinking of the Vasa'
     name_b = 'Peace of Westphalia'
     effect_a = 'Least [Stability]: -3 [Gold] or -10 [Military] for "Peace of Westphalia"'
@@ -1123,10 +1134,10 @@ class SinkingOfTheVasaPeaceOfWestphalia(Age3EventCard):
                 if choice == '-3 [Gold]':
                     lose_gold = True
             if lose_gold:
-                self.match.log(f'{player} loses 3 [Gold].')
+                self.match.log('{} loses 3 [Gold].', player)
                 player.lose_resources(Resources({Resource.GOLD: -3}))
             else:
-                self.match.log(f'{player} will be considered to have 10 less [Military] during "Peace of Westphalia".')
+                self.match.log('{} will be considered to have 10 less [Military] during "Peace of Westphalia".', player)
                 self.strength_reduced_players.append(player)
             if player.need_confirmation:
                 self.match.get_move(player, 'Confirm?', ('Confirm',))
@@ -1135,7 +1146,7 @@ class SinkingOfTheVasaPeaceOfWestphalia(Age3EventCard):
         for player in self.strength_reduced_players:
             player.resources[Resource.MILITARY] -= 10
         for player in self.match.most_least_of_resource(Resource.MILITARY)[1]:
-            self.match.log(f'{player} loses 5 [Food].')
+            self.match.log('{} loses 5 [Food].', player)
             player.lose_resources(Resources({Resource.FOOD: -5}))
         for player in self.strength_reduced_players:
             player.resources[Resource.MILITARY] += 10
@@ -1173,14 +1184,14 @@ class TulipManiaKangxiEra(Age3EventCard):
         most_stability = self.most_stability()
         if len(most_stability) == 1:
             player = most_stability[0]
-            self.match.log(f'{player} goes first and gains 3 [Gold].')
+            self.match.log('{} goes first and gains 3 [Gold].', player)
             self.match.players.remove(player)
             self.match.players.insert(0, player)
             player.resources[Resource.GOLD] += 3
         elif len(most_stability) == 2:
             self.sort_players(most_stability, Resource.STABILITY)
             players = f'{most_stability[0]} and {most_stability[1]}'
-            self.match.log(f'{players} go first and gain 3 [Gold].')
+            self.match.log('{} go first and gain 3 [Gold].', players)
             self.match.players = most_stability + [player for player in self.match.players if player not in most_stability]
             for player in most_stability:
                 player.resources[Resource.GOLD] += 3
@@ -1205,29 +1216,29 @@ class AmericanRevolutionFrenchRevolution(Age4EventCard):
                     colony = colonies[0]
                 else:
                     colony = self.match.get_move(player, 'Remove which colony?', colonies)
-                self.match.log(f'{player} removes "{colony}".')
+                self.match.log('{} removes "{}".', player, colony)
                 player.remove(colony)
                 if player.need_confirmation:
                     self.match.get_move(player, 'Confirm?', ('Confirm',))
             else:
-                self.match.log(f'{player} has no colonies.')
+                self.match.log('{} has no colonies.', player)
                 player.lose_point()
 
     def happen_b(self):
         for player in self.match.least_stability():
             if player.removable_advisor_cards():
-                self.match.log(f'{player} removes advisors.')
+                self.match.log('{} removes advisors.', player)
                 player.remove_all_advisors()
             else:
-                self.match.log(f'{player} has no advisors.')
+                self.match.log('{} has no advisors.', player)
                 if player.points >= 2:
-                    self.match.log(f'{player} loses 2 [Points].')
+                    self.match.log('{} loses 2 [Points].', player)
                     player.points -= 2
                 elif player.points == 1:
-                    self.match.log(f'{player} loses only remaining [Point].')
+                    self.match.log('{} loses only remaining [Point].', player)
                     player.points -= 1
                 else:
-                    self.match.log(f'{player} is spared the [Point] loss.')
+                    self.match.log('{} is spared the [Point] loss.', player)
 
 class AnarchismGreatExhibition(Age4EventCard):
     name_a = 'Anarchism'
@@ -1240,27 +1251,27 @@ class AnarchismGreatExhibition(Age4EventCard):
 
     def happen_a(self):
         for player in self.match.least_military():
-            self.match.log(f'{player} removes advisors.')
+            self.match.log('{} removes advisors.', player)
             player.remove_all_advisors()
             player.lose_point()
 
     def happen_b(self):
         for player in self.most_stability():
-            self.match.log(f'{player} may hire up to 2 [Architects] for free.')
+            self.match.log('{} may hire up to 2 [Architects] for free.', player)
             for i in range(2):
                 if player.incomplete_wonder_stages():
                     answer = self.match.get_move(player, 'Hire [Architect] for free?', ('Yes', 'No'))
                     if answer == 'Yes':
                         card = player.wonders_under_construction[0]
-                        self.match.log(f'{player} hires a free architect for "{card}".')
+                        self.match.log('{} hires a free architect for "{}".', player, card)
                         player.hire_free_architect(card)
                     else:
-                        self.match.log(f'{player} declines.')
+                        self.match.log('{} declines.', player)
                     self.match.get_move(player, 'Confirm?', ('Confirm',))
                     if answer == 'No':
                         break
                 else:
-                    self.match.log(f'{player} has no wonders under construction.')
+                    self.match.log('{} has no wonders under construction.', player)
                     break
 
 class CalifornianGoldRushIrishPotatoBlight(Age4EventCard):
@@ -1303,7 +1314,7 @@ class EntenteCordialeGeneralStrike(Age4EventCard):
                             answer = self.match.get_move(player, 'Deploy [Worker] to military for free?', ('Yes', 'No'))
                             if answer == 'No':
                                 if i == 0:
-                                    self.match.log(f'{player} declines.')
+                                    self.match.log('{} declines.', player)
                                 break
                             if player.workers == 0:
                                 possible_undeploys = player.undeploy_actions()
@@ -1316,17 +1327,17 @@ class EntenteCordialeGeneralStrike(Age4EventCard):
                                 deploy = possible_deploys[0]
                             else:
                                 deploy = self.match.get_move(player, 'Deploy [Worker] where?', possible_deploys)
-                            self.match.log(f'{player} deploys to "{deploy.card}" for free.')
+                            self.match.log('{} deploys to "{}" for free.', player, deploy.card)
                             player.deploy_for_free(deploy.card)
                         else:
-                            self.match.log(f'{player} has no room on militaries.')
+                            self.match.log('{} has no room on militaries.', player)
                             break
                     if player.need_confirmation:
                         self.match.get_move(player, 'Confirm?', ('Confirm',))
                 else:
-                    self.match.log(f'{player} has no workers.')
+                    self.match.log('{} has no workers.', player)
             else:
-                self.match.log(f'{player} has no militaries.')
+                self.match.log('{} has no militaries.', player)
 
     def happen_b(self):
         self.players_lose_resources(self.match.least_stability(), Resources({Resource.STONE: -6}))
@@ -1364,12 +1375,12 @@ class MarchToMoscowTaipingRebellion(Age4EventCard):
                     colony = colonies[0]
                 else:
                     colony = self.match.get_move(player, 'Remove which colony?', colonies)
-                self.match.log(f'{player} removes "{colony}".')
+                self.match.log('{} removes "{}".', player, colony)
                 player.remove(colony)
                 if player.need_confirmation:
                     self.match.get_move(player, 'Confirm?', ('Confirm',))
             else:
-                self.match.log(f'{player} has no colonies.')
+                self.match.log('{} has no colonies.', player)
                 player.lose_point()
 
     def happen_b(self):
@@ -1387,7 +1398,7 @@ class RomanticismIndustrialRevolution(Age4EventCard):
     def happen_a(self):
         for player in self.match.players[::-1]:
             if player.passed_first:
-                self.match.log(f'{player} gains 5 [Books].')
+                self.match.log('{} gains 5 [Books].', player)
                 player.resources[Resource.BOOKS] += 5
 
     def happen_b(self):
@@ -1396,7 +1407,7 @@ class RomanticismIndustrialRevolution(Age4EventCard):
             workers_in_industrial_buildings[player.name] = sum(card.deployed_workers for card in player.building_cards() if card.age == 4)
         most_workers_in_industrial_buildings = self.match.most_least(workers_in_industrial_buildings)[0]
         for player in most_workers_in_industrial_buildings:
-            self.match.log(f'{player} gains 1 [Point].')
+            self.match.log('{} gains 1 [Point].', player)
             player.points += 1
 
 class ScrambleForAfricaDreyfusAffair(Age4EventCard):
@@ -1413,7 +1424,7 @@ class ScrambleForAfricaDreyfusAffair(Age4EventCard):
         for player in self.match.players[::-1]:
             for card in player.colony_cards():
                 if card.age == 4:
-                    self.match.log(f'{player} gains 1 [Point].')
+                    self.match.log('{} gains 1 [Point].', player)
                     player.points += 1
                     any_have_industrial_colony = True
                     break
@@ -1464,7 +1475,7 @@ class TonghakMovementSepoyMutiny(Age4EventCard):
 
     def happen_a(self):
         for player in self.match.least_military():
-            self.match.log(f'{player} loses 8 [Books] and gains 2 [Stone].')
+            self.match.log('{} loses 8 [Books] and gains 2 [Stone].', player)
             player.lose_resources(Resources({Resource.BOOKS: -8}))
             player.resources[Resource.STONE] += 2
 
@@ -1489,7 +1500,7 @@ class WeltpolitikEmigration(Age4EventCard):
                     reward[Resource.GOLD] += 5
                     reward[Resource.STONE] += 5
             if reward:
-                self.match.log(f'{player} gains {reward}.')
+                self.match.log('{} gains {}.', player, reward)
                 player.resources += reward
                 any_have_industrial_colony = True
         if not any_have_industrial_colony:
@@ -1498,10 +1509,10 @@ class WeltpolitikEmigration(Age4EventCard):
     def happen_b(self):
         for player in self.match.least_stability():
             if player.grown_workers:
-                self.match.log(f'{player} must return 1 [Worker].')
+                self.match.log('{} must return 1 [Worker].', player)
                 player.return_worker()
             else:
-                self.match.log(f'{player} has no workers to return.')
+                self.match.log('{} has no workers to return.', player)
 
 all_event_cards = []
 subclasses = [EventCard]
@@ -1518,4 +1529,4 @@ def sort_key(card):
     return (card.age, card.name_a, card.name_b)
 
 all_event_cards.sort(key=sort_key)
-event_card_abbrs = {card.abbr: card.name() for card in all_event_cards}
+event_card_abbrs = {card.abbr: card.name for card in all_event_cards}
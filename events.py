@@ -2,63 +2,126 @@ import enum
 import re
 
 from .resources import *
+from .cards import Card
+
+class Registration:
+    def __init__(self, card, condition, event):
+        self.card = card
+        self.condition = condition
+        self.event = event
+        self.owned = getattr(condition, '__func__', None) is Card.owned and condition.__self__ is card
+        self.active = True
 
 class Event:
+    no_result = None
+    static_totals = None
+
     def __init__(self, match):
         self.match = match
-        self.registered_events = []
+        self.registrations = {}
+        self.dispatch_order = ()
 
     def register(self, card, condition, event):
-        self.registered_events.append((card, condition, event))
-
-    def unregister(self, card):
-        for i in range(len(self.registered_events)):
-            (registered_card, condition, event) = self.registered_events[i]
-            if registered_card is card:
-                del self.registered_events[i]
-                break
+        registration = Registration(card, condition, event)
+        self.registrations[registration] = None
+        self.dispatch_order = None
+        return registration
+
+    def unregister(self, registration):
+        registration.active = False
+        del self.registrations[registration]
+        self.dispatch_order = None
+
+    def happen_batch(self, player, queries, kwargs):
+        queries = [{**kwargs, **query} for query in queries]
+        values = [[] for query in queries]
+        for registration in self.registered():
+            if not registration.active:
+                continue
+            if registration.owned:
+                if player is not registration.card.owner:
+                    continue
+                for (query, query_values) in zip(queries, values):
+                    query_values.append(registration.event(player, **query))
+            else:
+                for (query, query_values) in zip(queries, values):
+                    if registration.condition(player, **query):
+                        query_values.append(registration.event(player, **query))
+        return [self.result(query, query_values) for (query, query_values) in zip(queries, values)]
+
+    def registered(self):
+        if self.dispatch_order is None:
+            self.dispatch_order = tuple(self.registrations)
+        return self.dispatch_order
 
 class BasicEvent(Event):
+    no_result = ()
+
+    def result(self, kwargs, values):
+        return tuple(value for value in values if value is not None)
+
     def happen(self, player, **kwargs):
-        if not self.registered_events:
-            return ()
         return_values = []
-        for (card, condition, event) in self.registered_events[:]:
-            if (card, condition, event) not in self.registered_events:
+        for registration in self.registered():
+            if not registration.active:
                 continue
-            if not condition(player, **kwargs):
+            if registration.owned:
+                if player is not registration.card.owner:
+                    continue
+            elif not registration.condition(player, **kwargs):
                 continue
-            return_value = event(player, **kwargs)
+            return_value = registration.event(player, **kwargs)
             if return_value is not None:
                 return_values.append(return_value)
         return tuple(return_values)
 
 class ExtraEvent(Event):
+    no_result = 0
+
+    def __init__(self, match):
+        super().__init__(match)
+        self.static_totals = {}
+
+    def add_static_modifier(self, player, amount):
+        total = self.static_totals.get(player, 0) + amount
+        if total:
+            self.static_totals[player] = total
+        else:
+            self.static_totals.pop(player, None)
+
+    def result(self, kwargs, values):
+        return sum(value for value in values if value is not None)
+
     def happen(self, player, **kwargs):
-        if not self.registered_events:
-            return 0
         values = []
-        for (card, condition, event) in self.registered_events[:]:
-            if (card, condition, event) not in self.registered_events:
+        for registration in self.registered():
+            if not registration.active:
                 continue
-            if not condition(player, **kwargs):
+            if registration.owned:
+                if player is not registration.card.owner:
+                    continue
+            elif not registration.condition(player, **kwargs):
                 continue
-            value = event(player, **kwargs)
+            value = registration.event(player, **kwargs)
             if value is not None:
                 values.append(value)
-        return sum(values)
+        return sum(values) + self.static_totals.get(player, 0)
 
 class DiscountEvent(Event):
+    def result(self, kwargs, values):
+        return max(0, kwargs['cost'] - sum(values))
+
     def happen(self, player, **kwargs):
         cost = kwargs['cost']
-        if not self.registered_events:
-            return cost
-        for (card, condition, event) in self.registered_events[:]:
-            if (card, condition, event) not in self.registered_events:
+        for registration in self.registered():
+            if not registration.active:
                 continue
-            if not condition(player, **kwargs):
+            if registration.owned:
+                if player is not registration.card.owner:
+                    continue
+            elif not registration.condition(player, **kwargs):
                 continue
-            cost -= event(player, **kwargs)
+            cost -= registration.event(player, **kwargs)
         cost = max(0, cost)
         return cost
 
@@ -150,10 +213,36 @@ class Events:
         self.define_discount_event('hire discount')
 
     def register(self, name, card, condition, event):
-        self.events[name].register(card, condition, event)
+        return self.events[name].register(card, condition, event)
+
+    def unregister(self, name, registration):
+        self.events[name].unregister(registration)
 
-    def unregister(self, name, card):
-        self.events[name].unregister(card)
+    def add_static_modifier(self, name, player, amount):
+        self.events[name].add_static_modifier(player, amount)
 
     def happen(self, name, player, **kwargs):
-        return self.events[name].happen(player, **kwargs)
+        event = self.events[name]
+        if self.match.event_profiler is not None:
+            return self.match.event_profiler.happen(name, event, player, kwargs)
+        if not event.registrations:
+            if event.static_totals:
+                return event.static_totals.get(player, 0)
+            return kwargs['cost'] if event.no_result is None else event.no_result
+        return event.happen(player, **kwargs)
+
+    def happen_batch(self, name, player, queries, **kwargs):
+        event = self.events[name]
+        if self.match.event_profiler is not None:
+            return [self.match.event_profiler.happen(name, event, player, {**kwargs, **query}) for query in queries]
+        if not event.registrations:
+            if event.static_totals:
+                return [event.static_totals.get(player, 0)] * len(queries)
+            if event.no_result is None:
+                return [query['cost'] if 'cost' in query else kwargs['cost'] for query in queries]
+            return [event.no_result] * len(queries)
+        results = event.happen_batch(player, queries, kwargs)
+        if event.static_totals:
+            static_total = event.static_totals.get(player, 0)
+            results = [result + static_total for result in results]
+        return results
@@ -6,3 +6,15 @@ class InvalidMove(Exception):
 
 class GameOver(Exception):
     pass
+
+class Paused(Exception):
+    pass
+
+class Diverged(Exception):
+    pass
+
+class StaleCardView(Exception):
+    pass
+
+class StaleRegistry(Exception):
+    pass
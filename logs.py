@@ -0,0 +1,37 @@
+import re
+
+from .resources import Resource, Resources, FrozenResources
+
+placeholder = re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}')
+word = re.compile(r'[a-z0-9]+')
+
+kinds = {}
+
+def log_kind(template):
+    kind = kinds.get(template)
+    if kind is None:
+        kind = kinds.setdefault(template, '_'.join(word.findall(placeholder.sub(' x ', template).lower())))
+    return kind
+
+def log_value(arg):
+    if arg is None or isinstance(arg, (int, str, Resource, FrozenResources)):
+        return arg
+    if isinstance(arg, Resources):
+        return FrozenResources(arg)
+    return str(arg)
+
+class LogRecord:
+    __slots__ = ('kind', 'template', 'args')
+
+    def __init__(self, template, args=(), kind=None):
+        self.kind = log_kind(template) if kind is None else kind
+        self.template = template
+        self.args = tuple(log_value(arg) for arg in args)
+
+    def __str__(self):
+        if not self.args:
+            return self.template
+        return self.template.format(*self.args)
+
+    def state(self):
+        return {'kind': self.kind, 'template': self.template, 'args': [arg if isinstance(arg, int) else str(arg) for arg in self.args]}
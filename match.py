@@ -1,4 +1,8 @@
+import collections
+import hashlib
+import json
 import os
+import pickle
 import random
 
 from .utils import *
@@ -12,6 +16,8 @@ from . import progress_cards
 from . import nations
 from .player import Player
 from .stats import NoStats
+from .logs import LogRecord
+from .checkpoints import Checkpoints, NoCheckpoints, dump_state, load_state
 
 card_draw_limits = {
     2: {
@@ -129,8 +135,32 @@ card_draw_weights = {
     }
 }
 
+match_modes = ('play', 'verify')
+
+state_snapshot_limit = 8
+
+history_attributes = ('state_version', 'state_snapshots', 'state_cache', 'fork_cache', 'mode', 'move_list', 'replay_lines', 'log_lines', 'log_line_count', 'replay_positions', 'log_positions', 'move_getter', 'logger', 'replay_sink', 'stream_length', 'stream_lengths', 'stats', 'event_profiler', 'checkpoints', 'round_index', 'replaying_invalid_or_undo', 'invalid_move', 'paused', 'resumable', 'record_round_hashes', 'expected_round_hashes', 'divergence', 'check_card_views')
+
+def state_diff(old, new, path, changes, removed):
+    for (key, value) in new.items():
+        if key not in old:
+            changes.append([[*path, key], value])
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            state_diff(old[key], value, (*path, key), changes, removed)
+        elif value != old[key]:
+            changes.append([[*path, key], value])
+    for key in old:
+        if key not in new:
+            removed.append([*path, key])
+
+def copy_state(state):
+    return pickle.loads(pickle.dumps(state, pickle.HIGHEST_PROTOCOL))
+
 class Match:
-    def __init__(self, player_names=None, seed=None, replay=None, move_getter=None, logger=None, rules={}, stats=None):
+    def __init__(self, player_names=None, seed=None, replay=None, move_getter=None, logger=None, rules={}, stats=None, checkpoints=True, checkpoint_interval=None, mode='play', round_hashes=False, replay_sink=None, event_profiler=None, check_card_views=False):
+        if mode not in match_modes:
+            raise ValueError(f'Unknown match mode: {mode}')
+        self.mode = mode
         match_growth_resources = 2
         player_growth_resources = {}
         if 'growth_resources' in rules:
@@ -145,9 +175,14 @@ class Match:
         self.weighted_card_draw = 'weighted_card_draw' in rules
         self.korea_nerf = 'korea_nerf' in rules
         self.lincoln_nerf = 'lincoln_nerf' in rules
-        self.move_list = []
+        self.move_list = collections.deque()
+        self.record_round_hashes = round_hashes
+        self.expected_round_hashes = {}
         self.replay_lines = []
         self.log_lines = [[]]
+        self.log_line_count = 0
+        self.replay_positions = HistoryPositions()
+        self.log_positions = HistoryPositions()
         if replay is not None:
             prev_player_name = None
             replay_player_names = []
@@ -180,6 +215,13 @@ class Match:
                             player_growth_resources[prev_player_name] = growth_resources
                     elif not line:
                         in_header = False
+                elif line.startswith('#hash '):
+                    (round_number, state_hash) = line[len('#hash '):].split()
+                    self.expected_round_hashes[int(round_number)] = state_hash
+                elif line.startswith('#truncate '):
+                    stream_length = int(line[len('#truncate '):])
+                    while len(self.move_list) > stream_length:
+                        self.move_list.pop()
                 else:
                     self.move_list.append(line)
             if replay_player_names:
@@ -191,7 +233,8 @@ class Match:
                 self.seed = bytes().fromhex('0' + seed)
             else:
                 self.seed = bytes().fromhex(seed)
-        self.events = events.Events(self)
+        self.event_profiler = event_profiler
+        self.check_card_views = check_card_views
         self.players = [Player(self, name) for name in player_names]
         for player in self.players:
             if player.name not in player_growth_resources:
@@ -201,25 +244,18 @@ class Match:
         self.event_cards = {}
         self.initial_event_card_order = {}
         for age in range(1, 1 + 4):
-            self.event_cards[age] = [card(self) for card in event_cards.all_event_cards if card.age == age]
+            self.event_cards[age] = [card for card in event_cards.all_event_cards if card.age == age]
             self.initial_event_card_order[age] = self.event_cards[age]
         self.progress_cards = {}
         self.initial_progress_card_order = {}
         for age in range(1, 1 + 4):
-            self.progress_cards[age] = [card(self) for card in progress_cards.all_progress_cards if card.age == age]
+            self.progress_cards[age] = [card for card in progress_cards.all_progress_cards if card.age == age]
             self.initial_progress_card_order[age] = self.progress_cards[age]
-        self.nations = [nation(self) for nation in nations.all_nations]
-        if self.korea_nerf:
-            for nation in self.nations:
-                if nation.name == 'Korea':
-                    nation.specials[0].abbr = 'K_S_Nerf'
-                    break
-        if self.lincoln_nerf:
-            for card in self.progress_cards[4]:
-                if card.name == 'Abraham Lincoln':
-                    card.abbr = 'AhLc_Nerf'
-                    break
-        self.initial_nation_order = self.nations
+        self.initial_nation_order = nations.all_nations
+        if self.mode == 'verify':
+            move_getter = self.pause
+            logger = None
+            checkpoints = False
         self.move_getter = move_getter
         self.logger = logger
         self.replaying_invalid_or_undo = 0
@@ -240,11 +276,28 @@ class Match:
             self.replay_lines.append(f'player {player_name}')
             self.replay_lines.append(f'growth_resources {player_growth_resources[player_name]}')
         self.replay_lines.append('')
+        self.replay_header_length = len(self.replay_lines)
+        self.replay_sink = replay_sink
+        if self.replay_sink is not None:
+            for line in self.replay_lines:
+                self.replay_sink(line)
+        self.stream_length = 0
+        self.stream_lengths = []
         self.invalid_move = None
+        self.paused = False
+        self.resumable = False
+        self.divergence = None
+        self.state_version = 0
+        self.state_snapshots = {}
+        self.state_cache = None
+        self.fork_cache = None
         self.reset()
         self.stats = stats if stats is not None else NoStats()
+        self.checkpoints = Checkpoints(self, checkpoint_interval) if checkpoints else NoCheckpoints()
+        self.round_index = {}
 
     def reset(self):
+        self.events = events.Events(self)
         self.random = random.Random(self.seed)
         self.players = self.initial_player_order[:]
         self.random.shuffle(self.players)
@@ -253,6 +306,7 @@ class Match:
         self.random.shuffle(self.nations)
         if self.extra_draft_nations >= 0:
             self.nations = self.nations[:len(self.players)+self.extra_draft_nations]
+        self.nations = [self.create_nation(nation) for nation in self.nations]
         if self.weighted_card_draw:
             self.card_draw_weights = {}
             self.separated_decks = {}
@@ -261,10 +315,6 @@ class Match:
             self.random.shuffle(self.event_cards[age])
             self.progress_cards[age] = self.initial_progress_card_order[age][:]
             self.random.shuffle(self.progress_cards[age])
-            for card in self.event_cards[age]:
-                card.reset()
-            for card in self.progress_cards[age]:
-                card.reset()
             if self.weighted_card_draw:
                 self.card_draw_weights[age] = card_draw_weights[len(self.players)].copy()
                 self.separated_decks[age] = {}
@@ -273,8 +323,6 @@ class Match:
                 self.progress_cards[age] = []
         for player in self.players:
             player.reset()
-        for nation in self.nations:
-            nation.reset()
         self.available_nations = self.nations[:]
         self.progress_board = [[None for j in range(len(self.players) + 2)] for i in range(3)]
         for (i, player) in enumerate(self.players):
@@ -284,6 +332,8 @@ class Match:
         self.game_over = False
         self.round_number = 0
         self.round_starts = {0: 0}
+        self.round_hashes = {}
+        self.move_number = 0
         self.phase = None
         self.architects = 0
         self.turmoil = 0
@@ -296,16 +346,132 @@ class Match:
         self.next_move_choice = ''
         self.next_move_options = ()
 
+    def create_nation(self, nation):
+        nation = nation(self)
+        if self.korea_nerf and nation.name == 'Korea':
+            nation.specials[0] = nations.KoreaSpecialNerf(self)
+        return nation
+
+    def create_card(self, card):
+        if self.lincoln_nerf and card is progress_cards.AbrahamLincoln:
+            card = progress_cards.AbrahamLincolnNerf
+        return card(self)
+
+    def game_state(self):
+        return {name: value for (name, value) in self.__dict__.items() if name not in history_attributes}
+
+    def save_checkpoint(self):
+        self.checkpoints.save(self.move_number, self.game_state())
+
+    def restore_checkpoint(self, moves):
+        checkpoint_moves = self.checkpoints.latest(moves)
+        if checkpoint_moves is None:
+            self.reset()
+            return 0
+        self.__dict__.update(self.checkpoints.load(checkpoint_moves))
+        return checkpoint_moves
+
     def undo(self, invalid=False):
-        self.reset()
-        self.replay_lines.pop()
-        self.log_lines.pop()
-        if not invalid:
-            self.replay_lines.pop()
-            self.log_lines.pop()
-        replay_moves = self.replay_lines[self.replay_lines.index('')+1:]
+        moves_played = len(self.replay_lines) - self.replay_header_length - (1 if invalid else 2)
+        self.truncate_history(moves_played)
+        if invalid:
+            self.truncate_stream()
+        self.move_list.extendleft(reversed(self.rewind(moves_played)))
+
+    def truncate_history(self, move_number):
+        replay_length = len(self.replay_lines)
+        log_line_count = self.log_line_count
+        del self.replay_lines[self.replay_header_length+move_number:]
+        for log_chunk in self.log_lines[move_number+1:]:
+            self.log_line_count -= len(log_chunk)
+        del self.log_lines[move_number+1:]
+        self.replay_positions.truncate(replay_length, len(self.replay_lines))
+        self.log_positions.truncate(log_line_count, self.log_line_count)
+        del self.stream_lengths[move_number:]
+        self.checkpoints.discard_after(move_number)
+        self.round_index = {round_number: moves for (round_number, moves) in self.round_index.items() if moves <= move_number}
+
+    def truncate_stream(self):
+        stream_length = self.stream_lengths[-1] if self.stream_lengths else 0
+        if stream_length != self.stream_length:
+            self.stream_length = stream_length
+            if self.replay_sink is not None:
+                self.replay_sink(f'#truncate {stream_length}')
+
+    def rewind(self, move_number):
+        replay_moves = self.replay_lines[self.replay_header_length:self.replay_header_length+move_number]
+        replay_moves = replay_moves[self.restore_checkpoint(move_number):]
         self.replaying_invalid_or_undo = len(replay_moves) + 1
-        self.move_list = replay_moves + self.move_list
+        self.resumable = False
+        self.state_version += 1
+        return replay_moves
+
+    def pause(self, choice, options, undo):
+        raise Paused()
+
+    def seek(self, move_number):
+        moves_played = len(self.replay_lines) - self.replay_header_length
+        if not 0 <= move_number <= moves_played:
+            raise ValueError(f'Cannot seek to move {move_number} of {moves_played}.')
+        self.paused = False
+        self.move_list = collections.deque(self.rewind(move_number))
+        move_getter = self.move_getter
+        self.move_getter = self.pause
+        try:
+            self.play()
+        except Paused:
+            pass
+        finally:
+            self.move_getter = move_getter
+
+    def seek_round(self, round_number):
+        if round_number not in self.round_index:
+            raise ValueError(f'Round {round_number} has not been reached.')
+        self.seek(self.round_index[round_number])
+
+    def fork_state(self):
+        if not self.paused:
+            return dump_state(self, self.game_state())
+        if self.fork_cache is None or self.fork_cache[0] != self.state_version:
+            self.fork_cache = (self.state_version, dump_state(self, self.game_state()))
+        return self.fork_cache[1]
+
+    def fork(self, move_getter=None, logger=None, stats=None, replay_sink=None):
+        match = Match.__new__(Match)
+        match.__dict__.update(load_state(match, self.fork_state()))
+        match.move_list = collections.deque()
+        match.replay_lines = self.replay_lines[:self.replay_header_length+self.move_number]
+        match.log_lines = self.log_lines[:self.move_number] + [log_chunk[:] for log_chunk in self.log_lines[self.move_number:self.move_number+1]]
+        match.log_line_count = sum(len(log_chunk) for log_chunk in match.log_lines)
+        match.replay_positions = self.replay_positions.fork(len(self.replay_lines), len(match.replay_lines))
+        match.log_positions = self.log_positions.fork(self.log_line_count, match.log_line_count)
+        match.move_getter = move_getter
+        match.logger = logger
+        match.replay_sink = replay_sink
+        if replay_sink is not None:
+            for line in match.replay_lines:
+                replay_sink(line)
+        match.stream_length = self.move_number
+        match.stream_lengths = list(range(1, self.move_number + 1))
+        match.stats = stats if stats is not None else NoStats()
+        match.event_profiler = None
+        match.checkpoints = self.checkpoints.fork(match)
+        match.checkpoints.discard_after(self.move_number)
+        match.round_index = {round_number: moves for (round_number, moves) in self.round_index.items() if moves <= self.move_number}
+        match.replaying_invalid_or_undo = 0
+        match.invalid_move = None
+        match.paused = self.paused
+        match.resumable = self.resumable
+        match.mode = 'play'
+        match.record_round_hashes = self.record_round_hashes
+        match.expected_round_hashes = {}
+        match.divergence = None
+        match.check_card_views = self.check_card_views
+        match.state_version = self.state_version
+        match.state_snapshots = {}
+        match.state_cache = None
+        match.fork_cache = None
+        return match
 
     def next_player_forward(self, player):
         return self.players[(self.players.index(player) + 1) % len(self.players)]
@@ -342,16 +508,23 @@ class Match:
             player_amounts[player.name] = amount
         return self.most_least(player_amounts)
 
+    def projections_changed(self):
+        for player in self.players:
+            player.projections_changed()
+
     def update_most_least_stability_military(self):
         for player in self.players[::-1]:
             self.events.happen('updating most least stability military', player)
         (most_stability, least_stability) = self.most_least_of_resource(Resource.STABILITY)
         (most_military, least_military) = self.most_least_of_resource(Resource.MILITARY)
         for player in self.players:
+            flags = (player.most_stability, player.least_stability, player.most_military, player.least_military)
             player.most_stability = player in most_stability
             player.least_stability = player in least_stability
             player.most_military = player in most_military
             player.least_military = player in least_military
+            if flags != (player.most_stability, player.least_stability, player.most_military, player.least_military):
+                player.projections_changed()
         for player in self.players[::-1]:
             if player.least_stability:
                 self.events.happen('least stability', player)
@@ -409,28 +582,28 @@ class Match:
         else:
             drawn_cards = self.progress_cards[age][:number]
             del self.progress_cards[age][:number]
-        return drawn_cards
+        return [self.create_card(card) for card in drawn_cards]
 
     def drafting_phase(self):
         for nation in self.available_nations:
             self.stats.collect(self, 'Nation Available', nation.name)
         player_order_string = ', '.join(str(player) for player in self.players)
-        self.log(f'Initial player order: {player_order_string}')
+        self.log('Initial player order: {}', player_order_string)
         self.log('Drafting!')
         self.phase = Phase.DRAFTING
         available_nations_string = ', '.join(str(nation) for nation in self.available_nations)
-        self.log(f'Available nations: {available_nations_string}')
+        self.log('Available nations: {}', available_nations_string)
         for player in self.players[::-1]:
             self.undo_allowed = False
             self.undo_disallowed_reason = 'Drafting nations.'
             if len(self.available_nations) == 1:
                 nation = self.available_nations[0]
-                self.log(f'{player} gets {nation}.')
+                self.log('{} gets {}.', player, nation)
                 player.assign_nation(nation)
                 self.available_nations.remove(nation)
             else:
                 nation = self.get_move(player, 'Draft which nation?', self.available_nations)
-                self.log(f'{player} drafts {nation}.')
+                self.log('{} drafts {}.', player, nation)
                 player.assign_nation(nation)
                 self.available_nations.remove(nation)
                 self.get_move(player, 'Confirm?', ('Confirm',))
@@ -489,6 +662,7 @@ class Match:
         else:
             drawn_cards = self.progress_cards[age][:num_cards_to_draw]
             del self.progress_cards[age][:num_cards_to_draw]
+        drawn_cards = [self.create_card(card) for card in drawn_cards]
         for card in drawn_cards:
             self.stats.collect(self, 'Card Available', card)
         row_1_cards_needed = len(self.progress_board[0]) - len(remaining_cards)
@@ -501,8 +675,8 @@ class Match:
     def new_events_phase(self):
         self.phase = Phase.NEW_EVENTS
         age = (self.round_number + 1) // 2
-        top_event = self.event_cards[age][0]
-        next_event = self.event_cards[age][1]
+        top_event = self.create_card(self.event_cards[age][0])
+        next_event = self.create_card(self.event_cards[age][1])
         for player in self.players[::-1]:
             self.events.happen('choose event card', player, events=(top_event, next_event))
         if self.event is None:
@@ -510,7 +684,7 @@ class Match:
             del self.event_cards[age][:1]
         else:
             del self.event_cards[age][:2]
-        self.log(f'New event: {self.event}')
+        self.log('New event: {}', self.event)
         self.event.reveal()
         self.architects = {1: 0, 2: 1, 3: 2, 4: 2, 5: 3, 6: 3}[len(self.players)]
         self.architects += self.event.architects
@@ -528,7 +702,7 @@ class Match:
         self.war_value = None
         age = (self.round_number + 1) // 2
         round_string = f'{age}' + ('A' if self.round_number % 2 == 1 else 'B')
-        self.log(f'Beginning of Round {round_string}!')
+        self.log('Beginning of Round {}!', round_string)
         for player in self.players[::-1]:
             player.new_round()
         if self.round_number != 1:
@@ -542,13 +716,24 @@ class Match:
         self.undo_disallowed_reason = 'New events revealed.'
         self.new_events_phase()
 
-    def action_phase(self):
-        self.phase = Phase.ACTION
-        for player in self.players[::-1]:
-            self.events.happen('take extra first action', player)
-        current_player = self.players[0]
+    def action_phase(self, resume=False):
+        if resume:
+            current_player = self.turn_player
+        else:
+            self.phase = Phase.ACTION
+            self.projections_changed()
+            for player in self.players[::-1]:
+                self.events.happen('take extra first action', player)
+            current_player = self.players[0]
         while True:
-            current_player.take_turn()
+            self.turn_player = current_player
+            if self.resumable:
+                self.resumable = False
+                current_player.continue_turn()
+            else:
+                if self.checkpoints.due(self.move_number):
+                    self.save_checkpoint()
+                current_player.take_turn()
             next_player = current_player
             players_passed_over = []
             while True:
@@ -587,7 +772,7 @@ class Match:
             return (-military, -stability, current_player_order.index(player))
         self.players.sort(key=sort_key)
         player_names = ', '.join(str(player) for player in self.players)
-        self.log(f'New player order: {player_names}')
+        self.log('New player order: {}', player_names)
 
     def war_phase(self):
         self.log('War:')
@@ -596,7 +781,7 @@ class Match:
             amount = self.war.penalty_amount - self.events.happen('extra war penalty', None)
             war_penalty = Resources({self.war.penalty_resource: amount})
             war_penalty[Resource.FOOD] -= self.events.happen('extra war food penalty', None)
-            self.log(f'[{self.war}] The war value is {self.war_value} and the penalty is {war_penalty}.')
+            self.log('[{}] The war value is {} and the penalty is {}.', self.war, self.war_value, war_penalty)
             any_defeated = False
             for player in self.players[::-1]:
                 defeated = player.war(war_penalty)
@@ -615,7 +800,7 @@ class Match:
     def famine_phase(self):
         self.log('Famine:')
         self.phase = Phase.FAMINE
-        self.log(f'All players lose {-self.event.famine} [Food].')
+        self.log('All players lose {} [Food].', -self.event.famine)
         for player in self.players[::-1]:
             player.famine()
 
@@ -633,7 +818,7 @@ class Match:
             book_values.append(player.resources[Resource.BOOKS])
         for player in self.players[::-1]:
             points = sum(1 for book_value in book_values if book_value < player.resources[Resource.BOOKS])
-            self.log(f'{player} scores {points} [Point{s_if_not_1(points)}] for books.')
+            self.log('{} scores {} [Point{}] for books.', player, points, s_if_not_1(points))
             player.points += points
 
     def resolution_phase(self):
@@ -679,11 +864,11 @@ class Match:
         for (i, player) in enumerate(placement):
             if self.resource_remainder_tiebreaker and any_ties:
                 if list(player_scores.values()).count(player_scores[player.name]) > 1:
-                    self.log(f'[{ordinal(i + 1)}] {player_scores[player.name]:{-score_width}d}.{player_resource_remainders[player.name]} - {player}')
+                    self.log('[{}] {:{}d}.{} - {}', ordinal(i + 1), player_scores[player.name], -score_width, player_resource_remainders[player.name], player, kind='placement')
                 else:
-                    self.log(f'[{ordinal(i + 1)}] {player_scores[player.name]:{-score_width}d}   - {player}')
+                    self.log('[{}] {:{}d}   - {}', ordinal(i + 1), player_scores[player.name], -score_width, player, kind='placement')
             else:
-                self.log(f'[{ordinal(i + 1)}] {player_scores[player.name]:{-score_width}d} - {player}')
+                self.log('[{}] {:{}d} - {}', ordinal(i + 1), player_scores[player.name], -score_width, player, kind='placement')
             if i == 0:
                 self.stats.collect(self, 'Nation Won', player.nation.name)
 
@@ -697,37 +882,82 @@ class Match:
         raise GameOver()
 
     def play_round(self):
+        self.save_checkpoint()
         self.cards_bought = 0
         self.round_number += 1
-        self.round_starts[self.round_number] = len(self.replay_lines) - (self.replay_lines.index('') + 1)
+        self.round_starts[self.round_number] = self.move_number
+        self.round_index[self.round_number] = self.round_starts[self.round_number]
+        expected_hash = self.expected_round_hashes.get(self.round_number)
+        if self.record_round_hashes or expected_hash is not None:
+            self.round_hashes[self.round_number] = self.state_hash()
+        if self.mode == 'verify' and expected_hash is not None and expected_hash != self.round_hashes[self.round_number]:
+            raise Diverged(f'State diverges from the replay at the start of round {self.round_number} (move {self.move_number + 1}).')
         self.maintenance_phase()
         self.action_phase()
         self.resolution_phase()
 
     def play(self):
+        if self.paused:
+            self.paused = False
+            if len(self.replay_lines) - self.replay_header_length > self.move_number:
+                self.truncate_history(self.move_number)
+                self.truncate_stream()
+            if not self.resumable:
+                self.move_list.extendleft(reversed(self.rewind(len(self.replay_lines) - self.replay_header_length)))
         while True:
             try:
-                self.stats.collect(self, 'Player Count', len(self.players))
-                self.progress_phase()
-                self.drafting_phase()
+                if self.phase is None:
+                    self.stats.collect(self, 'Player Count', len(self.players))
+                    self.progress_phase()
+                    self.drafting_phase()
+                elif self.phase is Phase.ACTION:
+                    self.action_phase(resume=True)
+                    self.resolution_phase()
                 while True:
                     self.play_round()
             except InvalidMove as e:
                 self.invalid_move = str(e)
-                self.log(f'Move is invalid: {self.invalid_move}')
+                if self.mode == 'verify':
+                    return
+                self.log('Move is invalid: {}', self.invalid_move)
                 self.undo(invalid=True)
             except Undo:
                 self.undo()
+            except Diverged as e:
+                self.divergence = str(e)
+                return
             except GameOver:
                 return
 
-    def log(self, message):
+    def verify(self):
+        try:
+            self.play()
+        except Paused:
+            pass
+        return self.verification()
+
+    def verification(self):
+        v = {}
+        v['passed'] = self.game_over and self.invalid_move is None and self.divergence is None
+        v['game_over'] = self.game_over
+        v['moves'] = self.move_number
+        v['scores'] = {player.name: player.score(projected=True) for player in self.players}
+        v['invalid_move'] = self.invalid_move
+        v['divergence'] = self.divergence
+        return v
+
+    def log(self, message, *args, kind=None):
+        if self.mode == 'verify':
+            return
         if not self.replaying_invalid_or_undo:
+            if args:
+                message = LogRecord(message, args, kind)
             self.log_lines[-1].append(message)
+            self.log_line_count += 1
             if self.logger is not None:
-                self.logger(message)
+                self.logger(str(message))
 
-    def get_move(self, player, choice, options):
+    def get_move(self, player, choice, options, resumable=False):
         self.current_player = player
         if player is not self.previous_player:
             self.previous_player = player
@@ -737,11 +967,10 @@ class Match:
         while True:
             self.next_move_player = player.name if player is not None else None
             self.next_move_choice = choice
-            self.next_move_options = tuple(str(option) for option in options)
             if self.replaying_invalid_or_undo > 0:
                 self.replaying_invalid_or_undo -= 1
             if self.move_list:
-                move = self.move_list.pop(0)
+                move = self.move_list.popleft()
                 if move == 'UNDO':
                     option = move
                 else:
@@ -751,34 +980,135 @@ class Match:
                     else:
                         self.replay_lines.append(move)
                         self.log_lines.append([])
+                        self.stream_lengths.append(self.stream_length)
                         raise InvalidMove(f'Not a valid option: {move}')
             else:
+                self.next_move_options = tuple(str(option) for option in options)
+                self.paused = True
+                self.resumable = resumable
                 option = self.move_getter(choice, tuple(options), self.undo_allowed)
+                self.paused = False
+                self.resumable = False
+                move = str(option)
+            self.move_number += 1
+            self.state_version += 1
             if not self.replaying_invalid_or_undo:
-                self.replay_lines.append(str(option))
+                self.replay_lines.append(move)
                 self.log_lines.append([])
+                self.stream_lengths.append(self.stream_length)
                 self.invalid_move = None
-            if str(option) == 'UNDO':
+            if move == 'UNDO':
+                self.record_move(move)
                 if self.undo_allowed:
                     raise Undo()
                 else:
-                    self.log(f'Undo is not allowed: {self.undo_disallowed_reason}')
+                    self.log('Undo is not allowed: {}', self.undo_disallowed_reason)
                     continue
             elif option not in options:
                 raise InvalidMove(f'"{option}" is not a valid move.')
+            self.record_move(move)
             break
         self.undo_allowed = True
         self.undo_disallowed_reason = None
-        player.need_confirmation = str(option) != 'Confirm'
+        player.need_confirmation = move != 'Confirm'
         return option
 
-    def get_replay(self):
-        return '\n'.join(self.replay_lines) + '\n'
+    def record_move(self, move):
+        if not self.replaying_invalid_or_undo:
+            self.stream_length += 1
+            self.stream_lengths[-1] = self.stream_length
+            if self.replay_sink is not None:
+                self.replay_sink(move)
+
+    def history_offset(self, positions, position, length, history):
+        offset = positions.offset(position, length)
+        if offset is None:
+            raise ValueError(f'{history} position {position} is not part of the current history; an undo may have removed lines after it.')
+        return offset
+
+    def replay_position(self):
+        return self.replay_positions.position(len(self.replay_lines))
+
+    def log_position(self):
+        return self.log_positions.position(self.log_line_count)
+
+    def get_replay(self, hashes=False, since=0):
+        start = self.history_offset(self.replay_positions, since, len(self.replay_lines), 'Replay')
+        if not hashes:
+            return ''.join(f'{line}\n' for line in self.replay_lines[start:])
+        round_hash_lines = collections.defaultdict(list)
+        for (round_number, state_hash) in self.round_hashes.items():
+            round_hash_lines[self.round_starts[round_number]].append(f'#hash {round_number} {state_hash}')
+        lines = self.replay_lines[start:self.replay_header_length]
+        first_move = max(0, start - self.replay_header_length)
+        for (i, move) in enumerate(self.replay_lines[self.replay_header_length+first_move:], first_move):
+            lines += round_hash_lines[i]
+            lines.append(move)
+        return ''.join(f'{line}\n' for line in lines)
+
+    def log_messages(self, since=0):
+        remaining = self.log_line_count - self.history_offset(self.log_positions, since, self.log_line_count, 'Log')
+        if remaining == self.log_line_count:
+            return [message for log_chunk in self.log_lines for message in log_chunk]
+        log_chunks = []
+        for log_chunk in reversed(self.log_lines):
+            if remaining <= 0:
+                break
+            log_chunks.append(log_chunk[max(0, len(log_chunk) - remaining):])
+            remaining -= len(log_chunk)
+        return [message for log_chunk in reversed(log_chunks) for message in log_chunk]
+
+    def get_log(self, since=0):
+        return ''.join(f'{message}\n' for message in self.log_messages(since))
+
+    def get_log_records(self, since=0):
+        return [message.state() if isinstance(message, LogRecord) else LogRecord(message).state() for message in self.log_messages(since)]
+
+    def get_state_delta(self, since_version=None):
+        state = self.get_state()
+        base_state = self.state_snapshots.get(since_version)
+        self.state_snapshots[self.state_version] = state
+        while len(self.state_snapshots) > state_snapshot_limit:
+            del self.state_snapshots[min(self.state_snapshots)]
+        d = {}
+        d['version'] = self.state_version
+        if base_state is None:
+            d['since_version'] = None
+            d['state'] = copy_state(state)
+            return d
+        d['since_version'] = since_version
+        d['changes'] = []
+        d['removed'] = []
+        state_diff(base_state, state, (), d['changes'], d['removed'])
+        d['changes'] = copy_state(d['changes'])
+        return d
 
-    def get_log(self):
-        return '\n'.join(line for chunk in self.log_lines for line in chunk) + '\n'
+    def state_hash(self):
+        s = {name: value for (name, value) in self.get_state().items() if name not in ('next_move_player', 'next_move_choice', 'next_move_options', 'undo_allowed', 'invalid_move')}
+        return hashlib.blake2b(json.dumps(s, sort_keys=True).encode(), digest_size=8).hexdigest()
 
     def get_state(self):
+        if not (self.paused or self.game_over):
+            return self.build_state()
+        if self.state_cache is not None and self.state_cache[0] == self.state_version:
+            return pickle.loads(self.state_cache[1])
+        state = self.build_state()
+        self.state_cache = (self.state_version, pickle.dumps(state, pickle.HIGHEST_PROTOCOL), None)
+        return state
+
+    def get_state_json(self):
+        if not (self.paused or self.game_over):
+            return json.dumps(self.build_state())
+        if self.state_cache is None or self.state_cache[0] != self.state_version:
+            state = self.get_state()
+        elif self.state_cache[2] is None:
+            state = pickle.loads(self.state_cache[1])
+        else:
+            return self.state_cache[2]
+        self.state_cache = (*self.state_cache[:2], json.dumps(state))
+        return self.state_cache[2]
+
+    def build_state(self):
         s = {}
         s['first_round_player_order'] = [player.name for player in self.first_round_player_order]
         s['player_order'] = [player.name for player in self.players]
@@ -9,6 +9,8 @@ class Special(Card):
     card_type = CardType.SPECIAL
 
 class WorkerPool:
+    __slots__ = ('spots', 'resource_cost_per_worker', 'ungrown_workers', 'markers', 'total_resource_cost')
+
     def __init__(self, workers, resource_cost):
         self.spots = workers
         self.resource_cost_per_worker = resource_cost
@@ -51,9 +53,7 @@ class Nation:
         self.colonies = [card(match) if card is not None else None for card in self.colonies]
         self.wonders_under_construction = [card(match) if card is not None else None for card in self.wonders_under_construction]
         self.wonders = [card(match) if card is not None else None for card in self.wonders]
-
-    def all_slots(self):
-        return self.dynasties + self.advisors + self.buildings_military + self.specials + self.colonies + self.wonders_under_construction + self.wonders
+        self.worker_pools = [WorkerPool(worker_pool.spots, worker_pool.resource_cost_per_worker) for worker_pool in self.worker_pools]
 
     def slot_names_cards(self):
         slots_cards = []
@@ -69,13 +69,6 @@ class Nation:
             slots_cards.append((f'W{i + 1}', card))
         return slots_cards
 
-    def reset(self):
-        for card in self.all_slots():
-            if card is not None:
-                card.reset()
-        for worker_pool in self.worker_pools:
-            worker_pool.reset()
-
     def state(self):
         s = {}
         s['dynasties'] = [dynasty.abbr for dynasty in self.dynasties]
@@ -89,6 +82,8 @@ class Nation:
         return self.name
 
 class StartingCard:
+    __slots__ = ()
+
     starting_card = True
     age = 0
 
@@ -116,22 +111,22 @@ class AmericaBuffaloHorde(StartingBuilding):
     name = 'Buffalo Horde'
     abbr = 'Am_BfHd'
     max_workers = True
-    production_per_worker = Resources({Resource.FOOD: 4})
+    production_per_worker = FrozenResources({Resource.FOOD: 4})
 
 class AmericaTeePee(StartingBuilding):
     name = 'Teepee'
     abbr = 'Am_Tpe'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.BOOKS: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.BOOKS: 1})
 
 class AmericaBrave(StartingMilitary):
     name = 'Brave'
     abbr = 'Am_Brv'
-    production_per_worker = Resources({Resource.MILITARY: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 1, Resource.GOLD: 1})
 
 class AmericaAdobe(StartingBuilding):
     name = 'Adobe'
     abbr = 'Am_Adb'
-    production_per_worker = Resources({Resource.STABILITY: 2})
+    production_per_worker = FrozenResources({Resource.STABILITY: 2})
 
 class AmericaSpecial(Special):
     """Discover Natrual Wonder: +2 [Food]"""
@@ -143,7 +138,7 @@ class AmericaSpecial(Special):
         self.register_for_event('discover', self.owned, self.gain_food)
 
     def gain_food(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 2 [Food].')
+        self.match.log('[{}] {} gains 2 [Food].', self, player)
         player.resources[Resource.FOOD] += 2
 
 class America(Nation):
@@ -156,8 +151,8 @@ class America(Nation):
     colonies = [None, None]
     wonders_under_construction = [None]
     wonders = [None, None, None, None, None]
-    worker_pools = [WorkerPool(4, Resources({Resource.FOOD: -3})), WorkerPool(4, Resources({Resource.STABILITY: -3}))]
-    starting_resources = Resources({Resource.FOOD: 2, Resource.STONE: 5, Resource.GOLD: 7})
+    worker_pools = [WorkerPool(4, FrozenResources({Resource.FOOD: -3})), WorkerPool(4, FrozenResources({Resource.STABILITY: -3}))]
+    starting_resources = FrozenResources({Resource.FOOD: 2, Resource.STONE: 5, Resource.GOLD: 7})
     starting_points = 5
     starting_workers = 5
 
@@ -167,22 +162,22 @@ class ArabsKaba(StartingBuilding):
     deployment_cost = -2
     worker_points = (2,)
     max_workers = True
-    production_per_worker = Resources({Resource.GOLD: 2, Resource.BOOKS: 2})
+    production_per_worker = FrozenResources({Resource.GOLD: 2, Resource.BOOKS: 2})
 
 class ArabsQuarry(StartingBuilding):
     name = 'Quarry'
     abbr = 'Ar_Qry'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.GOLD: 1})
 
 class ArabsAxeman(StartingMilitary):
     name = 'Axeman'
     abbr = 'Ar_Axm'
-    production_per_worker = Resources({Resource.MILITARY: 2, Resource.FOOD: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 2, Resource.FOOD: -1})
 
 class ArabsBazaar(StartingBuilding):
     name = 'Bazaar'
     abbr = 'Ar_Bzr'
-    production_per_worker = Resources({Resource.FOOD: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.FOOD: 1, Resource.GOLD: 1})
 
 class ArabsSpecial(Special):
     """Buy Battle: May also take 1 [Worker]"""
@@ -198,12 +193,12 @@ class ArabsSpecial(Special):
 
     def may_take_worker(self, player, **kwargs):
         if player.may_take_workers():
-            self.match.log(f'[{self}] {player} may take 1 [Worker].')
+            self.match.log('[{}] {} may take 1 [Worker].', self, player)
             answer = self.match.get_move(player, 'Take 1 [Worker]?', ('Yes', 'No'))
             if answer == 'Yes':
                 player.take_worker()
         else:
-            self.match.log(f'[{self}] {player} has no remaining [Workers] to take.')
+            self.match.log('[{}] {} has no remaining [Workers] to take.', self, player)
 
 class Arabs(Nation):
     name = 'Arabs'
@@ -215,31 +210,31 @@ class Arabs(Nation):
     colonies = [None, None]
     wonders_under_construction = [None]
     wonders = [None, None, None, None, None]
-    worker_pools = [WorkerPool(4, Resources({Resource.FOOD: -3})), WorkerPool(4, Resources({Resource.STABILITY: -3}))]
-    starting_resources = Resources({Resource.FOOD: 2, Resource.STONE: 5, Resource.GOLD: 8})
+    worker_pools = [WorkerPool(4, FrozenResources({Resource.FOOD: -3})), WorkerPool(4, FrozenResources({Resource.STABILITY: -3}))]
+    starting_resources = FrozenResources({Resource.FOOD: 2, Resource.STONE: 5, Resource.GOLD: 8})
     starting_points = 5
     starting_workers = 5
 
 class ChinaFarm(StartingBuilding):
     name = 'Farm'
     abbr = 'C_Frm'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.FOOD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.FOOD: 1})
 
 class ChinaQuarry(StartingBuilding):
     name = 'Quarry'
     abbr = 'C_Qry'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.GOLD: 1})
 
 class ChinaAxeman(StartingMilitary):
     name = 'Axeman'
     abbr = 'C_Axm'
-    production_per_worker = Resources({Resource.MILITARY: 2, Resource.FOOD: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 2, Resource.FOOD: -1})
 
 class ChinaPagoda(StartingBuilding):
     name = 'Pagoda'
     abbr = 'C_Pgd'
     worker_points = (1, 1)
-    production_per_worker = Resources({Resource.BOOKS: 2, Resource.STABILITY: 1})
+    production_per_worker = FrozenResources({Resource.BOOKS: 2, Resource.STABILITY: 1})
 
 class ChinaSpecial(Special):
     """Production: If passed first: +1 [Food]"""
@@ -247,10 +242,10 @@ class ChinaSpecial(Special):
     abbr = 'C_S'
 
     def produce(self, projected=False):
-        production = self.production_value.production()
+        production = self.production_value.production().copy()
         if self.owner.passed_first:
             if not projected:
-                self.match.log(f'[{self}] {self.owner} produces an extra 1 [Food].')
+                self.match.log('[{}] {} produces an extra 1 [Food].', self, self.owner)
             production[Resource.FOOD] += 1
         return production
 
@@ -264,8 +259,8 @@ class China(Nation):
     colonies = [None]
     wonders_under_construction = [None]
     wonders = [None, None, None, None, None, None]
-    worker_pools = [WorkerPool(3, Resources({Resource.FOOD: -3})), WorkerPool(4, Resources({Resource.STABILITY: -3}))]
-    starting_resources = Resources({Resource.FOOD: 1, Resource.STONE: 5, Resource.GOLD: 5})
+    worker_pools = [WorkerPool(3, FrozenResources({Resource.FOOD: -3})), WorkerPool(4, FrozenResources({Resource.STABILITY: -3}))]
+    starting_resources = FrozenResources({Resource.FOOD: 1, Resource.STONE: 5, Resource.GOLD: 5})
     starting_points = 3
     starting_workers = 6
 
@@ -273,22 +268,22 @@ class EgyptBrewery(StartingBuilding):
     name = 'Brewery'
     abbr = 'Eg_Brw'
     worker_points = (1, 1)
-    production_per_worker = Resources({Resource.FOOD: 2, Resource.BOOKS: 1})
+    production_per_worker = FrozenResources({Resource.FOOD: 2, Resource.BOOKS: 1})
 
 class EgyptQuarry(StartingBuilding):
     name = 'Quarry'
     abbr = 'Eg_Qry'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.GOLD: 1})
 
 class EgyptTemple(StartingBuilding):
     name = 'Temple'
     abbr = 'Eg_Tpl'
-    production_per_worker = Resources({Resource.BOOKS: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.BOOKS: 1, Resource.GOLD: 1})
 
 class EgyptCaravan(StartingBuilding):
     name = 'Caravan'
     abbr = 'Eg_Crv'
-    production_per_worker = Resources({Resource.STABILITY: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STABILITY: 1, Resource.GOLD: 1})
 
 class EgyptSpecial(Special):
     """1 private [Architect] per round"""
@@ -300,7 +295,7 @@ class EgyptPyramids(StartingWonder):
     name = 'Pyramids'
     abbr = 'Eg_Prm'
     points = 3
-    production_value = Resources({Resource.GOLD: 2, Resource.FOOD: -2})
+    production_value = FrozenResources({Resource.GOLD: 2, Resource.FOOD: -2})
 
 class Egypt(Nation):
     name = 'Egypt'
@@ -312,30 +307,30 @@ class Egypt(Nation):
     colonies = [None, None]
     wonders_under_construction = [None]
     wonders = [EgyptPyramids, None, None, None, None]
-    worker_pools = [WorkerPool(4, Resources({Resource.FOOD: -3})), WorkerPool(4, Resources({Resource.STABILITY: -3}))]
-    starting_resources = Resources({Resource.FOOD: 2, Resource.STONE: 7, Resource.GOLD: 5})
+    worker_pools = [WorkerPool(4, FrozenResources({Resource.FOOD: -3})), WorkerPool(4, FrozenResources({Resource.STABILITY: -3}))]
+    starting_resources = FrozenResources({Resource.FOOD: 2, Resource.STONE: 7, Resource.GOLD: 5})
     starting_points = 4
     starting_workers = 5
 
 class EthiopiaStele(StartingBuilding):
     name = 'Stele'
     abbr = 'Et_Stl'
-    production_per_worker = Resources({Resource.GOLD: 1, Resource.STABILITY: 1, Resource.BOOKS: 1})
+    production_per_worker = FrozenResources({Resource.GOLD: 1, Resource.STABILITY: 1, Resource.BOOKS: 1})
 
 class EthiopiaQuarry(StartingBuilding):
     name = 'Quarry'
     abbr = 'Et_qry'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.GOLD: 1})
 
 class EthiopiaAxeman(StartingMilitary):
     name = 'Axeman'
     abbr = 'Et_Axm'
-    production_per_worker = Resources({Resource.MILITARY: 2, Resource.FOOD: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 2, Resource.FOOD: -1})
 
 class EthiopiaFarm(StartingBuilding):
     name = 'Farm'
     abbr = 'Et_Frm'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.FOOD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.FOOD: 1})
 
 class EthiopiaSpecial(Special):
     """Player Order: Add [Stability] to [Military]"""
@@ -347,7 +342,7 @@ class EthiopiaSpecial(Special):
         self.register_for_event('extra player order military', self.owned, self.stability)
 
     def stability(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} adds [Stability] to [Military] for determining player order.')
+        self.match.log('[{}] {} adds [Stability] to [Military] for determining player order.', self, player)
         return player.resources[Resource.STABILITY]
 
 class Ethiopia(Nation):
@@ -360,33 +355,33 @@ class Ethiopia(Nation):
     colonies = [None, None]
     wonders_under_construction = [None]
     wonders = [None, None, None, None, None]
-    worker_pools = [WorkerPool(4, Resources({Resource.FOOD: -3})), WorkerPool(4, Resources({Resource.STABILITY: -3}))]
-    starting_resources = Resources({Resource.FOOD: 4, Resource.STONE: 7, Resource.GOLD: 5})
+    worker_pools = [WorkerPool(4, FrozenResources({Resource.FOOD: -3})), WorkerPool(4, FrozenResources({Resource.STABILITY: -3}))]
+    starting_resources = FrozenResources({Resource.FOOD: 4, Resource.STONE: 7, Resource.GOLD: 5})
     starting_points = 5
     starting_workers = 5
 
 class GreeceFarm(StartingBuilding):
     name = 'Farm'
     abbr = 'G_Frm'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.FOOD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.FOOD: 1})
 
 class GreeceQuarry(StartingBuilding):
     name = 'Quarry'
     abbr = 'G_Qry'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.GOLD: 1})
 
 class GreeceHoplite(StartingMilitary):
     name = 'Hoplite'
     abbr = 'G_Hpl'
     worker_points = (1, 1)
     raid_value = 3
-    production_per_worker = Resources({Resource.MILITARY: 3, Resource.STONE: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 3, Resource.STONE: -1})
 
 class GreeceLyceum(StartingBuilding):
     name = 'Lyceum'
     abbr = 'G_Lyc'
     worker_points = (1, 1)
-    production_per_worker = Resources({Resource.BOOKS: 2, Resource.STONE: 1})
+    production_per_worker = FrozenResources({Resource.BOOKS: 2, Resource.STONE: 1})
 
 class GreeceSpecial(Special):
     """Golden age bonus: 1"""
@@ -404,37 +399,37 @@ class Greece(Nation):
     colonies = [None, None]
     wonders_under_construction = [None]
     wonders = [None, None, None, None, None]
-    worker_pools = [WorkerPool(4, Resources({Resource.FOOD: -3})), WorkerPool(4, Resources({Resource.STABILITY: -3}))]
-    starting_resources = Resources({Resource.FOOD: 3, Resource.STONE: 6, Resource.GOLD: 6})
+    worker_pools = [WorkerPool(4, FrozenResources({Resource.FOOD: -3})), WorkerPool(4, FrozenResources({Resource.STABILITY: -3}))]
+    starting_resources = FrozenResources({Resource.FOOD: 3, Resource.STONE: 6, Resource.GOLD: 6})
     starting_points = 5
     starting_workers = 5
 
 class IndiaTemple(StartingBuilding):
     name = 'Temple'
     abbr = 'I_Tpl'
-    production_per_worker = Resources({Resource.BOOKS: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.BOOKS: 1, Resource.GOLD: 1})
 
 class IndiaQuarry(StartingBuilding):
     name = 'Quarry'
     abbr = 'I_Qry'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.GOLD: 1})
 
 class IndiaChariot(StartingMilitary):
     name = 'Chariot'
     abbr = 'I_Crt'
     worker_points = (2,)
     raid_value = 3
-    production_per_worker = Resources({Resource.MILITARY: 3, Resource.GOLD: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 3, Resource.GOLD: -1})
 
 class IndiaFarm(StartingBuilding):
     name = 'Farm'
     abbr = 'I_Frm'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.FOOD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.FOOD: 1})
 
 class IndiaSpecial(Special):
     name = 'India Special'
     abbr = 'I_S'
-    production_value = Resources({Resource.FOOD: 2})
+    production_value = FrozenResources({Resource.FOOD: 2})
 
 class IndiaVaranasi(StartingWonder):
     """Production: per undeployed [Worker]: 1 [Book] 1 [Food]"""
@@ -443,11 +438,11 @@ class IndiaVaranasi(StartingWonder):
     points = 0
 
     def produce(self, projected=False):
-        production = self.production_value.production()
+        production = self.production_value.production().copy()
         if self.owner.workers:
             extra_production = Resources({Resource.BOOKS: self.owner.workers, Resource.FOOD: self.owner.workers})
             if not projected:
-                self.match.log(f'[{self}] {self.owner} produces an extra {extra_production}.')
+                self.match.log('[{}] {} produces an extra {}.', self, self.owner, extra_production)
             production += extra_production
         return production
 
@@ -461,8 +456,8 @@ class India(Nation):
     colonies = [None, None]
     wonders_under_construction = [None]
     wonders = [IndiaVaranasi, None, None, None, None]
-    worker_pools = [WorkerPool(4, Resources({Resource.FOOD: -3})), WorkerPool(4, Resources({Resource.STABILITY: -3}))]
-    starting_resources = Resources({Resource.FOOD: 3, Resource.STONE: 4, Resource.GOLD: 6})
+    worker_pools = [WorkerPool(4, FrozenResources({Resource.FOOD: -3})), WorkerPool(4, FrozenResources({Resource.STABILITY: -3}))]
+    starting_resources = FrozenResources({Resource.FOOD: 3, Resource.STONE: 4, Resource.GOLD: 6})
     starting_points = 4
     starting_workers = 5
 
@@ -470,7 +465,7 @@ class JapanEmperor(StartingAdvisor):
     """Buy Advisor: Discard, +1 [Marker]; +1 [Military] per [Marker]"""
     name = 'Emperor'
     abbr = 'J_Epr'
-    production_value = Resources({Resource.STABILITY: 2})
+    production_value = FrozenResources({Resource.STABILITY: 2})
 
     def new_round(self):
         pass
@@ -484,7 +479,7 @@ class JapanEmperor(StartingAdvisor):
 
     def gain_military(self, player, **kwargs):
         card = kwargs['card']
-        self.match.log(f'[{self}] {player} discards "{card}" and gains 1 [Military].')
+        self.match.log('[{}] {} discards "{}" and gains 1 [Military].', self, player, card)
         self.markers += 1
         player.resources[Resource.MILITARY] += 1
         return True
@@ -492,22 +487,22 @@ class JapanEmperor(StartingAdvisor):
 class JapanTemple(StartingBuilding):
     name = 'Temple'
     abbr = 'J_Tpl'
-    production_per_worker = Resources({Resource.BOOKS: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.BOOKS: 1, Resource.GOLD: 1})
 
 class JapanQuarry(StartingBuilding):
     name = 'Quarry'
     abbr = 'J_Qry'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.GOLD: 1})
 
 class JapanAxeman(StartingMilitary):
     name = 'Axeman'
     abbr = 'J_Axm '
-    production_per_worker = Resources({Resource.MILITARY: 2, Resource.FOOD: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 2, Resource.FOOD: -1})
 
 class JapanRiceFields(StartingBuilding):
     name = 'Rice Fields'
     abbr = 'J_RcFd'
-    production_per_worker = Resources({Resource.FOOD: 3})
+    production_per_worker = FrozenResources({Resource.FOOD: 3})
 
 class JapanHokkaido(StartingBuilding):
     name = 'Hokkaido'
@@ -515,7 +510,7 @@ class JapanHokkaido(StartingBuilding):
     deployment_cost = -0
     worker_points = ()
     max_workers = True
-    production_per_worker = Resources()
+    production_per_worker = FrozenResources()
 
 class Japan(Nation):
     name = 'Japan'
@@ -527,22 +522,22 @@ class Japan(Nation):
     colonies = [None, None]
     wonders_under_construction = [None]
     wonders = [None, None, None, None, None]
-    worker_pools = [WorkerPool(4, Resources({Resource.FOOD: -3})), WorkerPool(4, Resources({Resource.STABILITY: -3}))]
-    starting_resources = Resources({Resource.FOOD: 3, Resource.STONE: 6, Resource.GOLD: 7})
+    worker_pools = [WorkerPool(4, FrozenResources({Resource.FOOD: -3})), WorkerPool(4, FrozenResources({Resource.STABILITY: -3}))]
+    starting_resources = FrozenResources({Resource.FOOD: 3, Resource.STONE: 6, Resource.GOLD: 7})
     starting_points = 5
     starting_workers = 5
 
     def place_dynasty(self, player, card):
         for (i, slot) in enumerate(player.buildings_military):
             if slot is not None and slot.is_dynasty():
-                self.match.log(f'{player} replaces "{slot}".')
+                self.match.log('{} replaces "{}".', player, slot)
                 player.remove(slot)
                 player.buildings_military[i] = card
                 break
         else:
             for (i, slot) in reversed(list(enumerate(player.buildings_military))):
                 if slot is None:
-                    self.match.log(f'{player} uses an empty slot.')
+                    self.match.log('{} uses an empty slot.', player)
                     player.buildings_military[i] = card
                     break
             else:
@@ -550,32 +545,32 @@ class Japan(Nation):
                 slot = self.match.get_move(player, 'Replace which building/military slot?', slots)
                 (slot_type, index) = player.slot_type_index_from_slot(slot)
                 old_card = player.slots_from_slot_type(slot_type)[index]
-                self.match.log(f'{player} replaces "{old_card}".')
+                self.match.log('{} replaces "{}".', player, old_card)
                 player.remove(old_card)
                 player.slots_from_slot_type(slot_type)[index] = card
 
 class KoreaTemple(StartingBuilding):
     name = 'Temple'
     abbr = 'K_Tpl'
-    production_per_worker = Resources({Resource.BOOKS: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.BOOKS: 1, Resource.GOLD: 1})
 
 class KoreaQuarry(StartingBuilding):
     name = 'Quarry'
     abbr = 'K_Qry'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.GOLD: 1})
 
 class KoreaArcher(StartingMilitary):
     name = 'Archer'
     abbr = 'K_Arc'
     worker_points = (1, 1)
     raid_value = 4
-    production_per_worker = Resources({Resource.MILITARY: 2})
+    production_per_worker = FrozenResources({Resource.MILITARY: 2})
 
 class KoreaConfucianAcadamy(StartingBuilding):
     name = 'Confucian Academy'
     abbr = 'K_CfAc'
     worker_points = (1, 1)
-    production_per_worker = Resources({Resource.STABILITY: 2, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STABILITY: 2, Resource.GOLD: 1})
 
 class KoreaSpecial(Special):
     """Buy Golden Age: May also hire 2 [Architects] for free"""
@@ -591,16 +586,16 @@ class KoreaSpecial(Special):
 
     def may_hire(self, player, **kwargs):
         architects = 1 if self.match.korea_nerf else 2
-        self.match.log(f'[{self}] {player} may hire up to {architects} [Architect{s_if_not_1(architects)}] for free.')
+        self.match.log('[{}] {} may hire up to {} [Architect{}] for free.', self, player, architects, s_if_not_1(architects))
         for i in range(architects):
             if player.incomplete_wonder_stages():
                 answer = self.match.get_move(player, 'Hire [Architect] for free?', ('Yes', 'No'))
                 if answer == 'Yes':
                     card = player.wonders_under_construction[0]
-                    self.match.log(f'[{self}] {player} hires a free architect for "{card}".')
+                    self.match.log('[{}] {} hires a free architect for "{}".', self, player, card)
                     player.hire_free_architect(card)
             else:
-                self.match.log(f'[{self}] {player} has no wonders under construction.')
+                self.match.log('[{}] {} has no wonders under construction.', self, player)
                 break
 
 class Korea(Nation):
@@ -613,8 +608,8 @@ class Korea(Nation):
     colonies = [None, None]
     wonders_under_construction = [None]
     wonders = [None, None, None, None, None]
-    worker_pools = [WorkerPool(4, Resources({Resource.FOOD: -3})), WorkerPool(4, Resources({Resource.STABILITY: -3}))]
-    starting_resources = Resources({Resource.FOOD: 2, Resource.STONE: 6, Resource.GOLD: 5})
+    worker_pools = [WorkerPool(4, FrozenResources({Resource.FOOD: -3})), WorkerPool(4, FrozenResources({Resource.STABILITY: -3}))]
+    starting_resources = FrozenResources({Resource.FOOD: 2, Resource.STONE: 6, Resource.GOLD: 5})
     starting_points = 4
     starting_workers = 5
 
@@ -622,23 +617,23 @@ class MaliSaltCaravan(StartingBuilding):
     name = 'Salt Caravan'
     abbr = 'Ml_StCv'
     deployment_cost = -2
-    production_per_worker = Resources({Resource.FOOD: 1, Resource.STABILITY: 1, Resource.BOOKS: 1})
+    production_per_worker = FrozenResources({Resource.FOOD: 1, Resource.STABILITY: 1, Resource.BOOKS: 1})
 
 class MaliQuarry(StartingBuilding):
     name = 'Quarry'
     abbr = 'Ml_Qry'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.GOLD: 1})
 
 class MaliGoldMine(StartingBuilding):
     name = 'Gold Mine'
     abbr = 'Ml_GdMn'
     max_workers = True
-    production_per_worker = Resources({Resource.GOLD: 3})
+    production_per_worker = FrozenResources({Resource.GOLD: 3})
 
 class MaliFarm(StartingBuilding):
     name = 'Farm'
     abbr = 'Ml_Frm'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.FOOD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.FOOD: 1})
 
 class MaliSpecial(Special):
     """Growth: [Gold] bonus: +1 [Gold]; Golden Age bonus: 1"""
@@ -658,7 +653,7 @@ class MaliSpecial(Special):
         return 1
 
     def log_extra_gold(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains an extra 1 [Gold].')
+        self.match.log('[{}] {} gains an extra 1 [Gold].', self, player)
 
 class Mali(Nation):
     name = 'Mali'
@@ -670,20 +665,20 @@ class Mali(Nation):
     colonies = [None, None]
     wonders_under_construction = [None]
     wonders = [None, None, None, None, None]
-    worker_pools = [WorkerPool(4, Resources({Resource.FOOD: -3})), WorkerPool(4, Resources({Resource.STABILITY: -3}))]
-    starting_resources = Resources({Resource.FOOD: 3, Resource.STONE: 7, Resource.GOLD: 5})
+    worker_pools = [WorkerPool(4, FrozenResources({Resource.FOOD: -3})), WorkerPool(4, FrozenResources({Resource.STABILITY: -3}))]
+    starting_resources = FrozenResources({Resource.FOOD: 3, Resource.STONE: 7, Resource.GOLD: 5})
     starting_points = 4
     starting_workers = 5
 
 class MongoliaYurt(StartingBuilding):
     name = 'Yurt'
     abbr = 'Mg_Yrt'
-    production_per_worker = Resources({Resource.FOOD: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.FOOD: 1, Resource.GOLD: 1})
 
 class MongoliaCaravan(StartingBuilding):
     name = 'Caravan'
     abbr = 'Mg_Crv'
-    production_per_worker = Resources({Resource.STABILITY: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STABILITY: 1, Resource.GOLD: 1})
 
 class MongoliaHorseArcher(StartingMilitary):
     name = 'Horse Archer'
@@ -691,7 +686,7 @@ class MongoliaHorseArcher(StartingMilitary):
     deployment_cost = -2
     worker_points = (1, 1, 2)
     raid_value = 4
-    production_per_worker = Resources({Resource.MILITARY: 5, Resource.FOOD: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 5, Resource.FOOD: -1})
 
 class MongoliaSteppe(StartingBuilding):
     name = 'Steppe'
@@ -699,7 +694,7 @@ class MongoliaSteppe(StartingBuilding):
     deployment_cost = -0
     worker_points = ()
     max_workers = True
-    production_per_worker = Resources()
+    production_per_worker = FrozenResources()
 
 class MongoliaSpecial(Special):
     """All: Defeats cost 2 same extra ([Food] / [Stone] / [Gold] / [Books])"""
@@ -712,7 +707,7 @@ class MongoliaSpecial(Special):
         self.global_effect = True
 
     def two(self, player, **kwargs):
-        self.match.log(f'[{self}] Defeats cost 2 extra {self.match.war.penalty_resource}.')
+        self.match.log('[{}] Defeats cost 2 extra {}.', self, self.match.war.penalty_resource)
         return 2
 
 class Mongolia(Nation):
@@ -725,31 +720,31 @@ class Mongolia(Nation):
     colonies = [None, None]
     wonders_under_construction = [None]
     wonders = [None, None, None, None, None]
-    worker_pools = [WorkerPool(3, Resources({Resource.FOOD: -3})), WorkerPool(5, Resources({Resource.MILITARY: -3}))]
-    starting_resources = Resources({Resource.FOOD: 3, Resource.STONE: 6, Resource.GOLD: 7})
+    worker_pools = [WorkerPool(3, FrozenResources({Resource.FOOD: -3})), WorkerPool(5, FrozenResources({Resource.MILITARY: -3}))]
+    starting_resources = FrozenResources({Resource.FOOD: 3, Resource.STONE: 6, Resource.GOLD: 7})
     starting_points = 4
     starting_workers = 4
 
 class PersiaQuarry(StartingBuilding):
     name = 'Quarry'
     abbr = 'Ps_Qry'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.GOLD: 1})
 
 class PersiaAxeman(StartingMilitary):
     name = 'Axeman'
     abbr = 'Ps_Axm'
-    production_per_worker = Resources({Resource.MILITARY: 2, Resource.FOOD: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 2, Resource.FOOD: -1})
 
 class PersiaZiggurat(StartingBuilding):
     name = 'Ziggurat'
     abbr = 'Ps_Zgr'
     worker_points = (1, 1)
-    production_per_worker = Resources({Resource.STABILITY: 2, Resource.STONE: 1})
+    production_per_worker = FrozenResources({Resource.STABILITY: 2, Resource.STONE: 1})
 
 class PersiaTemple(StartingBuilding):
     name = 'Temple'
     abbr = 'Ps_Tpl'
-    production_per_worker = Resources({Resource.BOOKS: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.BOOKS: 1, Resource.GOLD: 1})
 
 class Persia(Nation):
     name = 'Persia'
@@ -761,22 +756,22 @@ class Persia(Nation):
     colonies = [None, None, None]
     wonders_under_construction = [None]
     wonders = [None, None, None, None, None]
-    worker_pools = [WorkerPool(4, Resources({Resource.FOOD: -3})), WorkerPool(4, Resources({Resource.STABILITY: -3}))]
-    starting_resources = Resources({Resource.FOOD: 3, Resource.STONE: 5, Resource.GOLD: 7})
+    worker_pools = [WorkerPool(4, FrozenResources({Resource.FOOD: -3})), WorkerPool(4, FrozenResources({Resource.STABILITY: -3}))]
+    starting_resources = FrozenResources({Resource.FOOD: 3, Resource.STONE: 5, Resource.GOLD: 7})
     starting_points = 4
     starting_workers = 5
 
     def place_dynasty(self, player, card):
         for (i, slot) in enumerate(player.colonies):
             if slot is not None and slot.is_dynasty():
-                self.match.log(f'{player} replaces "{slot}".')
+                self.match.log('{} replaces "{}".', player, slot)
                 player.remove(slot)
                 player.colonies[i] = card
                 break
         else:
             for (i, slot) in reversed(list(enumerate(player.colonies))):
                 if slot is None:
-                    self.match.log(f'{player} uses an empty colony slot.')
+                    self.match.log('{} uses an empty colony slot.', player)
                     player.colonies[i] = card
                     break
             else:
@@ -784,30 +779,30 @@ class Persia(Nation):
                 slot = self.match.get_move(player, 'Replace which colony?', slots)
                 (slot_type, index) = player.slot_type_index_from_slot(slot)
                 old_card = player.slots_from_slot_type(slot_type)[index]
-                self.match.log(f'{player} replaces "{old_card}".')
+                self.match.log('{} replaces "{}".', player, old_card)
                 player.remove(old_card)
                 player.slots_from_slot_type(slot_type)[index] = card
 
 class PolandTemple(StartingBuilding):
     name = 'Temple'
     abbr = 'Pl_Tpl'
-    production_per_worker = Resources({Resource.BOOKS: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.BOOKS: 1, Resource.GOLD: 1})
 
 class PolandForge(StartingBuilding):
     name = 'Forge'
     abbr = 'Pl_Frg'
     worker_points = (1, 1)
-    production_per_worker = Resources({Resource.STONE: 2, Resource.FOOD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 2, Resource.FOOD: 1})
 
 class PolandAxeman(StartingMilitary):
     name = 'Axeman'
     abbr = 'Pl_Axm'
-    production_per_worker = Resources({Resource.MILITARY: 2, Resource.FOOD: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 2, Resource.FOOD: -1})
 
 class PolandQuarry(StartingBuilding):
     name = 'Quarry'
     abbr = 'Pl_Qry'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.GOLD: 1})
 
 class PolandSpecial(Special):
     """War: +3 [Books] if you are not defeated"""
@@ -819,7 +814,7 @@ class PolandSpecial(Special):
         self.register_for_event('not defeated', self.owned, self.gain_books)
 
     def gain_books(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 3 [Books].')
+        self.match.log('[{}] {} gains 3 [Books].', self, player)
         player.resources[Resource.BOOKS] += 3
 
 class Poland(Nation):
@@ -832,31 +827,31 @@ class Poland(Nation):
     colonies = [None]
     wonders_under_construction = [None]
     wonders = [None, None, None, None, None, None]
-    worker_pools = [WorkerPool(4, Resources({Resource.FOOD: -3})), WorkerPool(4, Resources({Resource.STABILITY: -3}))]
-    starting_resources = Resources({Resource.FOOD: 3, Resource.STONE: 5, Resource.GOLD: 5})
+    worker_pools = [WorkerPool(4, FrozenResources({Resource.FOOD: -3})), WorkerPool(4, FrozenResources({Resource.STABILITY: -3}))]
+    starting_resources = FrozenResources({Resource.FOOD: 3, Resource.STONE: 5, Resource.GOLD: 5})
     starting_points = 3
     starting_workers = 5
 
 class PortugalTemple(StartingBuilding):
     name = 'Temple'
     abbr = 'Pg_Tpl'
-    production_per_worker = Resources({Resource.BOOKS: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.BOOKS: 1, Resource.GOLD: 1})
 
 class PortugalLighthouse(StartingBuilding):
     name = 'Lighthouse'
     abbr = 'Pg_Lth'
     worker_points = (1, 1)
-    production_per_worker = Resources({Resource.GOLD: 2, Resource.STONE: 1})
+    production_per_worker = FrozenResources({Resource.GOLD: 2, Resource.STONE: 1})
 
 class PortugalCaravan(StartingBuilding):
     name = 'Caravan'
     abbr = 'Pg_Crv'
-    production_per_worker = Resources({Resource.STABILITY: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STABILITY: 1, Resource.GOLD: 1})
 
 class PortugalFarm(StartingBuilding):
     name = 'Farm'
     abbr = 'Pg_Frm'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.FOOD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.FOOD: 1})
 
 class PortugalSpecial(Special):
     """Buy Progress card: Row 3 cost 1 [Gold] less"""
@@ -872,7 +867,7 @@ class PortugalSpecial(Special):
 
     def card_discount(self, player, **kwargs):
         if not kwargs.get('check', False):
-            self.match.log(f'[{self}] {player} pays 1 [Gold] less for cards from row 3.')
+            self.match.log('[{}] {} pays 1 [Gold] less for cards from row 3.', self, player)
         return 1
 
 class Portugal(Nation):
@@ -885,38 +880,38 @@ class Portugal(Nation):
     colonies = [None, None]
     wonders_under_construction = [None]
     wonders = [None, None, None, None, None]
-    worker_pools = [WorkerPool(4, Resources({Resource.FOOD: -3})), WorkerPool(4, Resources({Resource.STABILITY: -3}))]
-    starting_resources = Resources({Resource.FOOD: 2, Resource.STONE: 6, Resource.GOLD: 5})
+    worker_pools = [WorkerPool(4, FrozenResources({Resource.FOOD: -3})), WorkerPool(4, FrozenResources({Resource.STABILITY: -3}))]
+    starting_resources = FrozenResources({Resource.FOOD: 2, Resource.STONE: 6, Resource.GOLD: 5})
     starting_points = 2
     starting_workers = 5
 
 class RomeFarm(StartingBuilding):
     name = 'Farm'
     abbr = 'R_Frm'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.FOOD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.FOOD: 1})
 
 class RomeQuarry(StartingBuilding):
     name = 'Quarry'
     abbr = 'R_Qry'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.GOLD: 1})
 
 class RomeLegionary(StartingMilitary):
     name = 'Legionary'
     abbr = 'R_Lgn'
     worker_points = (1, 1)
     raid_value = 3
-    production_per_worker = Resources({Resource.MILITARY: 3, Resource.FOOD: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 3, Resource.FOOD: -1})
 
 class RomeAqueduct(StartingBuilding):
     name = 'Aqueduct'
     abbr = 'R_Aqd'
     worker_points = (1, 1)
-    production_per_worker = Resources({Resource.FOOD: 2, Resource.STABILITY: 1})
+    production_per_worker = FrozenResources({Resource.FOOD: 2, Resource.STABILITY: 1})
 
 class RomeSpecial(Special):
     name = 'Rome Special'
     abbr = 'R_S'
-    production_value = Resources({Resource.MILITARY: 2})
+    production_value = FrozenResources({Resource.MILITARY: 2})
 
 class Rome(Nation):
     name = 'Rome'
@@ -928,20 +923,20 @@ class Rome(Nation):
     colonies = [None, None]
     wonders_under_construction = [None]
     wonders = [None, None, None, None, None]
-    worker_pools = [WorkerPool(4, Resources({Resource.FOOD: -3})), WorkerPool(4, Resources({Resource.STABILITY: -3}))]
-    starting_resources = Resources({Resource.FOOD: 2, Resource.STONE: 6, Resource.GOLD: 6})
+    worker_pools = [WorkerPool(4, FrozenResources({Resource.FOOD: -3})), WorkerPool(4, FrozenResources({Resource.STABILITY: -3}))]
+    starting_resources = FrozenResources({Resource.FOOD: 2, Resource.STONE: 6, Resource.GOLD: 6})
     starting_points = 4
     starting_workers = 5
 
 class VeniceGlassBlower(StartingBuilding):
     name = 'Glass Blower'
     abbr = 'Vn_GlBw'
-    production_per_worker = Resources({Resource.BOOKS: 2})
+    production_per_worker = FrozenResources({Resource.BOOKS: 2})
 
 class VeniceQuarry(StartingBuilding):
     name = 'Quarry'
     abbr = 'Vn_Qry'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.GOLD: 1})
 
 class VeniceTrireme(StartingMilitary):
     name = 'Trireme'
@@ -949,12 +944,12 @@ class VeniceTrireme(StartingMilitary):
     deployment_cost = -2
     worker_points = (1, 1)
     raid_value = 3
-    production_per_worker = Resources({Resource.MILITARY: 3})
+    production_per_worker = FrozenResources({Resource.MILITARY: 3})
 
 class VeniceFarm(StartingBuilding):
     name = 'Farm'
     abbr = 'Vn_Frm'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.FOOD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.FOOD: 1})
 
 class VeniceSpecial(Special):
     """Pass last: +2 [Books]"""
@@ -969,7 +964,7 @@ class VeniceSpecial(Special):
         return player is self.owner and player.passed_last
 
     def gain_books(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 2 [Books].')
+        self.match.log('[{}] {} gains 2 [Books].', self, player)
         player.resources[Resource.BOOKS] += 2
 
 class VeniceConstantinople(StartingColony):
@@ -983,7 +978,7 @@ class VeniceConstantinople(StartingColony):
 
     def golden_age_discount(self, player, **kwargs):
         if not kwargs.get('check', False):
-            self.match.log(f'[{self}] {player} pays 1 less resource for a point.')
+            self.match.log('[{}] {} pays 1 less resource for a point.', self, player)
         return 1
 
 class Venice(Nation):
@@ -996,31 +991,31 @@ class Venice(Nation):
     colonies = [None, VeniceConstantinople]
     wonders_under_construction = [None]
     wonders = [None, None, None, None, None]
-    worker_pools = [WorkerPool(4, Resources({Resource.FOOD: -3})), WorkerPool(4, Resources({Resource.STABILITY: -3}))]
-    starting_resources = Resources({Resource.FOOD: 3, Resource.STONE: 6, Resource.GOLD: 6})
+    worker_pools = [WorkerPool(4, FrozenResources({Resource.FOOD: -3})), WorkerPool(4, FrozenResources({Resource.STABILITY: -3}))]
+    starting_resources = FrozenResources({Resource.FOOD: 3, Resource.STONE: 6, Resource.GOLD: 6})
     starting_points = 5
     starting_workers = 5
 
 class VikingsStaveChurch(StartingBuilding):
     name = 'Stave Church'
     abbr = 'Vk_StCh'
-    production_per_worker = Resources({Resource.STABILITY: 1, Resource.BOOKS: 1})
+    production_per_worker = FrozenResources({Resource.STABILITY: 1, Resource.BOOKS: 1})
 
 class VikingsQuarry(StartingBuilding):
     name = 'Quarry'
     abbr = 'Vk_Qry'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.GOLD: 1})
 
 class VikingsBerserkers(StartingMilitary):
     name = 'Berserkers'
     abbr = 'Vk_Bsk'
     raid_value = 3
-    production_per_worker = Resources({Resource.MILITARY: 3, Resource.FOOD: -2})
+    production_per_worker = FrozenResources({Resource.MILITARY: 3, Resource.FOOD: -2})
 
 class VikingsFarm(StartingBuilding):
     name = 'Farm'
     abbr = 'Vk_Frm'
-    production_per_worker = Resources({Resource.STONE: 1, Resource.FOOD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 1, Resource.FOOD: 1})
 
 class VikingsSpecial(Special):
     """After production: Choose 1 ([Food] [Stone] [Gold] [Books]): Others lose 1 of that resource"""
@@ -1035,7 +1030,7 @@ class VikingsSpecial(Special):
     def raze(self, player, **kwargs):
         options = (Resources({Resource.FOOD: 1}), Resources({Resource.STONE: 1}), Resources({Resource.GOLD: 1}), Resources({Resource.BOOKS: 1}))
         loss = self.match.get_move(player, 'Others lose which resource?', options)
-        self.match.log(f'[{self}] {player} chose for other nations to lose {loss}.')
+        self.match.log('[{}] {} chose for other nations to lose {}.', self, player, loss)
         self.match.get_move(player, 'Confirm?', ('Confirm',))
         for other_player in self.match.players[::-1]:
             if other_player is not player:
@@ -1057,7 +1052,7 @@ class VikingsOldUppsala(StartingWonder):
 
     def activate(self, player):
         self.markers += 1
-        self.match.log(f'[{self}] {player} pays 1 [Food] and gains 3 [Military] this round.')
+        self.match.log('[{}] {} pays 1 [Food] and gains 3 [Military] this round.', self, player)
         player.resources[Resource.FOOD] -= 1
         player.resources[Resource.MILITARY] += 3
 
@@ -1068,7 +1063,7 @@ class VikingsOldUppsala(StartingWonder):
         return player is self.owner and self.markers
 
     def reduce_military(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} loses 3 [Military].')
+        self.match.log('[{}] {} loses 3 [Military].', self, player)
         player.resources[Resource.MILITARY] -= 3
 
 class Vikings(Nation):
@@ -1081,8 +1076,8 @@ class Vikings(Nation):
     colonies = [None, None]
     wonders_under_construction = [None]
     wonders = [VikingsOldUppsala, None, None, None, None]
-    worker_pools = [WorkerPool(4, Resources({Resource.FOOD: -3})), WorkerPool(4, Resources({Resource.STABILITY: -3}))]
-    starting_resources = Resources({Resource.FOOD: 2, Resource.STONE: 5, Resource.GOLD: 6})
+    worker_pools = [WorkerPool(4, FrozenResources({Resource.FOOD: -3})), WorkerPool(4, FrozenResources({Resource.STABILITY: -3}))]
+    starting_resources = FrozenResources({Resource.FOOD: 2, Resource.STONE: 5, Resource.GOLD: 6})
     starting_points = 3
     starting_workers = 5
 
@@ -1107,4 +1102,8 @@ for nation in all_nations:
         if card is not None:
             all_nation_cards.append(card)
 nation_card_abbrs = {card.abbr: card.name for card in all_nation_cards}
-nation_card_abbrs['K_S_Nerf'] = 'Korea Special'
+
+class KoreaSpecialNerf(KoreaSpecial):
+    abbr = 'K_S_Nerf'
+
+nation_card_abbrs[KoreaSpecialNerf.abbr] = KoreaSpecialNerf.name
@@ -2,9 +2,11 @@ from .utils import *
 from .exceptions import *
 from .resources import *
 from .actions import *
-from . import nations
+from .phases import *
 
 class Player:
+    __slots__ = ('match', 'name', 'nation', 'resources', 'points', 'workers', 'grown_workers', 'extra_worker_pool', 'worker_pools', 'growth_resources', 'turmoil', 'dynasties', 'advisors', 'buildings_military', 'specials', 'colonies', 'wonders_under_construction', 'wonders', 'extra_cards', 'most_stability', 'least_stability', 'most_military', 'least_military', 'resource_deficit_points', 'passed', 'passed_first', 'passed_last', 'bought_colony_this_round', 'need_confirmation', 'remaining_main_actions', 'action_number', 'turn_number', 'card_views', 'projected_production', 'projected_card_points')
+
     def __init__(self, match, name):
         self.match = match
         self.name = name
@@ -23,6 +25,8 @@ class Player:
         self.passed_last = False
         self.bought_colony_this_round = False
         self.need_confirmation = False
+        self.card_views = {}
+        self.projections_changed()
 
     def __str__(self):
         return self.name
@@ -33,7 +37,27 @@ class Player:
     def completed_slots(self):
         return self.advisors + self.buildings_military + self.specials + self.colonies + self.wonders
 
+    def cards_changed(self):
+        self.card_views = {}
+        self.projections_changed()
+
+    def projections_changed(self):
+        self.projected_production = None
+        self.projected_card_points = None
+
+    def card_view(self, name):
+        cards = self.card_views.get(name)
+        if cards is None:
+            cards = getattr(self, f'build_{name}')()
+            self.card_views[name] = cards
+        elif self.match.check_card_views and cards != getattr(self, f'build_{name}')():
+            raise StaleCardView(f'Cached {name} for {self} is out of date.')
+        return cards
+
     def all_cards(self):
+        return self.card_view('all_cards')
+
+    def build_all_cards(self):
         cards = []
         for card in self.all_slots():
             while card is not None:
@@ -42,6 +66,9 @@ class Player:
         return cards
 
     def incomplete_wonders(self):
+        return self.card_view('incomplete_wonders')
+
+    def build_incomplete_wonders(self):
         cards = []
         for card in self.wonders_under_construction:
             while card is not None:
@@ -50,6 +77,9 @@ class Player:
         return cards
 
     def dynasty_cards(self):
+        return self.card_view('dynasty_cards')
+
+    def build_dynasty_cards(self):
         cards = []
         for card in self.dynasties:
             if card is not None:
@@ -57,6 +87,9 @@ class Player:
         return cards
 
     def completed_cards(self):
+        return self.card_view('completed_cards')
+
+    def build_completed_cards(self):
         cards = []
         for card in self.completed_slots():
             while card is not None:
@@ -65,6 +98,9 @@ class Player:
         return cards
 
     def slot_names_cards(self):
+        return self.card_view('slot_names_cards')
+
+    def build_slot_names_cards(self):
         slots_cards = []
         for (i, card) in enumerate(self.advisors):
             slots_cards.append((f'A{i + 1}', card))
@@ -79,6 +115,9 @@ class Player:
         return slots_cards
 
     def filled_slot_names_cards(self):
+        return self.card_view('filled_slot_names_cards')
+
+    def build_filled_slot_names_cards(self):
         slot_names_cards = []
         for (slot, card) in self.slot_names_cards():
             while card is not None:
@@ -96,60 +135,52 @@ class Player:
         return {'A': self.advisors, 'BM': self.buildings_military, 'S': self.specials, 'C': self.colonies, 'W': self.wonders}[slot_type]
 
     def building_cards(self):
-        cards = []
-        for card in self.completed_cards():
-            if card.is_building():
-                cards.append(card)
-        return cards
+        return self.card_view('building_cards')
+
+    def build_building_cards(self):
+        return [card for card in self.completed_cards() if card.is_building()]
 
     def military_cards(self):
-        cards = []
-        for card in self.completed_cards():
-            if card.is_military():
-                cards.append(card)
-        return cards
+        return self.card_view('military_cards')
+
+    def build_military_cards(self):
+        return [card for card in self.completed_cards() if card.is_military()]
 
     def colony_cards(self):
-        cards = []
-        for card in self.completed_cards():
-            if card.is_colony():
-                cards.append(card)
-        return cards
+        return self.card_view('colony_cards')
+
+    def build_colony_cards(self):
+        return [card for card in self.completed_cards() if card.is_colony()]
 
     def advisor_cards(self):
-        cards = []
-        for card in self.completed_cards():
-            if card.is_advisor():
-                cards.append(card)
-        return cards
+        return self.card_view('advisor_cards')
+
+    def build_advisor_cards(self):
+        return [card for card in self.completed_cards() if card.is_advisor()]
 
     def removable_advisor_cards(self):
-        cards = []
-        for card in self.completed_cards():
-            if card.is_advisor() and card.age > 0:
-                cards.append(card)
-        return cards
+        return self.card_view('removable_advisor_cards')
+
+    def build_removable_advisor_cards(self):
+        return [card for card in self.completed_cards() if card.is_advisor() and card.age > 0]
 
     def natural_wonder_cards(self):
-        cards = []
-        for card in self.completed_cards():
-            if card.is_natural_wonder():
-                cards.append(card)
-        return cards
+        return self.card_view('natural_wonder_cards')
+
+    def build_natural_wonder_cards(self):
+        return [card for card in self.completed_cards() if card.is_natural_wonder()]
 
     def building_military_cards(self):
-        cards = []
-        for card in self.completed_cards():
-            if card.is_building_military():
-                cards.append(card)
-        return cards
+        return self.card_view('building_military_cards')
+
+    def build_building_military_cards(self):
+        return [card for card in self.completed_cards() if card.is_building_military()]
 
     def wonder_natural_wonder_cards(self):
-        cards = []
-        for card in self.completed_cards():
-            if card.is_wonder_natural_wonder():
-                cards.append(card)
-        return cards
+        return self.card_view('wonder_natural_wonder_cards')
+
+    def build_wonder_natural_wonder_cards(self):
+        return [card for card in self.completed_cards() if card.is_wonder_natural_wonder()]
 
     def incomplete_wonder_stages(self):
         total = 0
@@ -170,11 +201,10 @@ class Player:
         self.wonders_under_construction = nation.wonders_under_construction[:]
         self.wonders = nation.wonders[:]
         self.extra_cards = []
+        self.cards_changed()
         for card in self.all_cards():
             card.assign_owner(self)
-        self.worker_pools = []
-        for worker_pool in nation.worker_pools:
-            self.worker_pools.append(nations.WorkerPool(worker_pool.spots, worker_pool.resource_cost_per_worker))
+        self.worker_pools = nation.worker_pools[:]
         initial_books = self.resources[Resource.BOOKS]
         self.resources = Resources(nation.starting_resources)
         for card in (self.advisors + self.buildings_military + self.specials + self.colonies + self.wonders):
@@ -233,14 +263,14 @@ class Player:
         growth_chosen = self.match.get_move(self, 'Take what for growth?', growth_options)
         if '[Worker]' in str(growth_chosen):
             if self.extra_worker_pool:
-                self.match.log(f'{self} chooses to take a [Worker] for growth.')
+                self.match.log('{} chooses to take a [Worker] for growth.', self)
                 self.extra_worker_pool -= 1
                 self.workers += 1
                 self.grown_workers += 1
             else:
                 for worker_pool in self.worker_pools:
                     if growth_chosen.startswith(str(worker_pool.resource_cost_per_worker)):
-                        self.match.log(f'{self} chooses to take a {worker_pool.resource_cost_per_worker} [Worker] for growth.')
+                        self.match.log('{} chooses to take a {} [Worker] for growth.', self, worker_pool.resource_cost_per_worker)
                         if worker_pool.resource_cost_per_worker.immediate():
                             self.resources += worker_pool.resource_cost_per_worker.immediate()
                             self.match.update_most_least_stability_military()
@@ -253,20 +283,30 @@ class Player:
             for (resource_type, growth_option) in growth_options_with_extra_resources.items():
                 if growth_chosen[resource_type]:
                     self.match.events.happen('received extra growth resources', self, growth=growth_option)
-            self.match.log(f'{self} chooses to take {growth_chosen} for growth.')
+            self.match.log('{} chooses to take {} for growth.', self, growth_chosen)
             self.resources += growth_chosen
         self.match.get_move(self, 'Confirm?', ('Confirm',))
 
     def can_buy_card(self, card, row, free=False):
+        return self.can_buy_cards([(card, row)], free=free)[0]
+
+    def can_buy_cards(self, cards_rows, free=False):
+        events = self.match.events
+        candidates = list(range(len(cards_rows)))
         if not free:
-            price = row
-            price += self.match.events.happen('extra card cost', self, card=card, check=True)
-            price = self.match.events.happen('card discount', self, card=card, row=row, cost=price, check=True)
-            extra_payment = self.match.events.happen('extra payment', self, card=card, check=True)
-            if self.resources[Resource.GOLD] < price + extra_payment:
-                return False
-        if any(self.match.events.happen('may not buy card', self, card=card, check=True)):
-            return False
+            card_queries = [{'card': card} for (card, row) in cards_rows]
+            extra_costs = events.happen_batch('extra card cost', self, card_queries, check=True)
+            prices = events.happen_batch('card discount', self, [{'card': card, 'row': row, 'cost': row + extra_cost} for ((card, row), extra_cost) in zip(cards_rows, extra_costs)], check=True)
+            extra_payments = events.happen_batch('extra payment', self, card_queries, check=True)
+            candidates = [i for i in candidates if self.resources[Resource.GOLD] >= prices[i] + extra_payments[i]]
+        may_not_buy = events.happen_batch('may not buy card', self, [{'card': cards_rows[i][0]} for i in candidates], check=True)
+        candidates = [i for (i, reasons) in zip(candidates, may_not_buy) if not any(reasons)]
+        can_buy = [False] * len(cards_rows)
+        for i in candidates:
+            can_buy[i] = self.meets_card_requirements(cards_rows[i][0])
+        return can_buy
+
+    def meets_card_requirements(self, card):
         if card.is_colony():
             military_requirement = card.military_requirement + self.match.events.happen('extra colony military requirement', self, check=True)
             military_requirement = self.match.events.happen('colony discount', self, cost=military_requirement, check=True)
@@ -288,11 +328,9 @@ class Player:
         return True
 
     def buy_actions(self, free=False):
-        possible_buys = []
-        for (row, cards_in_row) in enumerate(self.match.progress_board):
-            for (col, card) in enumerate(cards_in_row):
-                if card is not None and self.can_buy_card(card, row + 1, free=free):
-                    possible_buys.append(BuyAction(row, col, card))
+        board_cards = [(row, col, card) for (row, cards_in_row) in enumerate(self.match.progress_board) for (col, card) in enumerate(cards_in_row) if card is not None]
+        can_buy = self.can_buy_cards([(card, row + 1) for (row, col, card) in board_cards], free=free)
+        possible_buys = [BuyAction(row, col, card) for ((row, col, card), buyable) in zip(board_cards, can_buy) if buyable]
         for (player, card) in [additional_buy for additional_buys in self.match.events.happen('additional buys', self) for additional_buy in additional_buys]:
             possible_buys.append(BuyAction(-1, -1, card, player=player))
         return possible_buys
@@ -402,13 +440,14 @@ class Player:
             card_to_cover = old_card
             old_card = card_to_cover.covered_by
         if old_card is not None:
-            self.match.log(f'{self} replaces "{old_card}".')
+            self.match.log('{} replaces "{}".', self, old_card)
             self.match.events.happen('replaced card', self, old_card=old_card, new_card=card)
             self.remove(old_card)
         if card_to_cover is not None:
             card_to_cover.covered_by = card
         else:
             self.slots_from_slot_type(slot_type)[index] = card
+        self.cards_changed()
         self.resources += card.production_value.immediate()
         card.placed()
         if update_most_least_stability_military:
@@ -416,6 +455,7 @@ class Player:
 
     def cover_with(self, card_to_cover, card):
         card_to_cover.covered_by = card
+        self.cards_changed()
         self.resources += card.production_value.immediate()
         card.placed()
         self.match.update_most_least_stability_military()
@@ -425,19 +465,19 @@ class Player:
             raise InvalidMove('Already at war!')
         self.match.war = card
         war_value = min(40, max(0, self.resources[Resource.MILITARY]))
-        self.match.log(f'War value set to {war_value}.')
+        self.match.log('War value set to {}.', war_value)
         self.match.war_value = war_value
 
     def do_battle(self, allow_no_raid=False):
         raid_value = self.raid_value()
         if not raid_value:
             if allow_no_raid:
-                self.match.log(f'{self} does not have a raid value, so gains no resources.')
+                self.match.log('{} does not have a raid value, so gains no resources.', self)
                 return
             raise InvalidMove('Cannot buy a battle without a military [Worker].')
         choices = [Resources({Resource.BOOKS: raid_value}), Resources({Resource.FOOD: raid_value}), Resources({Resource.STONE: raid_value})]
         benefit = self.match.get_move(self, 'Take which resources?', choices)
-        self.match.log(f'{self} gains {benefit}.')
+        self.match.log('{} gains {}.', self, benefit)
         self.resources += benefit
 
     def pay_for_golden_age_point(self, card):
@@ -469,7 +509,7 @@ class Player:
                         remainder -= resources_to_pay
                 if remainder:
                     payment[available_resource_types[-1]] += remainder
-        self.match.log(f'{self} pays {payment} and gains 1 [Point].')
+        self.match.log('{} pays {} and gains 1 [Point].', self, payment)
         self.resources -= payment
         self.points += 1
         self.match.events.happen('bought golden age point', self)
@@ -500,7 +540,7 @@ class Player:
         elif benefit_string == 'Buy 1 [Point]':
             self.pay_for_golden_age_point(card)
         else:
-            self.match.log(f'{self} gains {benefit}.')
+            self.match.log('{} gains {}.', self, benefit)
             self.resources += benefit
             if benefit[Resource.BOOKS]:
                 self.match.events.happen('golden age choose books', self)
@@ -536,7 +576,7 @@ class Player:
                 extra_payment = self.match.events.happen('extra payment', self, card=card)
                 if self.resources[Resource.GOLD] < price + extra_payment:
                     raise InvalidMove(f'Not enough [Gold] to buy "{card}".')
-                self.match.log(f'{self} pays {price} [Gold] to buy "{card}".')
+                self.match.log('{} pays {} [Gold] to buy "{}".', self, price, card)
                 self.resources[Resource.GOLD] -= price
                 if extra_payment:
                     self.match.events.happen('make extra payment', self, card=card)
@@ -571,8 +611,9 @@ class Player:
             old_card = self.wonders_under_construction[0]
             if old_card is not None:
                 old_card.global_effect = False
-                self.match.log(f'{self} replaces wonder under construction, "{old_card}".')
+                self.match.log('{} replaces wonder under construction, "{}".', self, old_card)
             self.wonders_under_construction[0] = card
+            self.cards_changed()
         elif card.is_war():
             self.declare_war(card)
         elif card.is_battle():
@@ -596,13 +637,13 @@ class Player:
         cost = self.match.events.happen('deploy discount', self, card=card, cost=cost)
         if self.resources[Resource.STONE] < cost:
             raise InvalidMove(f'Not enough resources to deploy to "{card}".')
-        self.match.log(f'{self} pays {cost} [Stone] to deploy to "{card}".')
+        self.match.log('{} pays {} [Stone] to deploy to "{}".', self, cost, card)
         self.resources[Resource.STONE] -= cost
         self.deploy_for_free(card)
 
     def undeploy_action(self, action, update_most_least_stability_military=True):
         card = action.card
-        self.match.log(f'{self} undeploys 1 [Worker] from "{card}".')
+        self.match.log('{} undeploys 1 [Worker] from "{}".', self, card)
         card.undeploy()
         self.workers += 1
         if update_most_least_stability_military:
@@ -620,21 +661,23 @@ class Player:
         (slot_type, index) = self.slot_type_index_from_slot(slot)
         old_card = self.wonders[index]
         if old_card is not None:
-            self.match.log(f'{self} replaces "{old_card}".')
+            self.match.log('{} replaces "{}".', self, old_card)
             self.match.events.happen('replaced card', self, old_card=old_card, new_card=card)
             self.remove(old_card)
         self.wonders[index] = card
+        self.cards_changed()
         self.resources += card.production_value.immediate()
 
     def hire_free_architect(self, card):
         card.completed_stages += 1
         self.match.events.happen('hire architect', self)
         if card.completed_stages == len(card.stage_costs):
-            self.match.log(f'"{card}" is ready.')
+            self.match.log('"{}" is ready.', card)
             self.match.events.happen('wonder ready', self)
             card.ready()
             self.place_wonder_or_natural_wonder(card)
             self.wonders_under_construction[0] = None
+            self.cards_changed()
             card.completed_stages = 0
             card.placed()
             self.match.update_most_least_stability_military()
@@ -651,24 +694,25 @@ class Player:
         if self.resources[Resource.STONE] < cost:
             raise InvalidMove(f'Not enough resources for next stage of "{card}".')
         if private is None:
-            self.match.log(f'{self} pays {cost} [Stone] to hire an architect for "{card}".')
+            self.match.log('{} pays {} [Stone] to hire an architect for "{}".', self, cost, card)
             self.match.architects -= 1
         else:
-            self.match.log(f'{self} pays {cost} [Stone] to hire a private architect from "{private}" for "{card}".')
+            self.match.log('{} pays {} [Stone] to hire a private architect from "{}" for "{}".', self, cost, private, card)
             private.private_architects_available -= 1
         self.resources[Resource.STONE] -= cost
         self.hire_free_architect(card)
 
     def explore_action(self, action):
         card = action.card
-        self.match.log(f'{self} explores "{card}".')
+        self.match.log('{} explores "{}".', self, card)
         card.turns_explored += 1
         if card.turns_explored == card.exploration_turns:
-            self.match.log(f'"{card}" has been discovered.')
+            self.match.log('"{}" has been discovered.', card)
             card.discovered()
             self.match.events.happen('discover', self, card=card)
             self.place_wonder_or_natural_wonder(card)
             self.wonders_under_construction[0] = None
+            self.cards_changed()
             card.turns_explored = 0
             card.placed()
             self.match.update_most_least_stability_military()
@@ -679,10 +723,11 @@ class Player:
 
     def play_dynasty(self, card, defer_taking_turmoil=False):
         self.match.stats.collect(self.match, 'Dynasty Played', card.name)
-        self.match.log(f'{self} plays "{card}".')
+        self.match.log('{} plays "{}".', self, card)
         for i in range(len(self.dynasties)):
             if self.dynasties[i] is card:
                 self.dynasties[i] = None
+        self.cards_changed()
         if defer_taking_turmoil:
             self.turmoil += 1
             self.resources[Resource.STABILITY] -= 2
@@ -694,11 +739,12 @@ class Player:
                 self.specials[0] = card
         else:
             self.nation.place_dynasty(self, card)
+        self.cards_changed()
         self.resources += card.production_value.immediate()
         return card.play()
 
     def turmoil_action(self, action):
-        self.match.log(f'{self} takes a turmoil card.')
+        self.match.log('{} takes a turmoil card.', self)
         self.match.turmoil -= 1
         defer_taking_turmoil = any(self.match.events.happen('defer taking turmoil', self))
         if not defer_taking_turmoil:
@@ -717,7 +763,7 @@ class Player:
                     self.play_dynasty(card, defer_taking_turmoil=defer_taking_turmoil)
                     break
         else:
-            self.match.log(f'{self} gains 2 [Gold].')
+            self.match.log('{} gains 2 [Gold].', self)
             if defer_taking_turmoil and not any(self.match.events.happen('discard gold turmoil', self)):
                 self.turmoil += 1
                 self.resources[Resource.STABILITY] -= 2
@@ -725,7 +771,7 @@ class Player:
         self.match.update_most_least_stability_military()
 
     def pass_action(self, action):
-        self.match.log(f'{self} passes.')
+        self.match.log('{} passes.', self)
         self.passed = True
         max_most_min_least = 1 if len(self.match.players) < 5 else 2
         passed_players = [player for player in self.match.players if player.passed]
@@ -733,14 +779,15 @@ class Player:
             self.passed_first = True
         if len(passed_players) > len(self.match.players) - max_most_min_least:
             self.passed_last = True
+        self.projections_changed()
         self.match.events.happen('pass', self)
 
     def resign_action(self, action):
         self.match.get_move(self, 'Are you sure you want to resign?', ('Yes',))
         self.match.get_move(self, 'Confirm?', ('Confirm',))
-        self.match.log(f'{self} resigns.')
+        self.match.log('{} resigns.', self)
         other_player = [player for player in self.match.players if player is not self][0]
-        self.match.log(f'{other_player} wins!')
+        self.match.log('{} wins!', other_player)
         self.match.end_match()
 
     def take_action(self, action):
@@ -770,7 +817,7 @@ class Player:
             possible_actions.append(PassAction())
             if len(self.match.players) == 2:
                 possible_actions.append(ResignAction())
-            action = self.match.get_move(self, 'Which action?', possible_actions)
+            action = self.match.get_move(self, 'Which action?', possible_actions, resumable=True)
         self.take_action(action)
         if action.action_type is ActionType.PASS:
             self.remaining_main_actions = 0
@@ -786,13 +833,16 @@ class Player:
         self.remaining_main_actions = 1
         if any(self.match.events.happen('additional action', self)):
             self.remaining_main_actions += 1
+        self.continue_turn()
+
+    def continue_turn(self):
         while self.remaining_main_actions:
             self.take_one_action()
         while self.need_confirmation:
             possible_actions = [ConfirmAction()]
             if not self.passed and not self.explore_actions():
                 possible_actions += self.undeploy_actions()
-            action = self.match.get_move(self, 'Complete the turn?', possible_actions)
+            action = self.match.get_move(self, 'Complete the turn?', possible_actions, resumable=True)
             if action.action_type is ActionType.CONFIRM:
                 return
             self.take_action(action)
@@ -807,7 +857,7 @@ class Player:
         if not self.may_take_workers(from_extra=from_extra):
             raise InvalidMove('Not enough workers available to take.')
         if from_extra and self.extra_worker_pool:
-            self.match.log(f'{self} takes a [Worker] from the extra worker pool.')
+            self.match.log('{} takes a [Worker] from the extra worker pool.', self)
             self.extra_worker_pool -= 1
             self.workers += 1
             self.grown_workers += 1
@@ -822,7 +872,7 @@ class Player:
                 worker_chosen = self.match.get_move(self, 'Take which type of [Worker]?', worker_options)
             for worker_pool in self.worker_pools:
                 if worker_chosen.startswith(str(worker_pool.resource_cost_per_worker)):
-                    self.match.log(f'{self} takes a {worker_pool.resource_cost_per_worker} [Worker].')
+                    self.match.log('{} takes a {} [Worker].', self, worker_pool.resource_cost_per_worker)
                     if update_immediate_production and worker_pool.resource_cost_per_worker.immediate():
                         self.resources += worker_pool.resource_cost_per_worker.immediate()
                         self.match.update_most_least_stability_military()
@@ -830,13 +880,14 @@ class Player:
                     self.workers += 1
                     self.grown_workers += 1
                     break
+        self.match.projections_changed()
         self.match.events.happen('take worker', self, growth=False)
 
     def return_worker(self, no_confirmation=False):
         if self.workers == 0:
             possible_undeploys = self.undeploy_actions()
             if not possible_undeploys:
-                self.match.log(f'{self} has no workers that can be returned!')
+                self.match.log('{} has no workers that can be returned!', self)
                 return
             if len(possible_undeploys) == 1:
                 undeploy = possible_undeploys[0]
@@ -848,7 +899,7 @@ class Player:
             if worker_pool.may_return_worker():
                 return_options.append(f'{worker_pool.resource_cost_per_worker} [Worker]')
         if not return_options:
-            self.match.log(f'{self} returns a [Worker] to the extra worker pool.')
+            self.match.log('{} returns a [Worker] to the extra worker pool.', self)
             self.extra_worker_pool += 1
         else:
             if len(return_options) == 1:
@@ -857,13 +908,14 @@ class Player:
                 return_chosen = self.match.get_move(self, 'Return what type of worker?', return_options)
             for worker_pool in self.worker_pools:
                 if return_chosen.startswith(str(worker_pool.resource_cost_per_worker)):
-                    self.match.log(f'{self} returns a {worker_pool.resource_cost_per_worker} [Worker].')
+                    self.match.log('{} returns a {} [Worker].', self, worker_pool.resource_cost_per_worker)
                     if worker_pool.resource_cost_per_worker.immediate():
                         self.resources -= worker_pool.resource_cost_per_worker.immediate()
                     worker_pool.return_worker()
                     break
         self.workers -= 1
         self.grown_workers -= 1
+        self.match.projections_changed()
         self.match.update_most_least_stability_military()
         if self.need_confirmation and not no_confirmation:
             self.match.get_move(self, 'Confirm?', ('Confirm',))
@@ -884,7 +936,7 @@ class Player:
                     if card.is_building_military():
                         workers = card.deployed_workers
                         if workers:
-                            self.match.log(f'{self} undeploys {workers} [Worker{s_if_not_1(workers)}] from "{card}".')
+                            self.match.log('{} undeploys {} [Worker{}] from "{}".', self, workers, s_if_not_1(workers), card)
                         while card.deployed_workers:
                             card.undeploy()
                         self.workers += workers
@@ -897,6 +949,7 @@ class Player:
                         while base_card.covered_by is not card:
                             base_card = base_card.covered_by
                         base_card.covered_by = card.covered_by
+                    self.cards_changed()
                     self.match.events.happen('when removed', self, card=card)
                     card.unregister_all_events()
         self.match.update_most_least_stability_military()
@@ -932,10 +985,10 @@ class Player:
 
     def lose_point(self):
         if self.points > 0:
-            self.match.log(f'{self} loses 1 [Point].')
+            self.match.log('{} loses 1 [Point].', self)
             self.points -= 1
         else:
-            self.match.log(f'{self} is spared the [Point] loss.')
+            self.match.log('{} is spared the [Point] loss.', self)
 
     def lose_resources(self, resources_to_lose, lost_to_war=False):
         if lost_to_war:
@@ -947,7 +1000,7 @@ class Player:
             if self.resources[resource_type] + amount >= 0:
                 self.resources[resource_type] += amount
             else:
-                self.match.log(f'{self} goes negative in {resource_type}!')
+                self.match.log('{} goes negative in {}!', self, resource_type)
                 if resource_type is Resource.BOOKS:
                     mentioned_negative_books = True
                 remainder += self.resources[resource_type] + amount
@@ -955,50 +1008,50 @@ class Player:
                 if any(self.match.events.happen('no resource point loss', self)):
                     pass
                 elif not self.resource_deficit_points[resource_type] and self.points:
-                    self.match.log(f'{self} loses 1 [Point] for negative {resource_type}.')
+                    self.match.log('{} loses 1 [Point] for negative {}.', self, resource_type)
                     self.points -= 1
                     if lost_to_war:
                         self.match.events.happen('lost to war', self, points=1)
                     self.resource_deficit_points[resource_type] = -1
                 elif self.resource_deficit_points[resource_type]:
-                    self.match.log(f'{self} already lost a [Point] for negative {resource_type}.')
+                    self.match.log('{} already lost a [Point] for negative {}.', self, resource_type)
                 else:
-                    self.match.log(f'{self} is spared the [Point] loss.')
+                    self.match.log('{} is spared the [Point] loss.', self)
         if remainder:
             remainder = -remainder
             if self.resources[Resource.BOOKS]:
-                self.match.log(f'{self} loses {remainder} [Book{s_if_not_1(remainder)}] for negative resources.')
+                self.match.log('{} loses {} [Book{}] for negative resources.', self, remainder, s_if_not_1(remainder))
             if self.resources[Resource.BOOKS] - remainder >= 0:
                 self.resources[Resource.BOOKS] -= remainder
                 remainder = 0
             else:
                 remainder -= self.resources[Resource.BOOKS]
                 self.resources[Resource.BOOKS] = 0
-                self.match.log(f'{self} goes negative in [Books] and must lose {remainder} other resources.')
+                self.match.log('{} goes negative in [Books] and must lose {} other resources.', self, remainder)
                 if any(self.match.events.happen('no resource point loss', self)):
                     pass
                 elif not self.resource_deficit_points[Resource.BOOKS] and self.points:
-                    self.match.log(f'{self} loses 1 [Point] for negative [Books].')
+                    self.match.log('{} loses 1 [Point] for negative [Books].', self)
                     self.points -= 1
                     if lost_to_war:
                         self.match.events.happen('lost to war', self, points=1)
                     self.resource_deficit_points[Resource.BOOKS] = -1
                 elif self.resource_deficit_points[Resource.BOOKS]:
                     if not mentioned_negative_books:
-                        self.match.log(f'{self} already lost a [Point] for negative [Books].')
+                        self.match.log('{} already lost a [Point] for negative [Books].', self)
                 else:
-                    self.match.log(f'{self} is spared the [Point] loss.')
+                    self.match.log('{} is spared the [Point] loss.', self)
                 if self.resources.production().total() == 0:
-                    self.match.log(f'{self} has no remaining resources to lose.')
+                    self.match.log('{} has no remaining resources to lose.', self)
                     self.resources -= self.resources.production()
                 elif self.resources.production().total() - remainder <= 0:
-                    self.match.log(f'{self} loses all remaining resources.')
+                    self.match.log('{} loses all remaining resources.', self)
                     self.resources -= self.resources.production()
                 else:
                     available_resources = self.resources.production()
                     if len(available_resources) == 1:
                         for resource_type in available_resources:
-                            self.match.log(f'{self} loses {remainder} {resource_type} for going negative in [Books].')
+                            self.match.log('{} loses {} {} for going negative in [Books].', self, remainder, resource_type)
                             self.resources[resource_type] -= remainder
                     else:
                         loss = Resources()
@@ -1018,7 +1071,7 @@ class Player:
                                 remainder -= amount_to_lose
                         if remainder:
                             loss[available_resource_types[-1]] += remainder
-                        self.match.log(f'{self} loses {loss} for going negative in [Books].')
+                        self.match.log('{} loses {} for going negative in [Books].', self, loss)
                         self.resources -= loss
                         self.match.get_move(self, 'Confirm resource loss?', ('Confirm',))
         if lost_to_war:
@@ -1026,36 +1079,43 @@ class Player:
             self.match.events.happen('lost to war', self, resources=total_loss)
 
     def production(self, projected=False):
-        total_production = Resources()
-        for card in self.completed_cards():
-            total_production += card.produce(projected=projected)
-        for worker_pool in self.worker_pools:
-            total_production += worker_pool.total_resource_cost
-        for additional_production in self.match.events.happen('additional production', self, production=total_production, projected=projected):
-            total_production += additional_production
+        cached = projected and self.match.phase is Phase.ACTION
+        if cached and self.projected_production is not None:
+            total_production = self.projected_production.copy()
+        else:
+            total_production = Resources()
+            for card in self.completed_cards():
+                total_production += card.produce(projected=projected)
+            for worker_pool in self.worker_pools:
+                total_production += worker_pool.total_resource_cost
+            for additional_production in self.match.events.happen('additional production', self, production=total_production, projected=projected):
+                total_production += additional_production
+            if cached:
+                self.projected_production = total_production.copy()
         if self.resources[Resource.STABILITY] < 0:
             total_production[Resource.BOOKS] += self.resources[Resource.STABILITY]
         if self.resources[Resource.MILITARY] < 0:
             total_production[Resource.BOOKS] += self.resources[Resource.MILITARY]
-        return total_production.production()
+        total_production.keep_production()
+        return total_production
 
     def produce(self):
         total_production = self.production()
         if self.resources[Resource.STABILITY] < 0:
-            self.match.log(f'{self} is in revolt!')
+            self.match.log('{} is in revolt!', self)
             if self.points > 0:
-                self.match.log(f'{self} loses 1 [Point] for revolt.')
+                self.match.log('{} loses 1 [Point] for revolt.', self)
                 self.points -= 1
             else:
-                self.match.log(f'{self} is spared the [Point] loss.')
+                self.match.log('{} is spared the [Point] loss.', self)
         if self.resources[Resource.MILITARY] < 0:
-            self.match.log(f'{self} has negative [Military]!')
+            self.match.log('{} has negative [Military]!', self)
             if self.points > 0:
-                self.match.log(f'{self} loses 1 [Point] for negative [Military].')
+                self.match.log('{} loses 1 [Point] for negative [Military].', self)
                 self.points -= 1
             else:
-                self.match.log(f'{self} is spared the [Point] loss.')
-        self.match.log(f'{self} produces: {total_production.production_str()}')
+                self.match.log('{} is spared the [Point] loss.', self)
+        self.match.log('{} produces: {}', self, total_production.production_str())
         positive_production = total_production.positive()
         negative_production = total_production.negative()
         self.resources += positive_production
@@ -1067,18 +1127,18 @@ class Player:
                 self.match.events.happen('defeated', self)
                 if not any(self.match.events.happen('spared war point loss', self)):
                     if self.points > 0:
-                        self.match.log(f'{self} loses 1 [Point] for being defeated in the "{self.match.war}".')
+                        self.match.log('{} loses 1 [Point] for being defeated in the "{}".', self, self.match.war)
                         self.points -= 1
                         self.match.events.happen('lost to war', self, points=1)
                     else:
-                        self.match.log(f'{self} is spared the [Point] loss from being defeated in the "{self.match.war}".')
+                        self.match.log('{} is spared the [Point] loss from being defeated in the "{}".', self, self.match.war)
                 resource_loss_amount = penalty.total()
                 if self.resources[Resource.STABILITY] > 0:
                     resource_loss_amount += self.resources[Resource.STABILITY]
                 if resource_loss_amount < 0:
                     if self.resources[Resource.STABILITY] > 0:
                         if len(penalty) == 1:
-                            self.match.log(f'{self} mitigates part of the resource loss with [Stability].')
+                            self.match.log('{} mitigates part of the resource loss with [Stability].', self)
                             resource_loss = Resources({resource_type: resource_loss_amount for resource_type in penalty})
                         else:
                             mitigation = Resources()
@@ -1097,17 +1157,17 @@ class Player:
                                     remainder -= amount_to_mitigate
                             if remainder:
                                 mitigation[penalty_resource_types[0]] += remainder
-                            self.match.log(f'{self} mitigates {mitigation} of the war penalty with [Stability].')
+                            self.match.log('{} mitigates {} of the war penalty with [Stability].', self, mitigation)
                             resource_loss = Resources(penalty)
                             resource_loss += mitigation
                     else:
                         resource_loss = penalty
-                    self.match.log(f'{self} loses {-resource_loss}.')
+                    self.match.log('{} loses {}.', self, -resource_loss)
                     self.lose_resources(resource_loss, lost_to_war=True)
                     if self.need_confirmation:
                         self.match.get_move(self, 'Confirm war resolution?', ('Confirm',))
                 else:
-                    self.match.log(f'{self} mitigates the resource loss entirely with [Stability].')
+                    self.match.log('{} mitigates the resource loss entirely with [Stability].', self)
             return True
         else:
             self.match.events.happen('not defeated', self)
@@ -1119,7 +1179,7 @@ class Player:
 
     def discard_turmoil(self):
         if self.turmoil:
-            self.match.log(f'{self} discards {self.turmoil} turmoil card{s_if_not_1(self.turmoil)} and gains {2 * self.turmoil} [Stability].')
+            self.match.log('{} discards {} turmoil card{} and gains {} [Stability].', self, self.turmoil, s_if_not_1(self.turmoil), 2 * self.turmoil)
             self.resources[Resource.STABILITY] += 2 * self.turmoil
             self.turmoil = 0
 
@@ -1127,15 +1187,22 @@ class Player:
         if self.nation is None:
             return 0
         extra_stone = self.match.events.happen('extra scoring stone', self, projected=projected)
-        total = self.points
-        for card in self.colony_cards():
-            total += card.points
-        for card in self.wonder_natural_wonder_cards():
-            total += card.points
-        for card in self.building_military_cards():
-            total += sum(card.worker_points[:min(len(card.worker_points),card.deployed_workers)])
-        for card in self.completed_cards():
-            total += card.bonus_points(projected)
+        cached = projected and self.match.phase is Phase.ACTION
+        if cached and self.projected_card_points is not None:
+            card_points = self.projected_card_points
+        else:
+            card_points = 0
+            for card in self.colony_cards():
+                card_points += card.points
+            for card in self.wonder_natural_wonder_cards():
+                card_points += card.points
+            for card in self.building_military_cards():
+                card_points += sum(card.worker_points[:min(len(card.worker_points),card.deployed_workers)])
+            for card in self.completed_cards():
+                card_points += card.bonus_points(projected)
+            if cached:
+                self.projected_card_points = card_points
+        total = self.points + card_points
         self.resources[Resource.STONE] += extra_stone
         total += self.resources.total() // 10
         self.resources[Resource.STONE] -= extra_stone
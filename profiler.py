@@ -0,0 +1,71 @@
+import time
+
+class EventProfiler:
+    def __init__(self, other_profilers=None):
+        self.event_stats = {}
+        self.card_stats = {}
+        if other_profilers is not None:
+            for other in other_profilers:
+                for (name, stats) in other.event_stats.items():
+                    self.add(self.event_stats, name, stats)
+                for (name, stats) in other.card_stats.items():
+                    self.add(self.card_stats, name, stats)
+
+    def add(self, all_stats, name, stats):
+        if name not in all_stats:
+            all_stats[name] = [0] * len(stats)
+        for (i, amount) in enumerate(stats):
+            all_stats[name][i] += amount
+
+    def happen(self, name, event, player, kwargs):
+        if name not in self.event_stats:
+            self.event_stats[name] = [0, 0, 0, 0.0]
+        event_stats = self.event_stats[name]
+        start = time.perf_counter()
+        if not event.registrations:
+            result = kwargs['cost'] if event.no_result is None else event.no_result
+        else:
+            values = []
+            for registration in event.registered():
+                if not registration.active:
+                    continue
+                card_name = type(registration.card).__name__
+                if card_name not in self.card_stats:
+                    self.card_stats[card_name] = [0, 0, 0.0, 0.0]
+                card_stats = self.card_stats[card_name]
+                condition_start = time.perf_counter()
+                if registration.owned:
+                    hit = player is registration.card.owner
+                else:
+                    hit = registration.condition(player, **kwargs)
+                event_start = time.perf_counter()
+                card_stats[0] += 1
+                card_stats[2] += event_start - condition_start
+                event_stats[1] += 1
+                if not hit:
+                    continue
+                card_stats[1] += 1
+                event_stats[2] += 1
+                values.append(registration.event(player, **kwargs))
+                card_stats[3] += time.perf_counter() - event_start
+            result = event.result(kwargs, values)
+        if event.static_totals:
+            result += event.static_totals.get(player, 0)
+        event_stats[0] += 1
+        event_stats[3] += time.perf_counter() - start
+        return result
+
+    def report(self, f):
+        print('Events:', file=f)
+        print(f'  {"Event":40} {"Calls":>9} {"Checked":>9} {"Hits":>9} {"Hit %":>6} {"Time ms":>9}', file=f)
+        for (name, (calls, checked, hits, seconds)) in sorted(self.event_stats.items(), key=lambda item: -item[1][3]):
+            print(f'  {name:40} {calls:9d} {checked:9d} {hits:9d} {hit_percentage(hits, checked):>6} {seconds * 1000:9.1f}', file=f)
+        print('Cards:', file=f)
+        print(f'  {"Card":40} {"Checked":>9} {"Hits":>9} {"Hit %":>6} {"Cond ms":>9} {"Event ms":>9}', file=f)
+        for (name, (checked, hits, condition_seconds, event_seconds)) in sorted(self.card_stats.items(), key=lambda item: -item[1][2] - item[1][3]):
+            print(f'  {name:40} {checked:9d} {hits:9d} {hit_percentage(hits, checked):>6} {condition_seconds * 1000:9.1f} {event_seconds * 1000:9.1f}', file=f)
+
+def hit_percentage(hits, checked):
+    if not checked:
+        return '-'
+    return f'{hits * 100 / checked:0.1f}'
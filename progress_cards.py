@@ -15,6 +15,8 @@ class ExtensionCard(Card):
     card_type = CardType.EXTENSION
 
 class BuildingMilitary(ProgressCard):
+    __slots__ = ('deployed_workers',)
+
     max_workers = False
 
     def reset(self):
@@ -34,10 +36,12 @@ class Building(BuildingMilitary):
         if self.max_workers and self.deployed_workers >= len(self.worker_points):
             raise InvalidMove(f'"{self}" already has the maximum number of [Workers].')
         self.deployed_workers += 1
+        self.owner.projections_changed()
         self.owner.resources += self.production_per_worker.immediate()
 
     def undeploy(self):
         self.deployed_workers -= 1
+        self.owner.projections_changed()
         self.owner.resources -= self.production_per_worker.immediate()
 
     def produce(self, projected=False):
@@ -50,6 +54,7 @@ class Military(BuildingMilitary):
         if self.max_workers and self.deployed_workers >= len(self.worker_points):
             raise InvalidMove(f'"{self}" already has the maximum number of [Workers].')
         self.deployed_workers += 1
+        self.owner.projections_changed()
         if any(self.match.events.happen('no military upkeep', self.owner)):
             self.owner.resources += self.production_per_worker.immediate().positive()
         else:
@@ -57,6 +62,7 @@ class Military(BuildingMilitary):
 
     def undeploy(self):
         self.deployed_workers -= 1
+        self.owner.projections_changed()
         if any(self.match.events.happen('no military upkeep', self.owner)):
             self.owner.resources -= self.production_per_worker.immediate().positive()
         else:
@@ -72,12 +78,26 @@ class Colony(ProgressCard):
     progress_card_type = ProgressCardType.COLONY
 
 class War(ProgressCard):
+    __slots__ = ('counts_as_battle',)
+
     progress_card_type = ProgressCardType.WAR
 
+    def reset(self):
+        super().reset()
+        self.counts_as_battle = False
+
+    def is_war(self):
+        return not self.counts_as_battle
+
+    def is_battle(self):
+        return self.counts_as_battle
+
 class Battle(ProgressCard):
     progress_card_type = ProgressCardType.BATTLE
 
 class Wonder(ProgressCard):
+    __slots__ = ('completed_stages',)
+
     progress_card_type = ProgressCardType.WONDER
 
     def reset(self):
@@ -103,6 +123,8 @@ class GoldenAge(ProgressCard):
     offers_stone = False
 
 class NaturalWonder(ProgressCard):
+    __slots__ = ('turns_explored',)
+
     progress_card_type = ProgressCardType.NATURAL_WONDER
 
     def reset(self):
@@ -130,62 +152,62 @@ class Age1Building(Building):
 class Aqueduct(Age1Building):
     name = 'Aqueduct'
     abbr = 'Aqd'
-    production_per_worker = Resources({Resource.FOOD: 2, Resource.STABILITY: 1})
+    production_per_worker = FrozenResources({Resource.FOOD: 2, Resource.STABILITY: 1})
 
 class Brewery(Age1Building):
     name = 'Brewery'
     abbr = 'Brw'
-    production_per_worker = Resources({Resource.FOOD: 2, Resource.BOOKS: 1})
+    production_per_worker = FrozenResources({Resource.FOOD: 2, Resource.BOOKS: 1})
 
 class CityWall(Age1Building):
     name = 'City Wall'
     abbr = 'CtWl'
-    production_per_worker = Resources({Resource.STONE: 2, Resource.STABILITY: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 2, Resource.STABILITY: 1})
 
 class ConfucianAcademy(Age1Building):
     name = 'Confucian Academy'
     abbr = 'CfAc'
-    production_per_worker = Resources({Resource.STABILITY: 2, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STABILITY: 2, Resource.GOLD: 1})
 
 class Forge(Age1Building):
     name = 'Forge'
     abbr = 'Frg'
-    production_per_worker = Resources({Resource.STONE: 2, Resource.FOOD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 2, Resource.FOOD: 1})
 
 class Forum(Age1Building):
     name = 'Forum'
     abbr = 'Frm'
-    production_per_worker = Resources({Resource.GOLD: 2, Resource.FOOD: 1})
+    production_per_worker = FrozenResources({Resource.GOLD: 2, Resource.FOOD: 1})
 
 class Granary(Age1Building):
     name = 'Granary'
     abbr = 'Grn'
-    production_per_worker = Resources({Resource.FOOD: 2, Resource.STONE: 1})
+    production_per_worker = FrozenResources({Resource.FOOD: 2, Resource.STONE: 1})
 
 class Library(Age1Building):
     name = 'Library'
     abbr = 'Lib'
-    production_per_worker = Resources({Resource.BOOKS: 2, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.BOOKS: 2, Resource.GOLD: 1})
 
 class Lighthouse(Age1Building):
     name = 'Lighthouse'
     abbr = 'Lth'
-    production_per_worker = Resources({Resource.GOLD: 2, Resource.STONE: 1})
+    production_per_worker = FrozenResources({Resource.GOLD: 2, Resource.STONE: 1})
 
 class Lyceum(Age1Building):
     name = 'Lyceum'
     abbr = 'Lyc'
-    production_per_worker = Resources({Resource.BOOKS: 2, Resource.STONE: 1})
+    production_per_worker = FrozenResources({Resource.BOOKS: 2, Resource.STONE: 1})
 
 class Mine(Age1Building):
     name = 'Mine'
     abbr = 'Min'
-    production_per_worker = Resources({Resource.STONE: 2, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 2, Resource.GOLD: 1})
 
 class Pagoda(Age1Building):
     name = 'Pagoda'
     abbr = 'Pgd'
-    production_per_worker = Resources({Resource.BOOKS: 2, Resource.STABILITY: 1})
+    production_per_worker = FrozenResources({Resource.BOOKS: 2, Resource.STABILITY: 1})
 
 class SilkRoad(Age1Building):
     name = 'Silk Road'
@@ -193,12 +215,12 @@ class SilkRoad(Age1Building):
     deployment_cost = -2
     worker_points = (3,)
     max_workers = True
-    production_per_worker = Resources({Resource.GOLD: 5, Resource.STONE: -1})
+    production_per_worker = FrozenResources({Resource.GOLD: 5, Resource.STONE: -1})
 
 class Synagogue(Age1Building):
     name = 'Synagogue'
     abbr = 'Sng'
-    production_per_worker = Resources({Resource.GOLD: 2, Resource.BOOKS: 1})
+    production_per_worker = FrozenResources({Resource.GOLD: 2, Resource.BOOKS: 1})
 
 class Vatican(Age1Building):
     name = 'Vatican'
@@ -206,12 +228,12 @@ class Vatican(Age1Building):
     deployment_cost = -2
     worker_points = (2,)
     max_workers = True
-    production_per_worker = Resources({Resource.BOOKS: 3, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.BOOKS: 3, Resource.GOLD: 1})
 
 class Ziggurat(Age1Building):
     name = 'Ziggurat'
     abbr = 'Zgr'
-    production_per_worker = Resources({Resource.STABILITY: 2, Resource.STONE: 1})
+    production_per_worker = FrozenResources({Resource.STABILITY: 2, Resource.STONE: 1})
 
 class Age2Building(Building):
     age = 2
@@ -221,22 +243,22 @@ class Age2Building(Building):
 class BallCourt(Age2Building):
     name = 'Ball Court'
     abbr = 'BlCt'
-    production_per_worker = Resources({Resource.GOLD: 3, Resource.FOOD: 1})
+    production_per_worker = FrozenResources({Resource.GOLD: 3, Resource.FOOD: 1})
 
 class Castle(Age2Building):
     name = 'Castle'
     abbr = 'Cas'
-    production_per_worker = Resources({Resource.STABILITY: 3, Resource.STONE: 1})
+    production_per_worker = FrozenResources({Resource.STABILITY: 3, Resource.STONE: 1})
 
 class Cathedral(Age2Building):
     name = 'Cathedral'
     abbr = 'Cat'
-    production_per_worker = Resources({Resource.STONE: 2, Resource.STABILITY: 2})
+    production_per_worker = FrozenResources({Resource.STONE: 2, Resource.STABILITY: 2})
 
 class GuildHall(Age2Building):
     name = 'Guild Hall'
     abbr = 'GdHl'
-    production_per_worker = Resources({Resource.STONE: 3, Resource.BOOKS: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 3, Resource.BOOKS: 1})
 
 class Hansa(Age2Building):
     name = 'Hansa'
@@ -244,64 +266,64 @@ class Hansa(Age2Building):
     deployment_cost = -4
     worker_points = (2, 2)
     max_workers = True
-    production_per_worker = Resources({Resource.FOOD: 4, Resource.STABILITY: 1})
+    production_per_worker = FrozenResources({Resource.FOOD: 4, Resource.STABILITY: 1})
 
 class Hippodrome(Age2Building):
     name = 'Hippodrome'
     abbr = 'Hip'
-    production_per_worker = Resources({Resource.STABILITY: 3, Resource.BOOKS: 1})
+    production_per_worker = FrozenResources({Resource.STABILITY: 3, Resource.BOOKS: 1})
 
 class KnightsTemplar(Age2Building):
     name = 'Knights Templar'
     abbr = 'KnTp'
     worker_points = (2,)
     max_workers = True
-    production_per_worker = Resources({Resource.STONE: 2, Resource.MILITARY: 4})
+    production_per_worker = FrozenResources({Resource.STONE: 2, Resource.MILITARY: 4})
 
 class Madrasa(Age2Building):
     name = 'Madrasa'
     abbr = 'Mdr'
-    production_per_worker = Resources({Resource.BOOKS: 2, Resource.GOLD: 2})
+    production_per_worker = FrozenResources({Resource.BOOKS: 2, Resource.GOLD: 2})
 
 class Market(Age2Building):
     name = 'Market'
     abbr = 'Mkt'
-    production_per_worker = Resources({Resource.GOLD: 2, Resource.FOOD: 2})
+    production_per_worker = FrozenResources({Resource.GOLD: 2, Resource.FOOD: 2})
 
 class Mint(Age2Building):
     name = 'Mint'
     abbr = 'Mnt'
-    production_per_worker = Resources({Resource.GOLD: 3, Resource.STABILITY: 1})
+    production_per_worker = FrozenResources({Resource.GOLD: 3, Resource.STABILITY: 1})
 
 class Monastery(Age2Building):
     name = 'Monastery'
     abbr = 'Mon'
-    production_per_worker = Resources({Resource.BOOKS: 3, Resource.FOOD: 1})
+    production_per_worker = FrozenResources({Resource.BOOKS: 3, Resource.FOOD: 1})
 
 class Mosque(Age2Building):
     name = 'Mosque'
     abbr = 'Msq'
-    production_per_worker = Resources({Resource.GOLD: 2, Resource.STABILITY: 2})
+    production_per_worker = FrozenResources({Resource.GOLD: 2, Resource.STABILITY: 2})
 
 class OceanFishing(Age2Building):
     name = 'Ocean Fishing'
     abbr = 'OcFs'
-    production_per_worker = Resources({Resource.FOOD: 2, Resource.STONE: 2})
+    production_per_worker = FrozenResources({Resource.FOOD: 2, Resource.STONE: 2})
 
 class University(Age2Building):
     name = 'University'
     abbr = 'Uni'
-    production_per_worker = Resources({Resource.STONE: 2, Resource.BOOKS: 2})
+    production_per_worker = FrozenResources({Resource.STONE: 2, Resource.BOOKS: 2})
 
 class Watermill(Age2Building):
     name = 'Watermill'
     abbr = 'Wtm'
-    production_per_worker = Resources({Resource.STONE: 3, Resource.FOOD: 1})
+    production_per_worker = FrozenResources({Resource.STONE: 3, Resource.FOOD: 1})
 
 class Windmill(Age2Building):
     name = 'Windmill'
     abbr = 'Wdm'
-    production_per_worker = Resources({Resource.FOOD: 3, Resource.GOLD: 1})
+    production_per_worker = FrozenResources({Resource.FOOD: 3, Resource.GOLD: 1})
 
 class Age3Building(Building):
     age = 3
@@ -311,19 +333,19 @@ class Age3Building(Building):
 class Bank(Age3Building):
     name = 'Bank'
     abbr = 'Bnk'
-    production_per_worker = Resources({Resource.GOLD: 3, Resource.BOOKS: 2})
+    production_per_worker = FrozenResources({Resource.GOLD: 3, Resource.BOOKS: 2})
 
 class Chateau(Age3Building):
     name = 'Chateau'
     abbr = 'Cht'
-    production_per_worker = Resources({Resource.STABILITY: 3, Resource.GOLD: 2})
+    production_per_worker = FrozenResources({Resource.STABILITY: 3, Resource.GOLD: 2})
 
 class CoffeeHouse(Age3Building):
     """Pass last: +2 [Books] per [Worker] on Coffee House"""
     name = 'Coffee House'
     abbr = 'CfHs'
     worker_points = (2, 1, 1, 2)
-    production_per_worker = Resources({Resource.FOOD: 2, Resource.GOLD: 2})
+    production_per_worker = FrozenResources({Resource.FOOD: 2, Resource.GOLD: 2})
 
     def buy(self):
         self.register_for_event('pass', self.passed_last, self.gain_books)
@@ -333,7 +355,7 @@ class CoffeeHouse(Age3Building):
 
     def gain_books(self, player, **kwargs):
         books = 2 * self.deployed_workers
-        self.match.log(f'[{self}] {player} will produce an extra {books} [Books].')
+        self.match.log('[{}] {} will produce an extra {} [Books].', self, player, books)
 
     def produce(self, projected=False):
         production = self.deployed_workers * self.production_per_worker.production()
@@ -344,69 +366,69 @@ class CoffeeHouse(Age3Building):
 class ColonialTrading(Age3Building):
     name = 'Colonial Trading'
     abbr = 'ClTr'
-    production_per_worker = Resources({Resource.GOLD: 3, Resource.STABILITY: 2})
+    production_per_worker = FrozenResources({Resource.GOLD: 3, Resource.STABILITY: 2})
 
 class Courthouse(Age3Building):
     name = 'Courthouse'
     abbr = 'Cth'
-    production_per_worker = Resources({Resource.STABILITY: 3, Resource.BOOKS: 2})
+    production_per_worker = FrozenResources({Resource.STABILITY: 3, Resource.BOOKS: 2})
 
 class Dike(Age3Building):
     name = 'Dike'
     abbr = 'Dik'
-    production_per_worker = Resources({Resource.STONE: 3, Resource.FOOD: 2})
+    production_per_worker = FrozenResources({Resource.STONE: 3, Resource.FOOD: 2})
 
 class Hammam(Age3Building):
     name = 'Hammam'
     abbr = 'Hmm'
-    production_per_worker = Resources({Resource.FOOD: 3, Resource.STABILITY: 2})
+    production_per_worker = FrozenResources({Resource.FOOD: 3, Resource.STABILITY: 2})
 
 class Observatory(Age3Building):
     name = 'Observatory'
     abbr = 'Obs'
-    production_per_worker = Resources({Resource.BOOKS: 3, Resource.STONE: 2})
+    production_per_worker = FrozenResources({Resource.BOOKS: 3, Resource.STONE: 2})
 
 class Parliament(Age3Building):
     name = 'Parliament'
     abbr = 'Plm'
-    production_per_worker = Resources({Resource.STONE: 3, Resource.STABILITY: 2})
+    production_per_worker = FrozenResources({Resource.STONE: 3, Resource.STABILITY: 2})
 
 class Potosi(Age3Building):
     name = 'Potosi'
     abbr = 'Pts'
     worker_points = (1,)
     max_workers = True
-    production_per_worker = Resources({Resource.GOLD: 7})
+    production_per_worker = FrozenResources({Resource.GOLD: 7})
 
 class PrintingPress(Age3Building):
     name = 'Printing Press'
     abbr = 'PrPr'
-    production_per_worker = Resources({Resource.STONE: 3, Resource.BOOKS: 2})
+    production_per_worker = FrozenResources({Resource.STONE: 3, Resource.BOOKS: 2})
 
 class SacrificialAltar(Age3Building):
     name = 'Sacrificial Altar'
     abbr = 'ScAl'
-    production_per_worker = Resources({Resource.STABILITY: 3, Resource.FOOD: 2})
+    production_per_worker = FrozenResources({Resource.STABILITY: 3, Resource.FOOD: 2})
 
 class Sawmill(Age3Building):
     name = 'Sawmill'
     abbr = 'Swm'
-    production_per_worker = Resources({Resource.GOLD: 3, Resource.FOOD: 2})
+    production_per_worker = FrozenResources({Resource.GOLD: 3, Resource.FOOD: 2})
 
 class Shipyard(Age3Building):
     name = 'Shipyard'
     abbr = 'Shp'
-    production_per_worker = Resources({Resource.STONE: 3, Resource.GOLD: 2})
+    production_per_worker = FrozenResources({Resource.STONE: 3, Resource.GOLD: 2})
 
 class TerraceFarming(Age3Building):
     name = 'Terrace Farming'
     abbr = 'TrFm'
-    production_per_worker = Resources({Resource.FOOD: 3, Resource.STONE: 2})
+    production_per_worker = FrozenResources({Resource.FOOD: 3, Resource.STONE: 2})
 
 class Theatre(Age3Building):
     name = 'Theatre'
     abbr = 'Thr'
-    production_per_worker = Resources({Resource.BOOKS: 3, Resource.GOLD: 2})
+    production_per_worker = FrozenResources({Resource.BOOKS: 3, Resource.GOLD: 2})
 
 class Age4Building(Building):
     age = 4
@@ -416,7 +438,7 @@ class Age4Building(Building):
 class CoalMine(Age4Building):
     name = 'Coal Mine'
     abbr = 'ClMn'
-    production_per_worker = Resources({Resource.STONE: 4, Resource.GOLD: 2})
+    production_per_worker = FrozenResources({Resource.STONE: 4, Resource.GOLD: 2})
 
 class DepartmentStore(Age4Building):
     name = 'Department Store'
@@ -424,79 +446,79 @@ class DepartmentStore(Age4Building):
     deployment_cost = -6
     worker_points = (4,)
     max_workers = True
-    production_per_worker = Resources({Resource.GOLD: 3, Resource.BOOKS: 1})
+    production_per_worker = FrozenResources({Resource.GOLD: 3, Resource.BOOKS: 1})
 
 class EngineeringSchool(Age4Building):
     name = 'Engineering School'
     abbr = 'EgSl'
-    production_per_worker = Resources({Resource.STONE: 4, Resource.BOOKS: 2})
+    production_per_worker = FrozenResources({Resource.STONE: 4, Resource.BOOKS: 2})
 
 class Factory(Age4Building):
     name = 'Factory'
     abbr = 'Fct'
-    production_per_worker = Resources({Resource.GOLD: 3, Resource.STONE: 3})
+    production_per_worker = FrozenResources({Resource.GOLD: 3, Resource.STONE: 3})
 
 class Hospital(Age4Building):
     name = 'Hospital'
     abbr = 'Hsp'
-    production_per_worker = Resources({Resource.BOOKS: 4, Resource.FOOD: 2})
+    production_per_worker = FrozenResources({Resource.BOOKS: 4, Resource.FOOD: 2})
 
 class HydroPlant(Age4Building):
     name = 'Hydro Plant'
     abbr = 'HdPl'
-    production_per_worker = Resources({Resource.FOOD: 3, Resource.GOLD: 3})
+    production_per_worker = FrozenResources({Resource.FOOD: 3, Resource.GOLD: 3})
 
 class NationalPark(Age4Building):
     name = 'National Park'
     abbr = 'NtPk'
-    production_per_worker = Resources({Resource.BOOKS: 4, Resource.STONE: 2})
+    production_per_worker = FrozenResources({Resource.BOOKS: 4, Resource.STONE: 2})
 
 class PenalColony(Age4Building):
     name = 'Penal Colony'
     abbr = 'PnCl'
-    production_per_worker = Resources({Resource.FOOD: 4, Resource.STABILITY: 2})
+    production_per_worker = FrozenResources({Resource.FOOD: 4, Resource.STABILITY: 2})
 
 class Radio(Age4Building):
     name = 'Radio'
     abbr = 'Rad'
-    production_per_worker = Resources({Resource.STABILITY: 4, Resource.GOLD: 2})
+    production_per_worker = FrozenResources({Resource.STABILITY: 4, Resource.GOLD: 2})
 
 class Railroad(Age4Building):
     name = 'Railroad'
     abbr = 'Rlr'
-    production_per_worker = Resources({Resource.STONE: 3, Resource.STABILITY: 3})
+    production_per_worker = FrozenResources({Resource.STONE: 3, Resource.STABILITY: 3})
 
 class SewerSystem(Age4Building):
     name = 'Sewer System'
     abbr = 'SwSt'
-    production_per_worker = Resources({Resource.FOOD: 4, Resource.STABILITY: 2})
+    production_per_worker = FrozenResources({Resource.FOOD: 4, Resource.STABILITY: 2})
 
 class Shantytown(Age4Building):
     name = 'Shantytown'
     abbr = 'Stt'
     deployment_cost = -1
     worker_points = (1, 1, 1, 1)
-    production_per_worker = Resources({Resource.STONE: 7, Resource.STABILITY: -1})
+    production_per_worker = FrozenResources({Resource.STONE: 7, Resource.STABILITY: -1})
 
 class StockExchange(Age4Building):
     name = 'Stock Exchange'
     abbr = 'SkEx'
-    production_per_worker = Resources({Resource.GOLD: 4, Resource.STONE: 2})
+    production_per_worker = FrozenResources({Resource.GOLD: 4, Resource.STONE: 2})
 
 class UrbanCenter(Age4Building):
     name = 'Urban Center'
     abbr = 'UbCt'
-    production_per_worker = Resources({Resource.GOLD: 3, Resource.STABILITY: 3})
+    production_per_worker = FrozenResources({Resource.GOLD: 3, Resource.STABILITY: 3})
 
 class Voortrekker(Age4Building):
     name = 'Voortrekker'
     abbr = 'Vtk'
-    production_per_worker = Resources({Resource.FOOD: 3, Resource.STONE: 3})
+    production_per_worker = FrozenResources({Resource.FOOD: 3, Resource.STONE: 3})
 
 class Zeppelin(Age4Building):
     name = 'Zeppelin'
     abbr = 'Zpl'
-    production_per_worker = Resources({Resource.BOOKS: 4, Resource.STABILITY: 2})
+    production_per_worker = FrozenResources({Resource.BOOKS: 4, Resource.STABILITY: 2})
 
 class Age1Military(Military):
     age = 1
@@ -508,50 +530,50 @@ class Archer(Age1Military):
     name = 'Archer'
     abbr = 'Arc'
     raid_value = 4
-    production_per_worker = Resources({Resource.MILITARY: 2})
+    production_per_worker = FrozenResources({Resource.MILITARY: 2})
 
 class Chariot(Age1Military):
     name = 'Chariot'
     abbr = 'Crt'
-    production_per_worker = Resources({Resource.MILITARY: 3, Resource.GOLD: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 3, Resource.GOLD: -1})
 
 class Elephant(Age1Military):
     name = 'Elephant'
     abbr = 'Elp'
-    production_per_worker = Resources({Resource.MILITARY: 4, Resource.FOOD: -2})
+    production_per_worker = FrozenResources({Resource.MILITARY: 4, Resource.FOOD: -2})
 
 class Hoplite(Age1Military):
     name = 'Hoplite'
     abbr = 'Hpl'
-    production_per_worker = Resources({Resource.MILITARY: 3, Resource.STONE: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 3, Resource.STONE: -1})
 
 class Immortal(Age1Military):
     name = 'Immortal'
     abbr = 'Imt'
-    production_per_worker = Resources({Resource.MILITARY: 3, Resource.STABILITY: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 3, Resource.STABILITY: -1})
 
 class Legionary(Age1Military):
     name = 'Legionary'
     abbr = 'Lgn'
-    production_per_worker = Resources({Resource.MILITARY: 3, Resource.FOOD: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 3, Resource.FOOD: -1})
 
 class Phalanx(Age1Military):
     name = 'Phalanx'
     abbr = 'Plx'
-    production_per_worker = Resources({Resource.MILITARY: 4, Resource.STONE: -2})
+    production_per_worker = FrozenResources({Resource.MILITARY: 4, Resource.STONE: -2})
 
 class PraetorianGuard(Age1Military):
     name = 'Praetorian Guard'
     abbr = 'PtGd'
     worker_points = (2,)
     max_workers = True
-    production_per_worker = Resources({Resource.MILITARY: 3, Resource.STABILITY: 1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 3, Resource.STABILITY: 1})
 
 class Trireme(Age1Military):
     name = 'Trireme'
     abbr = 'Trm'
     deployment_cost = -2
-    production_per_worker = Resources({Resource.MILITARY: 3})
+    production_per_worker = FrozenResources({Resource.MILITARY: 3})
 
 class Age2Military(Military):
     age = 2
@@ -566,7 +588,7 @@ class Assassin(Age2Military):
     deployment_cost = -1
     worker_points = (2,)
     raid_value = 5
-    production_per_worker = Resources()
+    production_per_worker = FrozenResources()
 
     def state(self):
         s = super().state()
@@ -615,10 +637,10 @@ class Assassin(Age2Military):
                     if choice == 'remove advisors':
                         remove_advisors = True
                 if remove_advisors:
-                    self.match.log(f'[{self}] {player} removes advisors.')
+                    self.match.log('[{}] {} removes advisors.', self, player)
                     player.remove_all_advisors()
                 else:
-                    self.match.log(f'[{self}] {player} loses 3 [Food].')
+                    self.match.log('[{}] {} loses 3 [Food].', self, player)
                     player.lose_resources(Resources({Resource.FOOD: -3}))
                 if player.need_confirmation:
                     self.match.get_move(player, 'Confirm?', ('Confirm',))
@@ -626,42 +648,42 @@ class Assassin(Age2Military):
 class CamelArcher(Age2Military):
     name = 'Camel Archer'
     abbr = 'CmAr'
-    production_per_worker = Resources({Resource.MILITARY: 5, Resource.STABILITY: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 5, Resource.STABILITY: -1})
 
 class Cataphract(Age2Military):
     name = 'Cataphract'
     abbr = 'Ctp'
-    production_per_worker = Resources({Resource.MILITARY: 6, Resource.STONE: -2})
+    production_per_worker = FrozenResources({Resource.MILITARY: 6, Resource.STONE: -2})
 
 class ChoKoNu(Age2Military):
     name = 'Cho-Ko-Nu'
     abbr = 'CKN'
-    production_per_worker = Resources({Resource.MILITARY: 5, Resource.GOLD: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 5, Resource.GOLD: -1})
 
 class GreekFireGalley(Age2Military):
     name = 'Greek Fire Galley'
     abbr = 'GFG'
-    production_per_worker = Resources({Resource.MILITARY: 6, Resource.FOOD: -2})
+    production_per_worker = FrozenResources({Resource.MILITARY: 6, Resource.FOOD: -2})
 
 class HorseArcher(Age2Military):
     name = 'Horse Archer'
     abbr = 'HsAr'
-    production_per_worker = Resources({Resource.MILITARY: 5, Resource.FOOD: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 5, Resource.FOOD: -1})
 
 class Knight(Age2Military):
     name = 'Knight'
     abbr = 'Knt'
-    production_per_worker = Resources({Resource.MILITARY: 5, Resource.STONE: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 5, Resource.STONE: -1})
 
 class Longbowman(Age2Military):
     name = 'Longbowman'
     abbr = 'Lbm'
-    production_per_worker = Resources({Resource.MILITARY: 4})
+    production_per_worker = FrozenResources({Resource.MILITARY: 4})
 
 class Longships(Age2Military):
     name = 'Longships'
     abbr = 'Lsp'
-    production_per_worker = Resources({Resource.MILITARY: 5, Resource.BOOKS: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 5, Resource.BOOKS: -1})
 
 class Age3Military(Military):
     age = 3
@@ -672,31 +694,31 @@ class Age3Military(Military):
 class Conquistador(Age3Military):
     name = 'Conquistador'
     abbr = 'Cqd'
-    production_per_worker = Resources({Resource.MILITARY: 7, Resource.BOOKS: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 7, Resource.BOOKS: -1})
 
 class Frigate(Age3Military):
     name = 'Frigate'
     abbr = 'Fgt'
     deployment_cost = -4
     raid_value = 6
-    production_per_worker = Resources({Resource.MILITARY: 8, Resource.STONE: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 8, Resource.STONE: -1})
 
 class Hakkapeliitta(Age3Military):
     name = 'Hakkapeliitta'
     abbr = 'Hkp'
-    production_per_worker = Resources({Resource.MILITARY: 8, Resource.STABILITY: -2})
+    production_per_worker = FrozenResources({Resource.MILITARY: 8, Resource.STABILITY: -2})
 
 class JaguarWarrior(Age3Military):
     name = 'Jaguar Warrior'
     abbr = 'JgWr'
-    production_per_worker = Resources({Resource.MILITARY: 7, Resource.STABILITY: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 7, Resource.STABILITY: -1})
 
 class Mercenary(Age3Military):
     name = 'Mercenary'
     abbr = 'Mcn'
     deployment_cost = -2
     raid_value = 4
-    production_per_worker = Resources({Resource.MILITARY: 8, Resource.GOLD: -2})
+    production_per_worker = FrozenResources({Resource.MILITARY: 8, Resource.GOLD: -2})
 
 class Privateer(Age3Military):
     name = 'Privateer'
@@ -704,22 +726,22 @@ class Privateer(Age3Military):
     deployment_cost = -2
     worker_points = (2, 2, 1)
     raid_value = 7
-    production_per_worker = Resources({Resource.MILITARY: 4})
+    production_per_worker = FrozenResources({Resource.MILITARY: 4})
 
 class Ranger(Age3Military):
     name = 'Ranger'
     abbr = 'Rng'
-    production_per_worker = Resources({Resource.MILITARY: 6})
+    production_per_worker = FrozenResources({Resource.MILITARY: 6})
 
 class Redcoat(Age3Military):
     name = 'Redcoat'
     abbr = 'Rdc'
-    production_per_worker = Resources({Resource.MILITARY: 7, Resource.FOOD: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 7, Resource.FOOD: -1})
 
 class Samurai(Age3Military):
     name = 'Samurai'
     abbr = 'Smr'
-    production_per_worker = Resources({Resource.MILITARY: 7, Resource.GOLD: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 7, Resource.GOLD: -1})
 
 class Age4Military(Military):
     age = 4
@@ -733,12 +755,12 @@ class Boxers(Age4Military):
     deployment_cost = -1
     worker_points = (1, 1, 2, 2, 3)
     raid_value = 2
-    production_per_worker = Resources({Resource.MILITARY: 6})
+    production_per_worker = FrozenResources({Resource.MILITARY: 6})
 
 class Cavalry(Age4Military):
     name = 'Cavalry'
     abbr = 'Cvr'
-    production_per_worker = Resources({Resource.MILITARY: 9, Resource.BOOKS: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 9, Resource.BOOKS: -1})
 
 class Conscript(Age4Military):
     name = 'Conscript'
@@ -746,17 +768,17 @@ class Conscript(Age4Military):
     deployment_cost = -2
     worker_points = (1, 1, 1, 1)
     raid_value = 4
-    production_per_worker = Resources({Resource.MILITARY: 7})
+    production_per_worker = FrozenResources({Resource.MILITARY: 7})
 
 class Cossack(Age4Military):
     name = 'Cossack'
     abbr = 'Csk'
-    production_per_worker = Resources({Resource.MILITARY: 9, Resource.STABILITY: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 9, Resource.STABILITY: -1})
 
 class Curassiers(Age4Military):
     name = 'Curassiers'
     abbr = 'Crs'
-    production_per_worker = Resources({Resource.MILITARY: 9, Resource.GOLD: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 9, Resource.GOLD: -1})
 
 class Dreadnought(Age4Military):
     name = 'Dreadnought'
@@ -764,24 +786,24 @@ class Dreadnought(Age4Military):
     deployment_cost = -6
     worker_points = (1, 2, 3)
     raid_value = 7
-    production_per_worker = Resources({Resource.MILITARY: 14, Resource.STONE: -3})
+    production_per_worker = FrozenResources({Resource.MILITARY: 14, Resource.STONE: -3})
 
 class MachineGunner(Age4Military):
     name = 'Machine Gunner'
     abbr = 'McGn'
-    production_per_worker = Resources({Resource.MILITARY: 10, Resource.GOLD: -2})
+    production_per_worker = FrozenResources({Resource.MILITARY: 10, Resource.GOLD: -2})
 
 class Rifleman(Age4Military):
     name = 'Rifleman'
     abbr = 'Rfm'
-    production_per_worker = Resources({Resource.MILITARY: 9, Resource.FOOD: -1})
+    production_per_worker = FrozenResources({Resource.MILITARY: 9, Resource.FOOD: -1})
 
 class Submarine(Age4Military):
     name = 'Submarine'
     abbr = 'Sub'
     deployment_cost = -3
     raid_value = 5
-    production_per_worker = Resources({Resource.MILITARY: 8})
+    production_per_worker = FrozenResources({Resource.MILITARY: 8})
 
 class Age1Colony(Colony):
     age = 1
@@ -791,49 +813,49 @@ class Armenia(Age1Colony):
     name = 'Armenia'
     abbr = 'Arm'
     military_requirement = 6
-    production_value = Resources({Resource.STONE: 2})
+    production_value = FrozenResources({Resource.STONE: 2})
 
 class Babylonia(Age1Colony):
     name = 'Babylonia'
     abbr = 'Bbl'
     military_requirement = 5
-    production_value = Resources({Resource.GOLD: 2})
+    production_value = FrozenResources({Resource.GOLD: 2})
 
 class Gaul(Age1Colony):
     name = 'Gaul'
     abbr = 'Gal'
     military_requirement = 7
-    production_value = Resources({Resource.FOOD: 2})
+    production_value = FrozenResources({Resource.FOOD: 2})
 
 class HinduKush(Age1Colony):
     name = 'Hindu Kush'
     abbr = 'HdKs'
     military_requirement = 9
-    production_value = Resources({Resource.STONE: 3})
+    production_value = FrozenResources({Resource.STONE: 3})
 
 class Hispania(Age1Colony):
     name = 'Hispania'
     abbr = 'Hsn'
     military_requirement = 4
-    production_value = Resources({Resource.FOOD: 2})
+    production_value = FrozenResources({Resource.FOOD: 2})
 
 class Israel(Age1Colony):
     name = 'Israel'
     abbr = 'Isr'
     military_requirement = 5
-    production_value = Resources({Resource.BOOKS: 2})
+    production_value = FrozenResources({Resource.BOOKS: 2})
 
 class Macedonia(Age1Colony):
     name = 'Macedonia'
     abbr = 'Mcd'
     military_requirement = 4
-    production_value = Resources({Resource.MILITARY: 2})
+    production_value = FrozenResources({Resource.MILITARY: 2})
 
 class Nubia(Age1Colony):
     name = 'Nubia'
     abbr = 'Nub'
     military_requirement = 3
-    production_value = Resources({Resource.GOLD: 2})
+    production_value = FrozenResources({Resource.GOLD: 2})
 
 class Age2Colony(Colony):
     age = 2
@@ -844,49 +866,49 @@ class CrusaderStates(Age2Colony):
     abbr = 'CsSt'
     points = 2
     military_requirement = 13
-    production_value = Resources({Resource.MILITARY: 3})
+    production_value = FrozenResources({Resource.MILITARY: 3})
 
 class England(Age2Colony):
     name = 'England'
     abbr = 'Eng'
     military_requirement = 11
-    production_value = Resources({Resource.GOLD: 3})
+    production_value = FrozenResources({Resource.GOLD: 3})
 
 class Greenland(Age2Colony):
     name = 'Greenland'
     abbr = 'Grl'
     military_requirement = 7
-    production_value = Resources({Resource.FOOD: 3})
+    production_value = FrozenResources({Resource.FOOD: 3})
 
 class Lombardy(Age2Colony):
     name = 'Lombardy'
     abbr = 'Lbd'
     military_requirement = 9
-    production_value = Resources({Resource.BOOKS: 3})
+    production_value = FrozenResources({Resource.BOOKS: 3})
 
 class Prussia(Age2Colony):
     name = 'Prussia'
     abbr = 'Prs'
     military_requirement = 12
-    production_value = Resources({Resource.BOOKS: 3})
+    production_value = FrozenResources({Resource.BOOKS: 3})
 
 class SaharanTrade(Age2Colony):
     name = 'Saharan Trade'
     abbr = 'ShTd'
     military_requirement = 15
-    production_value = Resources({Resource.STONE: 4})
+    production_value = FrozenResources({Resource.STONE: 4})
 
 class Sicily(Age2Colony):
     name = 'Sicily'
     abbr = 'Scl'
     military_requirement = 12
-    production_value = Resources({Resource.FOOD: 3})
+    production_value = FrozenResources({Resource.FOOD: 3})
 
 class Tibet(Age2Colony):
     name = 'Tibet'
     abbr = 'Tbt'
     military_requirement = 8
-    production_value = Resources({Resource.STABILITY: 3})
+    production_value = FrozenResources({Resource.STABILITY: 3})
 
 class Age3Colony(Colony):
     age = 3
@@ -896,49 +918,49 @@ class AztecEmpire(Age3Colony):
     name = 'Aztec Empire'
     abbr = 'AzEp'
     military_requirement = 15
-    production_value = Resources({Resource.GOLD: 4})
+    production_value = FrozenResources({Resource.GOLD: 4})
 
 class Brazil(Age3Colony):
     name = 'Brazil'
     abbr = 'Brz'
     military_requirement = 14
-    production_value = Resources({Resource.STONE: 4})
+    production_value = FrozenResources({Resource.STONE: 4})
 
 class IncanEmpire(Age3Colony):
     name = 'Incan Empire'
     abbr = 'IcEp'
     military_requirement = 17
-    production_value = Resources({Resource.GOLD: 4})
+    production_value = FrozenResources({Resource.GOLD: 4})
 
 class Philippines(Age3Colony):
     name = 'Philippines'
     abbr = 'Plp'
     military_requirement = 18
-    production_value = Resources({Resource.STONE: 4})
+    production_value = FrozenResources({Resource.STONE: 4})
 
 class Quebec(Age3Colony):
     name = 'Quebec'
     abbr = 'Qbc'
     military_requirement = 12
-    production_value = Resources({Resource.BOOKS: 4})
+    production_value = FrozenResources({Resource.BOOKS: 4})
 
 class SouthAfrica(Age3Colony):
     name = 'South Africa'
     abbr = 'StAf'
     military_requirement = 13
-    production_value = Resources({Resource.FOOD: 4})
+    production_value = FrozenResources({Resource.FOOD: 4})
 
 class TheCaribbean(Age3Colony):
     name = 'The Caribbean'
     abbr = 'TCrb'
     military_requirement = 15
-    production_value = Resources({Resource.STABILITY: 4})
+    production_value = FrozenResources({Resource.STABILITY: 4})
 
 class Virginia(Age3Colony):
     name = 'Virginia'
     abbr = 'Vgn'
     military_requirement = 21
-    production_value = Resources({Resource.STONE: 5})
+    production_value = FrozenResources({Resource.STONE: 5})
 
 class Age4Colony(Colony):
     age = 4
@@ -948,49 +970,49 @@ class Algeria(Age4Colony):
     name = 'Algeria'
     abbr = 'Agr'
     military_requirement = 25
-    production_value = Resources({Resource.MILITARY: 5})
+    production_value = FrozenResources({Resource.MILITARY: 5})
 
 class Australia(Age4Colony):
     name = 'Australia'
     abbr = 'Arl'
     military_requirement = 24
-    production_value = Resources({Resource.STABILITY: 5})
+    production_value = FrozenResources({Resource.STABILITY: 5})
 
 class Congo(Age4Colony):
     name = 'Congo'
     abbr = 'Con'
     military_requirement = 23
-    production_value = Resources({Resource.GOLD: 5})
+    production_value = FrozenResources({Resource.GOLD: 5})
 
 class HongKong(Age4Colony):
     name = 'Hong Kong'
     abbr = 'HgKg'
     military_requirement = 27
-    production_value = Resources({Resource.BOOKS: 5})
+    production_value = FrozenResources({Resource.BOOKS: 5})
 
 class India(Age4Colony):
     name = 'India'
     abbr = 'Ind'
     military_requirement = 25
-    production_value = Resources({Resource.BOOKS: 5})
+    production_value = FrozenResources({Resource.BOOKS: 5})
 
 class Libya(Age4Colony):
     name = 'Libya'
     abbr = 'Lby'
     military_requirement = 30
-    production_value = Resources({Resource.STONE: 6})
+    production_value = FrozenResources({Resource.STONE: 6})
 
 class Nigeria(Age4Colony):
     name = 'Nigeria'
     abbr = 'Ngr'
     military_requirement = 20
-    production_value = Resources({Resource.BOOKS: 5})
+    production_value = FrozenResources({Resource.BOOKS: 5})
 
 class Ostafrika(Age4Colony):
     name = 'Ostafrika'
     abbr = 'Oak'
     military_requirement = 22
-    production_value = Resources({Resource.FOOD: 5})
+    production_value = FrozenResources({Resource.FOOD: 5})
 
 class Age1War(War):
     age = 1
@@ -1345,10 +1367,10 @@ class Colosseum(Age1Wonder):
     abbr = 'Cls'
     points = 1
     stage_costs = (-2, -2)
-    production_value = Resources({Resource.MILITARY: 3})
+    production_value = FrozenResources({Resource.MILITARY: 3})
 
     def ready(self):
-        self.match.log(f'[{self}] {self.owner} loses 2 [Food].')
+        self.match.log('[{}] {} loses 2 [Food].', self, self.owner)
         self.owner.lose_resources(Resources({Resource.FOOD: -2}))
 
 class GreatLibrary(Age1Wonder):
@@ -1357,14 +1379,14 @@ class GreatLibrary(Age1Wonder):
     abbr = 'GrLr'
     points = 0
     stage_costs = (-1,)
-    production_value = Resources({Resource.BOOKS: 2})
+    production_value = FrozenResources({Resource.BOOKS: 2})
     golden_age_bonus = 1
 
     def placed(self):
         self.register_for_event('least stability', self.owned, self.remove)
 
     def remove(self, player, **kwargs):
-        self.match.log(f'{player} removes "{self}".')
+        self.match.log('{} removes "{}".', player, self)
         player.remove(self)
 
 class GreatLighthouse(Age1Wonder):
@@ -1373,7 +1395,7 @@ class GreatLighthouse(Age1Wonder):
     abbr = 'GrLh'
     points = 2
     stage_costs = (-1, -3)
-    production_value = Resources({Resource.GOLD: 1})
+    production_value = FrozenResources({Resource.GOLD: 1})
 
     def ready(self):
         self.register_for_event('buy card for gold', self.payed_3_gold, self.gain_book)
@@ -1382,7 +1404,7 @@ class GreatLighthouse(Age1Wonder):
         return player is self.owner and kwargs['gold'] == 3
 
     def gain_book(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 1 [Book].')
+        self.match.log('[{}] {} gains 1 [Book].', self, player)
         player.resources[Resource.BOOKS] += 1
 
 class HangingGardens(Age1Wonder):
@@ -1390,7 +1412,7 @@ class HangingGardens(Age1Wonder):
     abbr = 'HgGd'
     points = 1
     stage_costs = (-1, -2)
-    production_value = Resources({Resource.FOOD: 2, Resource.STONE: -1, Resource.STABILITY: 1})
+    production_value = FrozenResources({Resource.FOOD: 2, Resource.STONE: -1, Resource.STABILITY: 1})
 
 class Petra(Age1Wonder):
     """Action, 1 per round: -1 [Food]: +3 [Books] / +3 [Gold] / +3 [Stone]"""
@@ -1406,7 +1428,7 @@ class Petra(Age1Wonder):
         self.markers += 1
         options = (Resources({Resource.BOOKS: 3}), Resources({Resource.GOLD: 3}), Resources({Resource.STONE: 3}))
         choice = self.match.get_move(player, 'Pay 1 [Food] to get which resources?', options)
-        self.match.log(f'[{self}] {player} pays 1 [Food] and gains {choice}.')
+        self.match.log('[{}] {} pays 1 [Food] and gains {}.', self, player, choice)
         player.resources[Resource.FOOD] -= 1
         player.resources += choice
 
@@ -1415,7 +1437,7 @@ class Pyramids(Age1Wonder):
     abbr = 'Prm'
     points = 3
     stage_costs = (-2, -1, 0)
-    production_value = Resources({Resource.GOLD: 2, Resource.FOOD: -2})
+    production_value = FrozenResources({Resource.GOLD: 2, Resource.FOOD: -2})
 
 class SolomonsTemple(Age1Wonder):
     """End of each age +1 [Point]; If defeated: Remove"""
@@ -1429,11 +1451,11 @@ class SolomonsTemple(Age1Wonder):
         self.register_for_event('defeated', self.owned, self.remove)
 
     def gain_point(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 1 [Point].')
+        self.match.log('[{}] {} gains 1 [Point].', self, player)
         player.points += 1
 
     def remove(self, player, **kwargs):
-        self.match.log(f'{player} removes "{self}".')
+        self.match.log('{} removes "{}".', player, self)
         player.remove(self)
 
 class Sphinx(Age1Wonder):
@@ -1442,13 +1464,13 @@ class Sphinx(Age1Wonder):
     abbr = 'Spx'
     points = 1
     stage_costs = (-2, -2)
-    production_value = Resources({Resource.STONE: 1})
+    production_value = FrozenResources({Resource.STONE: 1})
 
     def ready(self):
         self.register_for_event('wonder ready', self.owned, self.gain_stone)
 
     def gain_stone(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 5 [Stone].')
+        self.match.log('[{}] {} gains 5 [Stone].', self, player)
         player.resources[Resource.STONE] += 5
 
 class Stonehenge(Age1Wonder):
@@ -1459,7 +1481,7 @@ class Stonehenge(Age1Wonder):
     stage_costs = (-1, -1, -1)
 
     def ready(self):
-        self.match.log(f'[{self}] {self.owner} gains 6 [Books] and 4 [Food].')
+        self.match.log('[{}] {} gains 6 [Books] and 4 [Food].', self, self.owner)
         self.owner.resources[Resource.BOOKS] += 6
         self.owner.resources[Resource.FOOD] += 4
 
@@ -1469,7 +1491,7 @@ class TerracottaArmy(Age1Wonder):
     abbr = 'TcAm'
     points = 2
     stage_costs = (0, 0, -3)
-    production_value = Resources({Resource.MILITARY: 1})
+    production_value = FrozenResources({Resource.MILITARY: 1})
 
     def buy(self):
         self.global_effect = True
@@ -1490,7 +1512,7 @@ class TerracottaArmy(Age1Wonder):
             if choice.action_type is ActionType.CONFIRM_AND_COMPLETE_TURN:
                 complete_turn = True
         for player in least_stability:
-            self.match.log(f'[{self}] {player} loses 4 [Gold].')
+            self.match.log('[{}] {} loses 4 [Gold].', self, player)
             player.lose_resources(Resources({Resource.GOLD: -4}))
         self.owner.need_confirmation = not complete_turn
         self.global_effect = False
@@ -1500,7 +1522,7 @@ class TheOracle(Age1Wonder):
     abbr = 'Orc'
     points = 1
     stage_costs = (-2, -1)
-    production_value = Resources({Resource.STABILITY: 2})
+    production_value = FrozenResources({Resource.STABILITY: 2})
 
 class Age2Wonder(Wonder):
     age = 2
@@ -1525,13 +1547,13 @@ class AngkorWat(Age2Wonder):
     abbr = 'AkWt'
     points = 1
     stage_costs = (-3, -1)
-    production_value = Resources({Resource.FOOD: 4})
+    production_value = FrozenResources({Resource.FOOD: 4})
 
     def produce(self, projected=False):
-        production = self.production_value.production()
+        production = self.production_value.production().copy()
         if self.owner.least_military:
             if not projected:
-                self.match.log(f'[{self}] {self.owner} produces 4 fewer [Books].')
+                self.match.log('[{}] {} produces 4 fewer [Books].', self, self.owner)
             production[Resource.BOOKS] -= 4
         return production
 
@@ -1549,7 +1571,7 @@ class ChichenItza(Age2Wonder):
         return player is self.owner and kwargs['card'].is_war()
 
     def gain_point(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 1 [Point].')
+        self.match.log('[{}] {} gains 1 [Point].', self, player)
         player.points += 1
 
 class GreatWall(Age2Wonder):
@@ -1558,7 +1580,7 @@ class GreatWall(Age2Wonder):
     abbr = 'GrWl'
     points = 1
     stage_costs = (-1, -1)
-    production_value = Resources({Resource.STABILITY: 2})
+    production_value = FrozenResources({Resource.STABILITY: 2})
 
     def ready(self):
         self.register_for_event('spared war point loss', self.passed_first, self.spared_war_point_loss)
@@ -1567,7 +1589,7 @@ class GreatWall(Age2Wonder):
         return player is self.owner and player.passed_first
 
     def spared_war_point_loss(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} is spared losing 1 [Point] from war.')
+        self.match.log('[{}] {} is spared losing 1 [Point] from war.', self, player)
         return True
 
 class KrakDesChevaliers(Age2Wonder):
@@ -1575,7 +1597,7 @@ class KrakDesChevaliers(Age2Wonder):
     abbr = 'KrCv'
     points = 2
     stage_costs = (-5, -5)
-    production_value = Resources({Resource.MILITARY: 6})
+    production_value = FrozenResources({Resource.MILITARY: 6})
 
 class MoaiStatues(Age2Wonder):
     """When ready: +12 [Stone]"""
@@ -1583,10 +1605,10 @@ class MoaiStatues(Age2Wonder):
     abbr = 'MoSt'
     points = 2
     stage_costs = (-1, -1, -1)
-    production_value = Resources({Resource.FOOD: -1})
+    production_value = FrozenResources({Resource.FOOD: -1})
 
     def ready(self):
-        self.match.log(f'[{self}] {self.owner} gains 12 [Stone].')
+        self.match.log('[{}] {} gains 12 [Stone].', self, self.owner)
         self.owner.resources[Resource.STONE] += 12
 
 class NotreDame(Age2Wonder):
@@ -1595,13 +1617,13 @@ class NotreDame(Age2Wonder):
     abbr = 'NtDm'
     points = 1
     stage_costs = (-2, -1)
-    production_value = Resources({Resource.BOOKS: 2})
+    production_value = FrozenResources({Resource.BOOKS: 2})
 
     def produce(self, projected=False):
-        production = self.production_value.production()
+        production = self.production_value.production().copy()
         if self.owner.most_stability:
             if not projected:
-                self.match.log(f'[{self}] {self.owner} produces an extra 3 [Books].')
+                self.match.log('[{}] {} produces an extra 3 [Books].', self, self.owner)
             production[Resource.BOOKS] += 3
         return production
 
@@ -1619,7 +1641,7 @@ class PiazzaSanMarco(Age2Wonder):
         self.markers += 1
         options = (Resources({Resource.BOOKS: 5}), Resources({Resource.FOOD: 5}), Resources({Resource.STONE: 5}))
         choice = self.match.get_move(player, 'Pay 2 [Gold] to get which resources?', options)
-        self.match.log(f'[{self}] {player} pays 2 [Gold] and gains {choice}.')
+        self.match.log('[{}] {} pays 2 [Gold] and gains {}.', self, player, choice)
         player.resources[Resource.GOLD] -= 2
         player.resources += choice
         if player.resources[Resource.GOLD] == 0:
@@ -1653,7 +1675,7 @@ class SankoreUniversity(Age2Wonder):
     stage_costs = (-1, -2, -3)
 
     def ready(self):
-        self.match.log(f'[{self}] {self.owner} gains 8 [Books].')
+        self.match.log('[{}] {} gains 8 [Books].', self, self.owner)
         self.owner.resources[Resource.BOOKS] += 8
 
 class ShwedagonPagoda(Age2Wonder):
@@ -1672,7 +1694,7 @@ class ShwedagonPagoda(Age2Wonder):
 
     def activate(self, player):
         self.markers += 1
-        self.match.log(f'[{self}] {player} gains 1 [Stability].')
+        self.match.log('[{}] {} gains 1 [Stability].', self, player)
         player.resources[Resource.STABILITY] += 1
 
     def is_self_with_markers(self, player, **kwargs):
@@ -1682,7 +1704,7 @@ class ShwedagonPagoda(Age2Wonder):
         return player is self.owner and self.markers
 
     def reduce_stability(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} loses {self.markers} [Stability].')
+        self.match.log('[{}] {} loses {} [Stability].', self, player, self.markers)
         player.resources[Resource.STABILITY] -= self.markers
         self.markers = 0
 
@@ -1703,7 +1725,7 @@ class ForbiddenPalace(Age3Wonder):
         return player is self.owner and player.passed_first
 
     def gain_point(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 1 [Point].')
+        self.match.log('[{}] {} gains 1 [Point].', self, player)
         player.points += 1
 
 class HimejiCastle(Age3Wonder):
@@ -1722,7 +1744,7 @@ class HimejiCastle(Age3Wonder):
         return player is self.owner and old_card.is_building() and new_card.is_building() and new_card.age > old_card.age
 
     def gain_stone(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 4 [Stone].')
+        self.match.log('[{}] {} gains 4 [Stone].', self, player)
         player.resources[Resource.STONE] += 4
 
 class MachuPicchu(Age3Wonder):
@@ -1730,7 +1752,7 @@ class MachuPicchu(Age3Wonder):
     abbr = 'McPc'
     points = 0
     stage_costs = (0, -2, 0)
-    production_value = Resources({Resource.GOLD: 6})
+    production_value = FrozenResources({Resource.GOLD: 6})
 
 class OresundDues(Age3Wonder):
     """After passing, when passed over: +2 [Stone]"""
@@ -1744,7 +1766,7 @@ class OresundDues(Age3Wonder):
         self.global_effect = True
 
     def gain_stone(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 2 [Stone].')
+        self.match.log('[{}] {} gains 2 [Stone].', self, player)
         player.resources[Resource.STONE] += 2
 
 class PotalaPalace(Age3Wonder):
@@ -1757,7 +1779,7 @@ class PotalaPalace(Age3Wonder):
     def bonus_points(self, projected=False):
         bonus = len(self.owner.advisor_cards())
         if not projected:
-            self.match.log(f'[{self}] {self.owner} gains {bonus} [Point{s_if_not_1(bonus)}] for having {bonus} advisor{s_if_not_1(bonus)}.')
+            self.match.log('[{}] {} gains {} [Point{}] for having {} advisor{}.', self, self.owner, bonus, s_if_not_1(bonus), bonus, s_if_not_1(bonus))
         return bonus
 
 class RedFort(Age3Wonder):
@@ -1774,7 +1796,7 @@ class RedFort(Age3Wonder):
         return player is self.owner and kwargs['gold'] == 1
 
     def gain_food(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 2 [Food].')
+        self.match.log('[{}] {} gains 2 [Food].', self, player)
         player.resources[Resource.FOOD] += 2
 
 class RoyalSociety(Age3Wonder):
@@ -1794,7 +1816,7 @@ class RoyalSociety(Age3Wonder):
             choice = options[0]
         else:
             choice = self.match.get_move(player, 'Deploy to where?', options)
-        self.match.log(f'[{self}] {player} deploys to "{choice.card}" for free.')
+        self.match.log('[{}] {} deploys to "{}" for free.', self, player, choice.card)
         player.deploy_for_free(choice.card)
 
 class SistineChapel(Age3Wonder):
@@ -1803,13 +1825,13 @@ class SistineChapel(Age3Wonder):
     abbr = 'StCp'
     points = 1
     stage_costs = (-1, -1)
-    production_value = Resources({Resource.BOOKS: 1})
+    production_value = FrozenResources({Resource.BOOKS: 1})
 
     def ready(self):
         self.register_for_event('hire architect', self.owned, self.gain_books)
 
     def gain_books(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 3 [Books].')
+        self.match.log('[{}] {} gains 3 [Books].', self, player)
         player.resources[Resource.BOOKS] += 3
 
 class TajMahal(Age3Wonder):
@@ -1820,7 +1842,7 @@ class TajMahal(Age3Wonder):
     stage_costs = (-3, -1, -2)
 
     def ready(self):
-        self.match.log(f'[{self}] {self.owner} gains 15 [Books].')
+        self.match.log('[{}] {} gains 15 [Books].', self, self.owner)
         self.owner.resources[Resource.BOOKS] += 15
 
 class Uraniborg(Age3Wonder):
@@ -1828,7 +1850,7 @@ class Uraniborg(Age3Wonder):
     abbr = 'Unb'
     points = 2
     stage_costs = (0, -3, -2)
-    production_value = Resources({Resource.BOOKS: 2})
+    production_value = FrozenResources({Resource.BOOKS: 2})
     golden_age_bonus = 2
 
 class Versailles(Age3Wonder):
@@ -1839,7 +1861,7 @@ class Versailles(Age3Wonder):
     stage_costs = (-4, 0, -1)
 
     def ready(self):
-        self.match.log(f'[{self}] {self.owner} has least [Stability] for the rest of the round.')
+        self.match.log('[{}] {} has least [Stability] for the rest of the round.', self, self.owner)
         self.register_for_event('force least stability', self.owned, self.true)
         self.register_for_event('end of round', self.owned, self.remove_effect)
         self.global_effect = True
@@ -1862,7 +1884,7 @@ class BigBen(Age4Wonder):
         bonus = len([card for card in self.owner.colony_cards() if card.age == 4])
         if not projected:
             colony_or_colonies = 'colony' if bonus == 1 else 'colonies'
-            self.match.log(f'[{self}] {self.owner} gains {bonus} [Point{s_if_not_1(bonus)}] for having {bonus} Industrial {colony_or_colonies}.')
+            self.match.log('[{}] {} gains {} [Point{}] for having {} Industrial {}.', self, self.owner, bonus, s_if_not_1(bonus), bonus, colony_or_colonies)
         return bonus
 
 class BrandenburgGate(Age4Wonder):
@@ -1878,10 +1900,10 @@ class BrandenburgGate(Age4Wonder):
     def ready(self):
         most_military = self.match.most_military()
         if not most_military:
-            self.match.log(f'[{self}] No most [Military].')
+            self.match.log('[{}] No most [Military].', self)
         else:
             for player in most_military:
-                self.match.log(f'[{self}] {player} gains 6 [Gold] and 6 [Stone].')
+                self.match.log('[{}] {} gains 6 [Gold] and 6 [Stone].', self, player)
                 player.resources[Resource.GOLD] += 6
                 player.resources[Resource.STONE] += 6
         self.global_effect = False
@@ -1912,7 +1934,7 @@ class BritishMuseum(Age4Wonder):
             if choice.action_type is ActionType.CONFIRM_AND_COMPLETE_TURN:
                 complete_turn = True
         for player in least_military:
-            self.match.log(f'[{self}] {player} loses 10 [Books].')
+            self.match.log('[{}] {} loses 10 [Books].', self, player)
             player.lose_resources(Resources({Resource.BOOKS: -10}))
         self.owner.need_confirmation = not complete_turn
         self.global_effect = False
@@ -1925,7 +1947,7 @@ class DarwinsVoyage(Age4Wonder):
     stage_costs = (-3, -2)
 
     def ready(self):
-        self.match.log(f'[{self}] {self.owner} gains 15 [Gold].')
+        self.match.log('[{}] {} gains 15 [Gold].', self, self.owner)
         self.owner.resources[Resource.GOLD] += 15
 
 class FordMotorCompany(Age4Wonder):
@@ -1933,7 +1955,7 @@ class FordMotorCompany(Age4Wonder):
     abbr = 'FMC'
     points = 1
     stage_costs = (-2, -2)
-    production_value = Resources({Resource.STONE: 6})
+    production_value = FrozenResources({Resource.STONE: 6})
 
 class MIT(Age4Wonder):
     """Buy a new building: Deploy 1 [Worker] on it for free"""
@@ -1959,7 +1981,7 @@ class MIT(Age4Wonder):
                 else:
                     undeploy = self.match.get_move(self.owner, 'Undeploy worker from where?', possible_undeploys)
                 player.undeploy_action(undeploy)
-            self.match.log(f'[{self}] {player} deploys to "{card}" for free.')
+            self.match.log('[{}] {} deploys to "{}" for free.', self, player, card)
             player.deploy_for_free(card)
 
 class SouthPoleExpedition(Age4Wonder):
@@ -1970,7 +1992,7 @@ class SouthPoleExpedition(Age4Wonder):
     stage_costs = (-2, -1)
 
     def ready(self):
-        self.match.log(f'[{self}] {self.owner} loses 5 [Food].')
+        self.match.log('[{}] {} loses 5 [Food].', self, self.owner)
         self.owner.lose_resources(Resources({Resource.FOOD: -5}))
 
 class StatueOfLiberty(Age4Wonder):
@@ -1983,10 +2005,10 @@ class StatueOfLiberty(Age4Wonder):
     def bonus_points(self, projected=False):
         if self.owner in self.match.most_least({player.name: player.grown_workers for player in self.match.players})[0]:
             if not projected:
-                self.match.log(f'[{self}] {self.owner} gains 2 [Points] for having the most [Workers].')
+                self.match.log('[{}] {} gains 2 [Points] for having the most [Workers].', self, self.owner)
             return 2
         if not projected:
-            self.match.log(f'[{self}] {self.owner} does not have the most [Workers].')
+            self.match.log('[{}] {} does not have the most [Workers].', self, self.owner)
         return 0
 
 class SuezCanal(Age4Wonder):
@@ -1994,7 +2016,7 @@ class SuezCanal(Age4Wonder):
     abbr = 'SzCn'
     points = 1
     stage_costs = (-2, -1)
-    production_value = Resources({Resource.GOLD: 3, Resource.MILITARY: 4})
+    production_value = FrozenResources({Resource.GOLD: 3, Resource.MILITARY: 4})
 
 class Titanic(Age4Wonder):
     """When ready: All: -4 [Gold] or remove Advisor"""
@@ -2043,10 +2065,10 @@ class Titanic(Age4Wonder):
                 if choice == 'remove advisors':
                     remove_advisors = True
             if remove_advisors:
-                self.match.log(f'[{self}] {player} removes advisors.')
+                self.match.log('[{}] {} removes advisors.', self, player)
                 player.remove_all_advisors()
             else:
-                self.match.log(f'[{self}] {player} loses 4 [Gold].')
+                self.match.log('[{}] {} loses 4 [Gold].', self, player)
                 player.lose_resources(Resources({Resource.GOLD: -4}))
             if player.need_confirmation:
                 self.match.get_move(player, 'Confirm?', ('Confirm',))
@@ -2083,20 +2105,20 @@ class Archimedes(Age1Advisor):
     """1 private [Architect] per round"""
     name = 'Archimedes'
     abbr = 'Acm'
-    production_value = Resources({Resource.STONE: 1})
+    production_value = FrozenResources({Resource.STONE: 1})
     private_architects = 1
 
 class Augustus(Age1Advisor):
     """Production: If most [Military]: +2 [Stone]"""
     name = 'Augustus'
     abbr = 'Agt'
-    production_value = Resources({Resource.MILITARY: 1})
+    production_value = FrozenResources({Resource.MILITARY: 1})
 
     def produce(self, projected=False):
-        production = self.production_value.production()
+        production = self.production_value.production().copy()
         if self.owner.most_military:
             if not projected:
-                self.match.log(f'[{self}] {self.owner} produces an extra 2 [Stone].')
+                self.match.log('[{}] {} produces an extra 2 [Stone].', self, self.owner)
             production[Resource.STONE] += 2
         return production
 
@@ -2104,7 +2126,7 @@ class Boudica(Age1Advisor):
     """If you have Military [Workers]: remove"""
     name = 'Boudica'
     abbr = 'Bdc'
-    production_value = Resources({Resource.MILITARY: 1, Resource.GOLD: 1, Resource.FOOD: 1})
+    production_value = FrozenResources({Resource.MILITARY: 1, Resource.GOLD: 1, Resource.FOOD: 1})
 
     def placed(self):
         self.register_for_event('updating most least stability military', self.has_military_worker, self.remove)
@@ -2113,21 +2135,21 @@ class Boudica(Age1Advisor):
         return player is self.owner and any(card.deployed_workers for card in player.military_cards())
 
     def remove(self, player, **kwargs):
-        self.match.log(f'{player} removes "{self}".')
+        self.match.log('{} removes "{}".', player, self)
         player.remove(self)
 
 class Buddha(Age1Advisor):
     """Action, first turn: Must skip"""
     name = 'Buddha'
     abbr = 'Bdh'
-    production_value = Resources({Resource.STABILITY: 3})
+    production_value = FrozenResources({Resource.STABILITY: 3})
 
     def buy(self):
         self.register_for_event('skip turn', self.owned, self.first_turn)
 
     def first_turn(self, player, **kwargs):
         if player.turn_number == 1:
-            self.match.log(f'[{self}] {player} skips first turn.')
+            self.match.log('[{}] {} skips first turn.', self, player)
             return True
         return False
 
@@ -2137,10 +2159,10 @@ class CyrusTheGreat(Age1Advisor):
     abbr = 'CrGr'
 
     def produce(self, projected=False):
-        production = self.production_value.production()
+        production = self.production_value.production().copy()
         if self.owner.bought_colony_this_round:
             if not projected:
-                self.match.log(f'[{self}] {self.owner} produces an extra 3 [Gold].')
+                self.match.log('[{}] {} produces an extra 3 [Gold].', self, self.owner)
             production[Resource.GOLD] += 3
         return production
 
@@ -2150,32 +2172,29 @@ class Hannibal(Age1Advisor):
     abbr = 'Hnb'
 
     def buy(self):
-        self.register_for_event('extra raid value', self.owned, self.extra_raid_value)
+        self.register_static_modifier('extra raid value', 1)
         self.register_for_event('extra card cost', self.others_battles, self.extra_gold)
         self.global_effect = True
 
-    def extra_raid_value(self, player, **kwargs):
-        return 1
-
     def others_battles(self, player, **kwargs):
         return player is not self.owner and kwargs['card'].is_battle()
 
     def extra_gold(self, player, **kwargs):
         if not kwargs.get('check', False):
-            self.match.log(f'[{self}] Battles cost 1 [Gold] more.')
+            self.match.log('[{}] Battles cost 1 [Gold] more.', self)
         return 1
 
 class Hatshepsut(Age1Advisor):
     """When Wonder ready: +3 [Books]"""
     name = 'Hatshepsut'
     abbr = 'Hss'
-    production_value = Resources({Resource.GOLD: 1})
+    production_value = FrozenResources({Resource.GOLD: 1})
 
     def buy(self):
         self.register_for_event('wonder ready', self.owned, self.gain_books)
 
     def gain_books(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 3 [Books].')
+        self.match.log('[{}] {} gains 3 [Books].', self, player)
         player.resources[Resource.BOOKS] += 3
 
 class Hypatia(Age1Advisor):
@@ -2193,18 +2212,18 @@ class Hypatia(Age1Advisor):
         return player is self.owner and player.resources[Resource.STABILITY] > 2
 
     def remove(self, player, **kwargs):
-        self.match.log(f'{player} removes "{self}".')
+        self.match.log('{} removes "{}".', player, self)
         player.remove(self)
 
     def produce(self, projected=False):
-        production = self.production_value.production()
+        production = self.production_value.production().copy()
         if projected:
             books = self.markers + 1
         else:
-            self.match.log(f'"{self}" gains 1 [Marker].')
+            self.match.log('"{}" gains 1 [Marker].', self)
             self.markers += 1
             books = self.markers
-            self.match.log(f'[{self}] {self.owner} produces an extra {books} [Book{s_if_not_1(books)}].')
+            self.match.log('[{}] {} produces an extra {} [Book{}].', self, self.owner, books, s_if_not_1(books))
         production[Resource.BOOKS] += books
         return production
 
@@ -2212,26 +2231,26 @@ class QinShiHuang(Age1Advisor):
     """If least [Stability]: Remove"""
     name = 'Qin Shi Huang'
     abbr = 'QSH'
-    production_value = Resources({Resource.FOOD: 3})
+    production_value = FrozenResources({Resource.FOOD: 3})
 
     def placed(self):
         self.register_for_event('least stability', self.owned, self.remove)
 
     def remove(self, player, **kwargs):
-        self.match.log(f'{player} removes "{self}".')
+        self.match.log('{} removes "{}".', player, self)
         player.remove(self)
 
 class SaintAugustine(Age1Advisor):
     """Production: If most [Stability]: +2 [Books]"""
     name = 'Saint Augustine'
     abbr = 'StAg'
-    production_value = Resources({Resource.STABILITY: 1})
+    production_value = FrozenResources({Resource.STABILITY: 1})
 
     def produce(self, projected=False):
-        production = self.production_value.production()
+        production = self.production_value.production().copy()
         if self.owner.most_stability:
             if not projected:
-                self.match.log(f'[{self}] {self.owner} produces an extra 2 [Books].')
+                self.match.log('[{}] {} produces an extra 2 [Books].', self, self.owner)
             production[Resource.BOOKS] += 2
         return production
 
@@ -2245,7 +2264,7 @@ class SunTzu(Age1Advisor):
 
     def first_turn(self, player, **kwargs):
         if player.turn_number == 1:
-            self.match.log(f'[{self}] {player} takes 2 actions.')
+            self.match.log('[{}] {} takes 2 actions.', self, player)
             return True
         return False
 
@@ -2256,7 +2275,7 @@ class AbuBakr(Age2Advisor):
     """Buy Battle: +2 [Books]"""
     name = 'Abu Bakr'
     abbr = 'AbBk'
-    production_value = Resources({Resource.MILITARY: 2})
+    production_value = FrozenResources({Resource.MILITARY: 2})
 
     def buy(self):
         self.register_for_event('buying card', self.buying_battle, self.gain_books)
@@ -2265,14 +2284,14 @@ class AbuBakr(Age2Advisor):
         return player is self.owner and kwargs['card'].is_battle()
 
     def gain_books(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 2 [Books].')
+        self.match.log('[{}] {} gains 2 [Books].', self, player)
         player.resources[Resource.BOOKS] += 2
 
 class Alhazen(Age2Advisor):
     """Action, 1 per round: Swap places of two cards on the Progress Board"""
     name = 'Alhazen'
     abbr = 'Ahz'
-    production_value = Resources({Resource.BOOKS: 2})
+    production_value = FrozenResources({Resource.BOOKS: 2})
 
     def action_available(self, player):
         return player is self.owner and self.markers < 1 and sum(len([card for card in cards_in_row if card is not None]) for cards_in_row in self.match.progress_board) >= 2
@@ -2295,7 +2314,7 @@ class Alhazen(Age2Advisor):
         row2 = int(choice2[1]) - 1
         col2 = int(choice2[2]) - 1
         card2 = self.match.progress_board[row2][col2]
-        self.match.log(f'[{self}] {player} swaps "{card1}" with "{card2}".')
+        self.match.log('[{}] {} swaps "{}" with "{}".', self, player, card1, card2)
         self.match.progress_board[row1][col1] = card2
         self.match.progress_board[row2][col2] = card1
 
@@ -2303,7 +2322,7 @@ class AnnaKomnene(Age2Advisor):
     """Production: No upkeep for Military [Workers]"""
     name = 'Anna Komnene'
     abbr = 'AnKn'
-    production_value = Resources({Resource.BOOKS: 1})
+    production_value = FrozenResources({Resource.BOOKS: 1})
 
     def buy(self):
         self.register_for_event('no military upkeep', self.owned, self.true)
@@ -2324,10 +2343,10 @@ class EleanorOfAquitaine(Age2Advisor):
     abbr = 'EnAq'
 
     def produce(self, projected=False):
-        production = self.production_value.production()
+        production = self.production_value.production().copy()
         if self.owner.bought_colony_this_round:
             if not projected:
-                self.match.log(f'[{self}] {self.owner} produces an extra 5 [Gold].')
+                self.match.log('[{}] {} produces an extra 5 [Gold].', self, self.owner)
             production[Resource.GOLD] += 5
         return production
 
@@ -2335,11 +2354,11 @@ class GenghisKhan(Age2Advisor):
     """All: -3 [Stability]"""
     name = 'Genghis Khan'
     abbr = 'GgKn'
-    production_value = Resources({Resource.MILITARY: 3})
+    production_value = FrozenResources({Resource.MILITARY: 3})
 
     def buy(self):
         self.register_for_event('when removed', self.is_self, self.restore_stability)
-        self.match.log(f'[{self}] All players lose 3 [Stability].')
+        self.match.log('[{}] All players lose 3 [Stability].', self)
         for player in self.match.players[::-1]:
             player.resources[Resource.STABILITY] -= 3
         self.global_effect = True
@@ -2348,7 +2367,7 @@ class GenghisKhan(Age2Advisor):
         return player is self.owner and kwargs['card'] is self
 
     def restore_stability(self, player, **kwargs):
-        self.match.log(f'[{self}] All players regain 3 [Stability].')
+        self.match.log('[{}] All players regain 3 [Stability].', self)
         for player in self.match.players[::-1]:
             player.resources[Resource.STABILITY] += 3
 
@@ -2356,26 +2375,26 @@ class HaraldHardrada(Age2Advisor):
     """If least [Military]: Remove"""
     name = 'Harald Hardrada'
     abbr = 'HrHd'
-    production_value = Resources({Resource.GOLD: 4})
+    production_value = FrozenResources({Resource.GOLD: 4})
 
     def placed(self):
         self.register_for_event('least military', self.owned, self.remove)
 
     def remove(self, player, **kwargs):
-        self.match.log(f'{player} removes "{self}".')
+        self.match.log('{} removes "{}".', player, self)
         player.remove(self)
 
 class MansaMusa(Age2Advisor):
     """Spend your last [Gold]: +2 [Books] and +1 [Food]"""
     name = 'Mansa Musa'
     abbr = 'MsMs'
-    production_value = Resources({Resource.GOLD: 1})
+    production_value = FrozenResources({Resource.GOLD: 1})
 
     def placed(self):
         self.register_for_event('spent last gold', self.owned, self.gain_books_and_food)
 
     def gain_books_and_food(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 2 [Books] and 1 [Food].')
+        self.match.log('[{}] {} gains 2 [Books] and 1 [Food].', self, player)
         player.resources[Resource.BOOKS] += 2
         player.resources[Resource.FOOD] += 1
 
@@ -2397,7 +2416,7 @@ class MarcoPolo(Age2Advisor):
             payment = stone_payment
         else:
             payment = self.match.get_move(player, 'Pay which resources?', (food_payment, stone_payment))
-        self.match.log(f'[{self}] {player} pays {payment} and gains 4 [Gold].')
+        self.match.log('[{}] {} pays {} and gains 4 [Gold].', self, player, payment)
         player.resources -= payment
         player.resources[Resource.GOLD] += 4
 
@@ -2405,7 +2424,7 @@ class SejongTheGreat(Age2Advisor):
     """Buy Golden Age: +2 [Stone]"""
     name = 'Sejong the Great'
     abbr = 'SjGr'
-    production_value = Resources({Resource.FOOD: 2})
+    production_value = FrozenResources({Resource.FOOD: 2})
 
     def buy(self):
         self.register_for_event('buying card', self.buying_golden_age, self.gain_stone)
@@ -2414,20 +2433,20 @@ class SejongTheGreat(Age2Advisor):
         return player is self.owner and kwargs['card'].is_golden_age()
 
     def gain_stone(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 2 [Stone].')
+        self.match.log('[{}] {} gains 2 [Stone].', self, player)
         player.resources[Resource.STONE] += 2
 
 class ThomasAquino(Age2Advisor):
     """Production: If most [Stability]: +4 [Books]"""
     name = 'Thomas Aquino'
     abbr = 'TmAq'
-    production_value = Resources({Resource.STABILITY: 1})
+    production_value = FrozenResources({Resource.STABILITY: 1})
 
     def produce(self, projected=False):
-        production = self.production_value.production()
+        production = self.production_value.production().copy()
         if self.owner.most_stability:
             if not projected:
-                self.match.log(f'[{self}] {self.owner} produces an extra 4 [Books].')
+                self.match.log('[{}] {} produces an extra 4 [Books].', self, self.owner)
             production[Resource.BOOKS] += 4
         return production
 
@@ -2435,7 +2454,7 @@ class ZhuXi(Age2Advisor):
     """Keep when replaced 1st time"""
     name = 'Zhu Xi'
     abbr = 'ZhXi'
-    production_value = Resources({Resource.STABILITY: 1, Resource.GOLD: 1})
+    production_value = FrozenResources({Resource.STABILITY: 1, Resource.GOLD: 1})
 
     def buy(self):
         self.register_for_event('cover card', self.is_self_and_advisor_and_not_covered, self.cover)
@@ -2446,7 +2465,7 @@ class ZhuXi(Age2Advisor):
         return player is self.owner and kwargs['card'].is_advisor() and kwargs['old_card'] is self and self.covered_by is None
 
     def cover(self, player, **kwargs):
-        self.match.log(f'[{self}] Not replaced.')
+        self.match.log('[{}] Not replaced.', self)
         return True
 
     def covered(self, player, **kwargs):
@@ -2462,33 +2481,33 @@ class CarolusLinneaus(Age3Advisor):
     """Buy Golden Age: Gain [Point]: +1 [Point]"""
     name = 'Carolus Linneaus'
     abbr = 'CrLn'
-    production_value = Resources({Resource.STABILITY: 1})
+    production_value = FrozenResources({Resource.STABILITY: 1})
 
     def buy(self):
         self.register_for_event('bought golden age point', self.owned, self.gain_point)
 
     def gain_point(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 1 [Point].')
+        self.match.log('[{}] {} gains 1 [Point].', self, player)
         player.points += 1
 
 class Elizabeth(Age3Advisor):
     """War: +8 [Military]"""
     name = 'Elizabeth'
     abbr = 'Elz'
-    production_value = Resources({Resource.STONE: 2})
+    production_value = FrozenResources({Resource.STONE: 2})
 
     def buy(self):
         self.register_for_event('extra war military', self.owned, self.extra_war_military)
 
     def extra_war_military(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} has an extra 8 [Military] against war.')
+        self.match.log('[{}] {} has an extra 8 [Military] against war.', self, player)
         return 8
 
 class GalileoGalilei(Age3Advisor):
     """Action, 1 per round: Buy Golden Age or Wonder for free"""
     name = 'Galileo Galilei'
     abbr = 'GlGl'
-    production_value = Resources({Resource.BOOKS: 2})
+    production_value = FrozenResources({Resource.BOOKS: 2})
 
     def action_available(self, player):
         return player is self.owner and self.markers < 1 and [action for action in player.buy_actions(free=True) if action.card.is_golden_age_wonder_natural_wonder()]
@@ -2500,21 +2519,21 @@ class GalileoGalilei(Age3Advisor):
             if action.card.is_golden_age_wonder_natural_wonder():
                 options.append(action)
         choice = self.match.get_move(player, 'Buy which card for free?', options)
-        self.match.log(f'[{self}] {player} buys "{choice.card}" for free.')
+        self.match.log('[{}] {} buys "{}" for free.', self, player, choice.card)
         player.buy_action(choice, free=True)
 
 class Isabella(Age3Advisor):
     """Production: +3 [Gold] per Renaissance Colony"""
     name = 'Isabella'
     abbr = 'Isb'
-    production_value = Resources({Resource.FOOD: 2})
+    production_value = FrozenResources({Resource.FOOD: 2})
 
     def produce(self, projected=False):
-        production = self.production_value.production()
+        production = self.production_value.production().copy()
         gold = 3 * len([card for card in self.owner.colony_cards() if card.age == 3])
         if gold:
             if not projected:
-                self.match.log(f'[{self}] {self.owner} produces an extra {gold} [Gold].')
+                self.match.log('[{}] {} produces an extra {} [Gold].', self, self.owner, gold)
             production[Resource.GOLD] += gold
         return production
 
@@ -2522,21 +2541,23 @@ class MartinLuther(Age3Advisor):
     """All: Defeats cost 4 extra [Food]"""
     name = 'Martin Luther'
     abbr = 'MtLt'
-    production_value = Resources({Resource.GOLD: 4})
+    production_value = FrozenResources({Resource.GOLD: 4})
 
     def buy(self):
         self.register_for_event('extra war food penalty', self.true, self.extra_war_food_penalty)
         self.global_effect = True
 
     def extra_war_food_penalty(self, player, **kwargs):
-        self.match.log(f'[{self}] Defeats cost 4 extra [Food].')
+        self.match.log('[{}] Defeats cost 4 extra [Food].', self)
         return 4
 
 class Montezuma(Age3Advisor):
     """Buy War or Battle: +3 [Books]"""
+    __slots__ = ('prev_card',)
+
     name = 'Montezuma'
     abbr = 'Mtz'
-    production_value = Resources({Resource.FOOD: 2})
+    production_value = FrozenResources({Resource.FOOD: 2})
 
     def buy(self):
         self.prev_card = None
@@ -2549,14 +2570,14 @@ class Montezuma(Age3Advisor):
         return player is self.owner and kwargs['card'].is_war_battle() and not seen
 
     def gain_books(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 3 [Books].')
+        self.match.log('[{}] {} gains 3 [Books].', self, player)
         player.resources[Resource.BOOKS] += 3
 
 class NiccoloMachiavelli(Age3Advisor):
     """Reveal Events: Draw 2 choose 1"""
     name = 'Niccolo Machiavelli'
     abbr = 'NcMc'
-    production_value = Resources({Resource.BOOKS: 4})
+    production_value = FrozenResources({Resource.BOOKS: 4})
 
     def buy(self):
         self.register_for_event('choose event card', self.owned, self.choose_event_card)
@@ -2565,7 +2586,7 @@ class NiccoloMachiavelli(Age3Advisor):
         event_cards = kwargs['events']
         event_card = self.match.get_move(player, 'Which event card?', event_cards)
         discarded_event_card = [card for card in event_cards if card is not event_card][0]
-        self.match.log(f'[{self}] {player} chooses "{event_card}" as the event card for the round, discarding "{discarded_event_card}".')
+        self.match.log('[{}] {} chooses "{}" as the event card for the round, discarding "{}".', self, player, event_card, discarded_event_card)
         self.match.event = event_card
         self.match.get_move(player, 'Confirm?', ('Confirm',))
 
@@ -2575,13 +2596,13 @@ class PeterTheGreat(Age3Advisor):
     abbr = 'PtGr'
 
     def produce(self, projected=False):
-        production = self.production_value.production()
+        production = self.production_value.production().copy()
         if projected:
             return production
         if self.match.war is not None and min(40, self.owner.resources[Resource.MILITARY]) > self.match.war_value:
             options = (Resources({Resource.STONE: 5}), Resources({Resource.GOLD: 5}), Resources({Resource.BOOKS: 5}))
             choice = self.match.get_move(self.owner, 'Produce which extra resources?', options)
-            self.match.log(f'[{self}] {self.owner} produces an extra {choice}.')
+            self.match.log('[{}] {} produces an extra {}.', self, self.owner, choice)
             production += choice
             self.match.get_move(self.owner, 'Confirm?', ('Confirm',))
         return production
@@ -2590,7 +2611,7 @@ class Pocahontas(Age3Advisor):
     """All: Colonies require 4 [Military] extra"""
     name = 'Pocahontas'
     abbr = 'Pch'
-    production_value = Resources({Resource.FOOD: 4})
+    production_value = FrozenResources({Resource.FOOD: 4})
 
     def buy(self):
         self.register_for_event('extra colony military requirement', self.true, self.extra_colony_military_requirement)
@@ -2598,35 +2619,35 @@ class Pocahontas(Age3Advisor):
 
     def extra_colony_military_requirement(self, player, **kwargs):
         if not kwargs.get('check', False):
-            self.match.log(f'[{self}] Colonies require 4 [Military] extra.')
+            self.match.log('[{}] Colonies require 4 [Military] extra.', self)
         return 4
 
 class SuleimanI(Age3Advisor):
     """Action, if most [Military]: Take 1 [Worker]"""
     name = 'Suleiman I'
     abbr = 'Slm'
-    production_value = Resources({Resource.MILITARY: 3})
+    production_value = FrozenResources({Resource.MILITARY: 3})
 
     def action_available(self, player):
         return player is self.owner and player.most_military and player.may_take_workers()
 
     def activate(self, player):
-        self.match.log(f'{player} takes the "{self}" special action.')
+        self.match.log('{} takes the "{}" special action.', player, self)
         player.take_worker()
 
 class Tokugawa(Age3Advisor):
     """Production: +2 [Stone] per Building and Military from current age"""
     name = 'Tokugawa'
     abbr = 'Tkg'
-    production_value = Resources({Resource.MILITARY: 2})
+    production_value = FrozenResources({Resource.MILITARY: 2})
 
     def produce(self, projected=False):
-        production = self.production_value.production()
+        production = self.production_value.production().copy()
         current_age = (self.match.round_number + 1) // 2
         stone = 2 * len([card for card in self.owner.building_military_cards() if card.age == current_age])
         if stone:
             if not projected:
-                self.match.log(f'[{self}] {self.owner} produces an extra {stone} [Stone].')
+                self.match.log('[{}] {} produces an extra {} [Stone].', self, self.owner, stone)
             production[Resource.STONE] += stone
         return production
 
@@ -2637,7 +2658,7 @@ class AbrahamLincoln(Age4Advisor):
     """Action: Take 1 [Worker]"""
     name = 'Abraham Lincoln'
     abbr = 'AhLc'
-    production_value = Resources({Resource.STABILITY: 3})
+    production_value = FrozenResources({Resource.STABILITY: 3})
 
     def action_available(self, player):
         if self.match.lincoln_nerf:
@@ -2646,13 +2667,13 @@ class AbrahamLincoln(Age4Advisor):
             return player is self.owner and player.may_take_workers()
 
     def activate(self, player):
-        self.match.log(f'{player} takes the "{self}" special action.')
+        self.match.log('{} takes the "{}" special action.', player, self)
         if self.match.lincoln_nerf:
             if player.may_take_workers():
                 player.take_worker()
             if player.may_take_workers():
                 player.take_worker()
-            self.match.log(f'{player} removes "{self}".')
+            self.match.log('{} removes "{}".', player, self)
             player.remove(self)
         else:
             player.take_worker()
@@ -2674,11 +2695,11 @@ class AlfredNobel(Age4Advisor):
         raise InvalidMove(f'[{self}] May not buy war.')
 
     def produce(self, projected=False):
-        production = self.production_value.production()
+        production = self.production_value.production().copy()
         stone = 3 * sum(card.deployed_workers for card in self.owner.building_cards() if card.age == 4)
         if stone:
             if not projected:
-                self.match.log(f'[{self}] {self.owner} produces an extra {stone} [Stone].')
+                self.match.log('[{}] {} produces an extra {} [Stone].', self, self.owner, stone)
             production[Resource.STONE] += stone
         return production
 
@@ -2686,13 +2707,13 @@ class BenjaminDisraeli(Age4Advisor):
     """Production: If you bought Colony this round: +8 [Food]"""
     name = 'Benjamin Disraeli'
     abbr = 'BjDr'
-    production_value = Resources({Resource.GOLD: 2})
+    production_value = FrozenResources({Resource.GOLD: 2})
 
     def produce(self, projected=False):
-        production = self.production_value.production()
+        production = self.production_value.production().copy()
         if self.owner.bought_colony_this_round:
             if not projected:
-                self.match.log(f'[{self}] {self.owner} produces an extra 8 [Food].')
+                self.match.log('[{}] {} produces an extra 8 [Food].', self, self.owner)
             production[Resource.FOOD] += 8
         return production
 
@@ -2700,13 +2721,13 @@ class FlorenceNightingale(Age4Advisor):
     """Lack of resources: No [Point] loss"""
     name = 'Florence Nightingale'
     abbr = 'FrNg'
-    production_value = Resources({Resource.BOOKS: 6})
+    production_value = FrozenResources({Resource.BOOKS: 6})
 
     def buy(self):
         self.register_for_event('no resource point loss', self.owned, self.log_effect)
 
     def log_effect(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} is spared the [Point] loss.')
+        self.match.log('[{}] {} is spared the [Point] loss.', self, player)
         return True
 
 class FredericChopin(Age4Advisor):
@@ -2722,7 +2743,7 @@ class FredericChopin(Age4Advisor):
     def double_books(self, player, **kwargs):
         additional_books = kwargs['production'][Resource.BOOKS]
         if not kwargs.get('projected', False):
-            self.match.log(f'[{self}] {player} produces an extra {additional_books} [Books].')
+            self.match.log('[{}] {} produces an extra {} [Books].', self, player, additional_books)
         return Resources({Resource.BOOKS: additional_books})
 
     def not_passed(self, player, **kwargs):
@@ -2735,7 +2756,7 @@ class FredericChopin(Age4Advisor):
         return kwargs['card'] is self
 
     def buy_this_card(self, player, **kwargs):
-        self.match.log(f'{player} pays 5 [Gold] to buy "{self}" from {self.owner}.')
+        self.match.log('{} pays 5 [Gold] to buy "{}" from {}.', player, self, self.owner)
         player.resources[Resource.GOLD] -= 5
         self.owner.remove(self)
         return 5
@@ -2744,7 +2765,7 @@ class FrederickTheGreat(Age4Advisor):
     """Military [Workers] cost 2 [Stone] less to deploy (at least 1 [Stone])"""
     name = 'Frederick the Great'
     abbr = 'FdGr'
-    production_value = Resources({Resource.MILITARY: 2})
+    production_value = FrozenResources({Resource.MILITARY: 2})
 
     def buy(self):
         self.register_for_event('deploy discount', self.military, self.deploy_discount)
@@ -2756,40 +2777,40 @@ class FrederickTheGreat(Age4Advisor):
         cost = kwargs['cost']
         discount = cost - max(1, cost - 2)
         if not kwargs.get('check', False):
-            self.match.log(f'[{self}] {player} pays {discount} [Stone] less to deploy military [Worker].')
+            self.match.log('[{}] {} pays {} [Stone] less to deploy military [Worker].', self, player, discount)
         return discount
 
 class LinZexu(Age4Advisor):
     """Production: If least [Military]: -8 [Books]"""
     name = 'Lin Zexu'
     abbr = 'LnZx'
-    production_value = Resources({Resource.FOOD: 4, Resource.GOLD: 4})
+    production_value = FrozenResources({Resource.FOOD: 4, Resource.GOLD: 4})
 
     def produce(self, projected=False):
-        production = self.production_value.production()
+        production = self.production_value.production().copy()
         if self.owner.least_military:
             if not projected:
-                self.match.log(f'[{self}] {self.owner} produces 8 fewer [Books].')
+                self.match.log('[{}] {} produces 8 fewer [Books].', self, self.owner)
             production[Resource.BOOKS] -= 8
         return production
 
 class MarieAntoinette(Age4Advisor):
     name = 'Marie Antoinette'
     abbr = 'MrAn'
-    production_value = Resources({Resource.BOOKS: 10, Resource.STABILITY: -3})
+    production_value = FrozenResources({Resource.BOOKS: 10, Resource.STABILITY: -3})
 
 class MarieCurie(Age4Advisor):
     """2 private [Architects] per round"""
     name = 'Marie Curie'
     abbr = 'MrCr'
-    production_value = Resources({Resource.STONE: 4})
+    production_value = FrozenResources({Resource.STONE: 4})
     private_architects = 2
 
 class ShakaZulu(Age4Advisor):
     """Others: Buy Colony: +5 [Stone]"""
     name = 'Shaka Zulu'
     abbr = 'SkZl'
-    production_value = Resources({Resource.MILITARY: 8})
+    production_value = FrozenResources({Resource.MILITARY: 8})
 
     def buy(self):
         self.register_for_event('buying card', self.other_buying_colony, self.gain_stone)
@@ -2799,7 +2820,7 @@ class ShakaZulu(Age4Advisor):
         return player is not self.owner and kwargs['card'].is_colony()
 
     def gain_stone(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 5 [Stone].')
+        self.match.log('[{}] {} gains 5 [Stone].', self, player)
         player.resources[Resource.STONE] += 5
 
 class SimonBolivar(Age4Advisor):
@@ -2816,7 +2837,7 @@ class SimonBolivar(Age4Advisor):
             colony = colonies[0]
         else:
             colony = self.match.get_move(player, 'Remove which colony?', colonies)
-        self.match.log(f'[{self}] {player} removes {colony} and gains 4 [Gold] and 4 [Stone].')
+        self.match.log('[{}] {} removes {} and gains 4 [Gold] and 4 [Stone].', self, player, colony)
         player.remove(colony)
         player.resources[Resource.GOLD] += 4
         player.resources[Resource.STONE] += 4
@@ -2874,18 +2895,20 @@ class ArabianNights(Age2GoldenAge):
     offers_special_action = True
 
     def activate(self, player):
-        self.match.log(f'[{self}] {player} chooses the special ability.')
+        self.match.log('[{}] {} chooses the special ability.', self, player)
         self.register_for_event('passed over', self.owned, self.gain_books)
         self.register_for_event('end of round', self.owned, self.remove_effect)
         self.owner.extra_cards.append(self)
+        self.owner.cards_changed()
         self.global_effect = True
 
     def gain_books(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 2 [Books].')
+        self.match.log('[{}] {} gains 2 [Books].', self, player)
         player.resources[Resource.BOOKS] += 2
 
     def remove_effect(self, player, **kwargs):
         self.owner.extra_cards.remove(self)
+        self.owner.cards_changed()
         self.global_effect = False
         self.unregister_all_events()
 
@@ -2954,15 +2977,15 @@ class LeVite(Age3GoldenAge):
     offers_special_action = True
 
     def activate(self, player):
-        self.match.log(f'[{self}] {player} chooses the special ability.')
+        self.match.log('[{}] {} chooses the special ability.', self, player)
         self.register_for_event('hire discount', self.owned, self.hire_discount)
         self.register_for_event('end of round', self.owned, self.remove_effect)
-        self.match.log(f'[{self}] 3 additional [Architects] available.')
+        self.match.log('[{}] 3 additional [Architects] available.', self)
         self.match.architects += 3
 
     def hire_discount(self, player, **kwargs):
         if not kwargs.get('check', False):
-            self.match.log(f'[{self}] {player} pays up to 1 less [Stone] per [Architect] this round.')
+            self.match.log('[{}] {} pays up to 1 less [Stone] per [Architect] this round.', self, player)
         return 1
 
     def remove_effect(self, player, **kwargs):
@@ -3038,16 +3061,16 @@ class UncleTomsCabin(Age4GoldenAge):
     offers_special_action = True
 
     def activate(self, player):
-        self.match.log(f'[{self}] {player} chooses the special ability.')
+        self.match.log('[{}] {} chooses the special ability.', self, player)
         any_buildings_removed = False
         for player in self.match.players[::-1]:
             cards_to_remove = [card for card in player.building_cards() if card.deployment_cost == -1]
             for card in cards_to_remove:
-                self.match.log(f'[{self}] {player} removes "{card}"')
+                self.match.log('[{}] {} removes "{}"', self, player, card)
                 player.remove(card)
                 any_buildings_removed = True
         if not any_buildings_removed:
-            self.match.log(f'[{self}] No buildings were removed.')
+            self.match.log('[{}] No buildings were removed.', self)
 
 class Vaccine(Age4GoldenAge):
     name = 'Vaccine'
@@ -3078,7 +3101,7 @@ class MountArarat(Age1NaturalWonder):
             self.owner.need_confirmation = choice.action_type is not ActionType.CONFIRM_AND_COMPLETE_TURN
         for player in self.match.players[::-1]:
             if player is not self.owner:
-                self.match.log(f'[{self}] {player} loses 3 [Food].')
+                self.match.log('[{}] {} loses 3 [Food].', self, player)
                 player.lose_resources(Resources({Resource.FOOD: -3}))
 
 class MountKailash(Age1NaturalWonder):
@@ -3101,7 +3124,7 @@ class SiwaOasis(Age1NaturalWonder):
         return player is self.owner and kwargs['card'].is_colony()
 
     def gain_books(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} gains 3 [Books].')
+        self.match.log('[{}] {} gains 3 [Books].', self, player)
         player.resources[Resource.BOOKS] += 3
 
 class ThePillarOfHercules(Age1NaturalWonder):
@@ -3112,12 +3135,12 @@ class ThePillarOfHercules(Age1NaturalWonder):
     points = 0
 
     def discovered(self):
-        self.match.log(f'[{self}] {self.owner} gains 7 [Military] until the end of the round.')
+        self.match.log('[{}] {} gains 7 [Military] until the end of the round.', self, self.owner)
         self.owner.resources[Resource.MILITARY] += 7
         self.register_for_event('end of round', self.owned, self.reduce_military)
 
     def reduce_military(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} loses 7 [Military].')
+        self.match.log('[{}] {} loses 7 [Military].', self, player)
         player.resources[Resource.MILITARY] -= 7
         self.unregister_all_events()
 
@@ -3127,13 +3150,13 @@ class Vesuvius(Age1NaturalWonder):
     abbr = 'Vsv'
     exploration_turns = 2
     points = 4
-    production_value = Resources({Resource.FOOD: 1})
+    production_value = FrozenResources({Resource.FOOD: 1})
 
     def discovered(self):
         self.register_for_event('end of age', self.owned, self.return_worker)
 
     def return_worker(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} must return 1 [Worker].')
+        self.match.log('[{}] {} must return 1 [Worker].', self, player)
         player.return_worker()
 
 class Age2NaturalWonder(NaturalWonder):
@@ -3147,7 +3170,7 @@ class AuroraBorealis(Age2NaturalWonder):
     points = 1
 
     def discovered(self):
-        self.match.log(f'[{self}] {self.owner} gains 2 [Gold].')
+        self.match.log('[{}] {} gains 2 [Gold].', self, self.owner)
         self.owner.resources[Resource.GOLD] += 2
 
 class GrandBanks(Age2NaturalWonder):
@@ -3155,7 +3178,7 @@ class GrandBanks(Age2NaturalWonder):
     abbr = 'GrBk'
     exploration_turns = 2
     points = 0
-    production_value = Resources({Resource.FOOD: 2})
+    production_value = FrozenResources({Resource.FOOD: 2})
 
 class Hawaii(Age2NaturalWonder):
     """When discovered: Take 1 [Worker], place [Marker] on population track"""
@@ -3178,7 +3201,7 @@ class Hawaii(Age2NaturalWonder):
         self.owner.take_worker(from_extra=False, update_immediate_production=False)
         for (index, worker_pool) in enumerate(self.owner.worker_pools):
             if worker_pool.ungrown_workers < available_workers[index]:
-                self.match.log(f'[{self}] {self.owner} marks the {worker_pool.resource_cost_per_worker} population track.')
+                self.match.log('[{}] {} marks the {} population track.', self, self.owner, worker_pool.resource_cost_per_worker)
                 worker_pool.mark()
 
 class Sahara(Age2NaturalWonder):
@@ -3192,7 +3215,7 @@ class Sahara(Age2NaturalWonder):
         self.register_for_event('extra war military', self.owned, self.extra_war_military)
 
     def extra_war_military(self, player, **kwargs):
-        self.match.log(f'[{self}] {player} has an extra 4 [Military] against war.')
+        self.match.log('[{}] {} has an extra 4 [Military] against war.', self, player)
         return 4
 
 class Siberia(Age2NaturalWonder):
@@ -3201,7 +3224,7 @@ class Siberia(Age2NaturalWonder):
     abbr = 'Sbr'
     exploration_turns = 2
     points = 2
-    production_value = Resources({Resource.STONE: 2})
+    production_value = FrozenResources({Resource.STONE: 2})
 
     def reset(self):
         super().reset()
@@ -3240,7 +3263,7 @@ class CapeOfGoodHope(Age3NaturalWonder):
 
     def colony_discount(self, player, **kwargs):
         if not kwargs.get('check', False):
-            self.match.log(f'[{self}] {player} requires 4 [Military] less to buy colonies.')
+            self.match.log('[{}] {} requires 4 [Military] less to buy colonies.', self, player)
         return 4
 
 class GrandCanyon(Age3NaturalWonder):
@@ -3253,7 +3276,7 @@ class GrandCanyon(Age3NaturalWonder):
     def bonus_points(self, projected=False):
         bonus = len(self.owner.natural_wonder_cards()) - 1
         if not projected:
-            self.match.log(f'[{self}] {self.owner} gains {bonus} [Point{s_if_not_1(bonus)}] for having {bonus} other natural wonder{s_if_not_1(bonus)}.')
+            self.match.log('[{}] {} gains {} [Point{}] for having {} other natural wonder{}.', self, self.owner, bonus, s_if_not_1(bonus), bonus, s_if_not_1(bonus))
         return bonus
 
 class GreatBarrierReef(Age3NaturalWonder):
@@ -3268,7 +3291,7 @@ class GreatBarrierReef(Age3NaturalWonder):
 
     def activate(self, player):
         self.markers += 1
-        self.match.log(f'[{self}] {player} pays 1 [Point] and gains 5 [Food].')
+        self.match.log('[{}] {} pays 1 [Point] and gains 5 [Food].', self, player)
         player.points -= 1
         player.resources[Resource.FOOD] += 5
 
@@ -3300,17 +3323,14 @@ class SpiceIslands(Age3NaturalWonder):
     points = 0
 
     def discovered(self):
-        self.register_for_event('extra growth resources', self.owned, self.extra_growth_resources)
+        self.register_static_modifier('extra growth resources', 4)
         self.register_for_event('received extra growth resources', self.owned, self.log_extra_growth_resources)
 
-    def extra_growth_resources(self, player, **kwargs):
-        return 4
-
     def log_extra_growth_resources(self, player, **kwargs):
         growth = kwargs['growth']
         for resource_type in (Resource.FOOD, Resource.STONE, Resource.GOLD):
             if growth[resource_type]:
-                self.match.log(f'[{self}] {player} gains an extra 4 {resource_type}.')
+                self.match.log('[{}] {} gains an extra 4 {}.', self, player, resource_type)
                 return
 
 class Age4NaturalWonder(NaturalWonder):
@@ -3347,7 +3367,7 @@ class Titusville(Age4NaturalWonder):
     def extra_scoring_stone(self, player, **kwargs):
         stone = self.owner.resources[Resource.STONE]
         if not kwargs.get('projected', False):
-            self.match.log(f'[{self}] {player} gains {stone} [Stone] for scoring.')
+            self.match.log('[{}] {} gains {} [Stone] for scoring.', self, player, stone)
         return stone
 
 class Uluru(Age4NaturalWonder):
@@ -3359,7 +3379,7 @@ class Uluru(Age4NaturalWonder):
 
     def discovered(self):
         points = len([player for player in self.match.players if player.passed])
-        self.match.log(f'[{self}] {self.owner} gains {points} [Point{s_if_not_1(points)}] for {points} passed player{s_if_not_1(points)}.')
+        self.match.log('[{}] {} gains {} [Point{}] for {} passed player{}.', self, self.owner, points, s_if_not_1(points), points, s_if_not_1(points))
         self.owner.points += points
 
 class VictoriaFalls(Age4NaturalWonder):
@@ -3371,10 +3391,10 @@ class VictoriaFalls(Age4NaturalWonder):
 
     def discovered(self):
         drawn_cards = self.match.draw_cards(20)
-        self.match.log(f'[{self}] Cards drawn:')
+        self.match.log('[{}] Cards drawn:', self)
         colonies_drawn = []
         for card in drawn_cards:
-            self.match.log(f'[{self}] "{card}"')
+            self.match.log('[{}] "{}"', self, card, kind='x_card_drawn')
             if card.is_colony():
                 colonies_drawn.append(card)
         if colonies_drawn:
@@ -3382,7 +3402,7 @@ class VictoriaFalls(Age4NaturalWonder):
             for card in colonies_drawn:
                 self.match.stats.collect(self.match, 'Card Available', card)
         else:
-            self.match.log(f'[{self}] No colonies drawn.')
+            self.match.log('[{}] No colonies drawn.', self)
 
 all_progress_cards = []
 subclasses = [ProgressCard]
@@ -3400,7 +3420,12 @@ def progress_sort_key(card):
 
 all_progress_cards.sort(key=progress_sort_key)
 progress_card_abbrs = {card.abbr: card.name for card in all_progress_cards}
-progress_card_abbrs['AhLc_Nerf'] = 'Abraham Lincoln'
+
+# Defined after the scan above so that it does not replace Abraham Lincoln in the decks.
+class AbrahamLincolnNerf(AbrahamLincoln):
+    abbr = 'AhLc_Nerf'
+
+progress_card_abbrs[AbrahamLincolnNerf.abbr] = AbrahamLincolnNerf.name
 
 all_extension_cards = []
 subclasses = [ExtensionCard]
@@ -0,0 +1,60 @@
+import collections
+import importlib
+
+from .exceptions import *
+from . import card_registry
+
+CardEntry = collections.namedtuple('CardEntry', ('abbr', 'module', 'class_name', 'name', 'age', 'card_type', 'progress_card_type', 'nation'))
+NationEntry = collections.namedtuple('NationEntry', ('name', 'module', 'class_name'))
+
+card_entries = tuple(CardEntry(*card) for card in card_registry.cards)
+nation_entries = tuple(NationEntry(*nation) for nation in card_registry.nations)
+card_entries_by_abbr = {entry.abbr: entry for entry in card_entries}
+card_entries_by_abbr.update({alias: card_entries_by_abbr[abbr] for (alias, abbr) in card_registry.aliases.items()})
+card_entries_by_name = {}
+for entry in card_entries:
+    card_entries_by_name[entry.name] = card_entries_by_name.get(entry.name, ()) + (entry,)
+nation_entries_by_name = {entry.name: entry for entry in nation_entries}
+dynasty_nations = {entry.name: entry.nation for entry in card_entries if entry.card_type == 'DYNASTY'}
+
+def entries(age=None, card_type=None, module=None):
+    return [entry for entry in card_entries if (age is None or entry.age == age) and (card_type is None or entry.card_type == card_type) and (module is None or entry.module == module)]
+
+def load_module(module):
+    return importlib.import_module(f'.{module}', __package__)
+
+def load_class(entry):
+    return getattr(load_module(entry.module), entry.class_name, None)
+
+def stale(entry):
+    return StaleRegistry(f'{entry.module}.{entry.class_name} no longer matches card_registry.py; run python -m nations.build_registry')
+
+def load_card(entry):
+    card = load_class(entry)
+    if card is None or card.abbr != entry.abbr:
+        raise stale(entry)
+    return card
+
+def load_nation(entry):
+    nation = load_class(entry)
+    if nation is None or nation.name != entry.name:
+        raise stale(entry)
+    return nation
+
+def card_class(abbr):
+    return load_card(card_entries_by_abbr[abbr])
+
+def card_classes(age=None, card_type=None, module=None):
+    return [load_card(entry) for entry in entries(age, card_type, module)]
+
+def cards_named(name):
+    return [load_card(entry) for entry in card_entries_by_name.get(name, ())]
+
+def nation_class(name):
+    return load_nation(nation_entries_by_name[name])
+
+def nation_classes():
+    return [load_nation(entry) for entry in nation_entries]
+
+def names():
+    return {abbr: entry.name for (abbr, entry) in card_entries_by_abbr.items()}
@@ -27,71 +27,190 @@ class Resource(enum.Enum):
     def plural(self):
         return f'[{self.name.title()}]'
 
+for (index, resource_type) in enumerate(Resource):
+    resource_type.index = index
+
+production_indexes = tuple(resource_type.index for resource_type in Resource.production())
+immediate_indexes = tuple(resource_type.index for resource_type in Resource.immediate())
+resource_types = tuple(Resource)
+
 class Resources:
+    __slots__ = ('amounts',)
+
     def __init__(self, initial_values={}):
-        self.resources = {resource_type: 0 for resource_type in Resource}
+        if isinstance(initial_values, Resources):
+            self.amounts = list(initial_values.amounts)
+            return
+        self.amounts = [0, 0, 0, 0, 0, 0]
         for resource_type in initial_values:
-            self.resources[resource_type] += initial_values[resource_type]
+            self.amounts[resource_type.index] += initial_values[resource_type]
 
     def __getitem__(self, resource_type):
-        return self.resources[resource_type]
+        return self.amounts[resource_type.index]
 
     def __setitem__(self, resource_type, value):
-        self.resources[resource_type] = value
+        self.amounts[resource_type.index] = value
 
     def __ge__(self, cost):
-        for resource_type in Resource.production():
-            if self.resources[resource_type] < cost.resources[resource_type]:
-                return False
-        return True
+        amounts = self.amounts
+        cost_amounts = cost.amounts
+        return amounts[0] >= cost_amounts[0] and amounts[1] >= cost_amounts[1] and amounts[2] >= cost_amounts[2] and amounts[3] >= cost_amounts[3]
 
     def __iadd__(self, other):
-        for resource_type in Resource:
-            self.resources[resource_type] += other.resources[resource_type]
+        self.add(other)
         return self
 
     def __isub__(self, other):
-        for resource_type in Resource:
-            self.resources[resource_type] -= other.resources[resource_type]
+        self.subtract(other)
         return self
 
     def __neg__(self):
-        return Resources({resource_type: -amount for (resource_type, amount) in self.resources.items()})
+        resources = Resources()
+        resources.amounts = [-amount for amount in self.amounts]
+        return resources
 
     def __rmul__(self, other):
-        return Resources({resource_type: other * amount for (resource_type, amount) in self.resources.items() if amount})
+        resources = Resources()
+        resources.amounts = [other * amount for amount in self.amounts]
+        return resources
 
     def __len__(self):
-        return len([True for amount in self.resources.values() if amount])
+        return 6 - self.amounts.count(0)
 
     def __iter__(self):
-        return (resource for (resource, amount) in self.resources.items() if amount)
+        return (resource_type for (resource_type, amount) in zip(resource_types, self.amounts) if amount)
 
     def __str__(self):
         if not self:
             return 'no resources'
-        return ', '.join(f'{amount} {resource_type.singular() if amount == 1 else resource_type.plural()}' for (resource_type, amount) in self.resources.items() if amount)
+        return ', '.join(f'{amount} {resource_type.singular() if amount == 1 else resource_type.plural()}' for (resource_type, amount) in zip(resource_types, self.amounts) if amount)
 
     def production_str(self):
-        return ', '.join(f'{self.resources[resource_type]} {resource_type if self.resources[resource_type] == 1 else resource_type.plural()}' for resource_type in Resource.production())
+        return ', '.join(f'{self[resource_type]} {resource_type if self[resource_type] == 1 else resource_type.plural()}' for resource_type in Resource.production())
 
     def all_types_str(self):
-        return ', '.join(f'{self.resources[resource_type]} {resource_type if self.resources[resource_type] == 1 else resource_type.plural()}' for resource_type in Resource)
+        return ', '.join(f'{self[resource_type]} {resource_type if self[resource_type] == 1 else resource_type.plural()}' for resource_type in Resource)
+
+    def copy(self):
+        return Resources(self)
+
+    def add(self, other):
+        amounts = self.amounts
+        other_amounts = other.amounts
+        for i in range(6):
+            amounts[i] += other_amounts[i]
+
+    def subtract(self, other):
+        amounts = self.amounts
+        other_amounts = other.amounts
+        for i in range(6):
+            amounts[i] -= other_amounts[i]
+
+    def add_production(self, other):
+        amounts = self.amounts
+        other_amounts = other.amounts
+        for i in production_indexes:
+            amounts[i] += other_amounts[i]
+
+    def keep_production(self):
+        for i in immediate_indexes:
+            self.amounts[i] = 0
+
+    def keep_immediate(self):
+        for i in production_indexes:
+            self.amounts[i] = 0
+
+    def clear(self):
+        self.amounts[:] = (0, 0, 0, 0, 0, 0)
 
     def production(self):
-        return Resources({resource_type: self.resources[resource_type] for resource_type in Resource.production()})
+        resources = Resources(self)
+        resources.keep_production()
+        return resources
 
     def immediate(self):
-        return Resources({resource_type: self.resources[resource_type] for resource_type in Resource.immediate()})
+        resources = Resources(self)
+        resources.keep_immediate()
+        return resources
 
     def positive(self):
-        return Resources({resource_type: amount for (resource_type, amount) in self.resources.items() if amount > 0})
+        resources = Resources()
+        resources.amounts = [max(0, amount) for amount in self.amounts]
+        return resources
 
     def negative(self):
-        return Resources({resource_type: amount for (resource_type, amount) in self.resources.items() if amount < 0})
+        resources = Resources()
+        resources.amounts = [min(0, amount) for amount in self.amounts]
+        return resources
 
     def total(self):
-        return sum(self.production().resources.values()) + min(15, self.resources[Resource.STABILITY]) + min(40, self.resources[Resource.MILITARY])
+        amounts = self.amounts
+        return amounts[0] + amounts[1] + amounts[2] + amounts[3] + min(15, amounts[4]) + min(40, amounts[5])
 
     def state(self):
-        return {str(resource_type): amount for (resource_type, amount) in self.resources.items() if amount}
+        return {str(resource_type): amount for (resource_type, amount) in zip(resource_types, self.amounts) if amount}
+
+class FrozenResources(Resources):
+    __slots__ = ('production_cache', 'immediate_cache', 'positive_cache', 'negative_cache', 'str_cache')
+
+    interned = {}
+
+    def __new__(cls, initial_values={}):
+        amounts = tuple(Resources(initial_values).amounts)
+        resources = cls.interned.get(amounts)
+        if resources is None:
+            resources = object.__new__(cls)
+            resources.amounts = amounts
+            resources.production_cache = None
+            resources.immediate_cache = None
+            resources.positive_cache = None
+            resources.negative_cache = None
+            resources.str_cache = None
+            resources = cls.interned.setdefault(amounts, resources)
+        return resources
+
+    def __init__(self, initial_values={}):
+        pass
+
+    def __reduce__(self):
+        return (FrozenResources, (Resources(self),))
+
+    def modify(self, *args):
+        raise TypeError('FrozenResources cannot be modified; copy() it first.')
+
+    __setitem__ = add = subtract = add_production = keep_production = keep_immediate = clear = modify
+
+    def __iadd__(self, other):
+        resources = Resources(self)
+        resources.add(other)
+        return resources
+
+    def __isub__(self, other):
+        resources = Resources(self)
+        resources.subtract(other)
+        return resources
+
+    def __str__(self):
+        if self.str_cache is None:
+            self.str_cache = super().__str__()
+        return self.str_cache
+
+    def production(self):
+        if self.production_cache is None:
+            self.production_cache = FrozenResources(super().production())
+        return self.production_cache
+
+    def immediate(self):
+        if self.immediate_cache is None:
+            self.immediate_cache = FrozenResources(super().immediate())
+        return self.immediate_cache
+
+    def positive(self):
+        if self.positive_cache is None:
+            self.positive_cache = FrozenResources(super().positive())
+        return self.positive_cache
+
+    def negative(self):
+        if self.negative_cache is None:
+            self.negative_cache = FrozenResources(super().negative())
+        return self.negative_cache
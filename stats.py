@@ -1,5 +1,5 @@
 from .utils import *
-from . import nations
+from . import registry
 
 def stat_name(thing):
     name = thing
@@ -115,10 +115,7 @@ class Stats:
             print(f'    {thing}: {amount * 100:0.1f}%', file=f)
 
     def dynasty_nation(self, dynasty):
-        for nation in nations.all_nations:
-            for card in nation.dynasties:
-                if card.name == dynasty:
-                    return nation.name
+        return registry.dynasty_nations.get(dynasty)
 
     def report_dynasty_percentages(self, player_count, f):
         available_stat_type = 'Nation Drafted'
@@ -16,3 +16,49 @@ def ordinal(number):
 
 def s_if_not_1(value):
     return 's' if value != 1 else ''
+
+class LineSink:
+    def __init__(self, file):
+        self.file = file
+
+    def __call__(self, line):
+        self.file.write(f'{line}\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class HistoryPositions:
+    def __init__(self):
+        self.truncations = [(0, 0)]
+
+    def position(self, length):
+        (position, truncated_length) = self.truncations[-1]
+        return position + length - truncated_length
+
+    def truncate(self, length, truncated_length):
+        if truncated_length < length:
+            self.truncations.append((self.position(length) + 1, truncated_length))
+
+    def offset(self, position, length):
+        if not 0 <= position <= self.position(length):
+            return None
+        offset = None
+        for (truncation_position, truncated_length) in self.truncations:
+            if truncation_position <= position:
+                offset = truncated_length + position - truncation_position
+            elif truncated_length < offset:
+                return None
+        return offset
+
+    def fork(self, length, truncated_length):
+        positions = HistoryPositions()
+        positions.truncations = self.truncations[:]
+        positions.truncate(length, truncated_length)
+        return positions